@@ -0,0 +1,265 @@
+"""
+MetaFlex Cache Backend
+Pluggable cache tier for the sheet snapshot and derived views (KPIs, metrics...).
+
+- LRUCacheBackend: in-process, bounded, the default
+- RedisCacheBackend: shared by every replica. Works with anything speaking the
+  Redis protocol (redis-server, fakeredis, KeyDB...). Enabled by setting
+  METAFLEX_CACHE_URL=redis://host:6379/0 plus METAFLEX_CACHE_SECRET (a random
+  string shared by the replicas)
+
+Keys are versioned (schema version + data version), so a new sheet revision
+never serves stale results and there is nothing to invalidate by hand.
+The LRU keeps the objects themselves (a hit costs nothing, so cached values are
+shared and must be treated as read-only). Only Redis serializes them: pickled,
+zlib-compressed and signed with the shared secret, so a value that did not come
+from a replica is never unpickled.
+Concurrent misses on the same key within a process are computed once
+(e.g. a page asking for a view the post-login prefetch is still building).
+"""
+
+import hashlib
+import hmac
+import os
+import pickle
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from concurrent.futures import Future
+
+# Bump when the shape of cached values changes so old entries are ignored
+CACHE_SCHEMA_VERSION = 1
+KEY_PREFIX = f"metaflex:v{CACHE_SCHEMA_VERSION}"
+
+DEFAULT_TTL_SECONDS = 6 * 60 * 60
+LRU_MAX_ENTRIES = 256
+
+
+class CacheBackend:
+    """Minimal cache interface: get() returns the stored object, or None on a miss"""
+
+    def get(self, key):
+        raise NotImplementedError
+
+    def set(self, key, value, ttl=DEFAULT_TTL_SECONDS):
+        raise NotImplementedError
+
+    def get_counter(self, key):
+        raise NotImplementedError
+
+    def incr(self, key):
+        raise NotImplementedError
+
+
+class LRUCacheBackend(CacheBackend):
+    """Thread-safe in-process LRU with per-entry expiry"""
+
+    def __init__(self, max_entries=LRU_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.counters = {}  # Kept outside the LRU so they are never evicted
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            item = self.entries.get(key)
+            if item is None:
+                return None
+            value, expires_at = item
+            if expires_at is not None and expires_at < time.monotonic():
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl=DEFAULT_TTL_SECONDS):
+        expires_at = time.monotonic() + ttl if ttl else None
+        with self.lock:
+            self.entries[key] = (value, expires_at)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def get_counter(self, key):
+        with self.lock:
+            return self.counters.get(key, 0)
+
+    def incr(self, key):
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + 1
+            return self.counters[key]
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Shared cache over the Redis protocol.
+
+    Args:
+        client: Any object with redis-py's get/set(ex=)/incr API
+                (redis.Redis, fakeredis.FakeRedis, ...)
+        secret: Key (str or bytes) signing every value; replicas must share it
+    """
+
+    def __init__(self, client, secret):
+        if not secret:
+            raise ValueError("RedisCacheBackend needs a signing secret (METAFLEX_CACHE_SECRET)")
+        self.client = client
+        self.secret = secret.encode("utf-8") if isinstance(secret, str) else secret
+
+    @classmethod
+    def from_url(cls, url, secret):
+        import redis  # Optional dependency - only needed when METAFLEX_CACHE_URL is set
+        return cls(redis.Redis.from_url(url), secret)
+
+    def _signature(self, data):
+        return hmac.new(self.secret, data, hashlib.sha256).digest()
+
+    def get(self, key):
+        try:
+            signed = self.client.get(key)
+        except Exception as e:
+            # A cache outage must never take the dashboard down
+            print(f"⚠️ Cache get failed for {key}: {str(e)}")
+            return None
+        if signed is None:
+            return None
+
+        signature, data = signed[:SIGNATURE_BYTES], signed[SIGNATURE_BYTES:]
+        if not hmac.compare_digest(signature, self._signature(data)):
+            print(f"⚠️ Ignoring cache entry {key} with a bad signature")
+            return None
+        try:
+            return loads(data)
+        except Exception as e:
+            print(f"⚠️ Discarding unreadable cache entry {key}: {str(e)}")
+            return None
+
+    def set(self, key, value, ttl=DEFAULT_TTL_SECONDS):
+        try:
+            data = dumps(value)
+            self.client.set(key, self._signature(data) + data, ex=ttl or None)
+        except Exception as e:
+            print(f"⚠️ Cache set failed for {key}: {str(e)}")
+
+    def get_counter(self, key):
+        try:
+            return int(self.client.get(key) or 0)
+        except Exception as e:
+            print(f"⚠️ Cache counter read failed for {key}: {str(e)}")
+            return 0
+
+    def incr(self, key):
+        try:
+            return int(self.client.incr(key))
+        except Exception as e:
+            print(f"⚠️ Cache counter increment failed for {key}: {str(e)}")
+            return None
+
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def get_backend():
+    """Process-wide backend, chosen from METAFLEX_CACHE_URL on first use"""
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            url = os.environ.get("METAFLEX_CACHE_URL", "").strip()
+            secret = os.environ.get("METAFLEX_CACHE_SECRET", "").strip()
+            if url.startswith(("redis://", "rediss://", "unix://")):
+                try:
+                    _backend = RedisCacheBackend.from_url(url, secret)
+                except Exception as e:
+                    print(f"⚠️ Could not connect cache backend {url}: {str(e)} - using in-process LRU")
+                    _backend = LRUCacheBackend()
+            else:
+                _backend = LRUCacheBackend()
+        return _backend
+
+
+def set_backend(backend):
+    """Swap the process-wide backend (e.g. a fakeredis-backed one)"""
+    global _backend
+    with _backend_lock:
+        _backend = backend
+
+
+def versioned_key(namespace, version, params=()):
+    """
+    Build a cache key: metaflex:v<schema>:<namespace>:<data version>:<params digest>
+    """
+    digest = hashlib.blake2b(repr(params).encode("utf-8"), digest_size=8).hexdigest()
+    return f"{KEY_PREFIX}:{namespace}:{version}:{digest}"
+
+
+# Bumped after every successful sheet write. Part of the snapshot's cache
+# version, so no replica serves the pre-write snapshot after a save - even
+# when the Drive revision lags the write or the probe fell back to a time bucket.
+WRITE_GENERATION_KEY = f"{KEY_PREFIX}:write_generation"
+
+
+def write_generation():
+    return get_backend().get_counter(WRITE_GENERATION_KEY)
+
+
+def bump_write_generation():
+    return get_backend().incr(WRITE_GENERATION_KEY)
+
+
+SIGNATURE_BYTES = hashlib.sha256().digest_size
+
+
+def dumps(value):
+    """Compact serialization for Redis: pickle (highest protocol) + fast zlib"""
+    return zlib.compress(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), 1)
+
+
+def loads(data):
+    return pickle.loads(zlib.decompress(data))
+
+
+# {key: Future} for computations in progress in this process
+_inflight = {}
+_inflight_lock = threading.Lock()
+
+
+def cached_view(namespace, version, params, compute, ttl=DEFAULT_TTL_SECONDS):
+    """
+    Return the cached result for (namespace, version, params), computing and
+    storing it on a miss. A version of None disables caching for this call
+    (so does a result of None - it is recomputed every time).
+    If another thread is already computing the same key, wait for its result.
+    """
+    if version is None:
+        return compute()
+
+    backend = get_backend()
+    key = versioned_key(namespace, version, params)
+
+    value = backend.get(key)
+    if value is not None:
+        return value
+
+    with _inflight_lock:
+        pending = _inflight.get(key)
+        if pending is None:
+            pending = _inflight[key] = Future()
+            owner = True
+        else:
+            owner = False
+    if not owner:
+        return pending.result()
+
+    try:
+        value = compute()
+        backend.set(key, value, ttl=ttl)
+        pending.set_result(value)
+        return value
+    except BaseException as e:
+        pending.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
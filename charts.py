@@ -409,19 +409,25 @@ def create_team_completion_donut(open_tasks, working_tasks, done_tasks):
     return fig
 
 
-def create_project_breakdown_chart(df):
+def create_project_breakdown_chart(df, project_counts=None):
     """
     Premium horizontal bar chart with rounded corners and sophisticated styling
+
+    Args:
+        df: Tasks to chart
+        project_counts: Precomputed tasks per project (lower-cased, stripped),
+                        e.g. from the prefetched view cache
     """
     if df.empty or not has_column(df, "Project"):
         st.info("No project data available.")
         return None
 
-    # Get the actual column name (with suffix if it exists)
-    project_col = get_column(df, "Project")
+    if project_counts is None:
+        # Get the actual column name (with suffix if it exists)
+        project_col = get_column(df, "Project")
 
-    # Count tasks by project
-    project_counts = df[project_col].str.lower().str.strip().value_counts()
+        # Count tasks by project
+        project_counts = df[project_col].str.lower().str.strip().value_counts()
 
     if project_counts.empty:
         st.info("No project data to display.")
@@ -1,9 +1,10 @@
 import os
 import streamlit as st
-import streamlit.components.v1 as components
 import pages as pg
-import time
-import base64
+from pages.dashboard_page import replay_sheet_journal, render_journal_conflicts, start_snapshot_publisher
+import static_assets
+from metaflex_nav import metaflex_nav
+from style_registry import begin_styles, use_styles, flush_styles, style_path, GLOBAL_STYLE_MODULES
 import yaml
 import streamlit_authenticator as stauth
 from yaml.loader import SafeLoader
@@ -15,6 +16,9 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
+# Style modules requested by this run (see style_registry)
+begin_styles()
+
 # ============================================
 # HANDLE LOGOUT - MUST BE BEFORE AUTHENTICATOR.LOGIN()
 # ============================================
@@ -40,6 +44,9 @@ config_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "config.y
 with open(config_path) as file:
     config = yaml.load(file, Loader=SafeLoader)
 
+# Multi-replica deployments: the designated fetcher process keeps the shared snapshot fresh
+start_snapshot_publisher()
+
 # Initialize authenticator
 authenticator = stauth.Authenticate(
     config["credentials"],
@@ -50,10 +57,9 @@ authenticator = stauth.Authenticate(
 
 # MetaFlex styled login page
 if st.session_state.get("authentication_status") is None:
-    # Load logo for the X
+    # Logo for the X - served as a hashed static file (see static_assets.image_url)
     logo_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "logo.png")
-    with open(logo_path, "rb") as f:
-        logo_data = base64.b64encode(f.read()).decode()
+    logo_url = static_assets.image_url(logo_path)
 
     # Massive METAFLE[X] OPERATIONS header at top
     st.markdown(f"""
@@ -74,7 +80,7 @@ if st.session_state.get("authentication_status") is None:
                     -webkit-text-fill-color: transparent;
                     background-clip: text;
                 ">METAFLE</span><img
-                    src="data:image/png;base64,{logo_data}"
+                    src="{logo_url}"
                     style="
                         height: 48px;
                         width: 48px;
@@ -102,317 +108,7 @@ if st.session_state.get("authentication_status") is None:
         </div>
     """, unsafe_allow_html=True)
 
-    st.markdown("""
-        <style>
-        /* Login page background - Super soft grey */
-        .main, section.main, [data-testid="stAppViewContainer"] {
-            background: #f7f8f9 !important;
-            position: relative !important;
-            min-height: 100vh !important;
-        }
-
-        /* Center everything with ULTRA massive side space */
-        .main .block-container {
-            max-width: 100% !important;
-            padding-top: 8rem !important;
-            padding-left: 0 !important;
-            padding-right: 0 !important;
-            margin: 0 auto !important;
-            position: relative !important;
-            z-index: 1 !important;
-        }
-
-        /* Center the form container */
-        .main .block-container > div:first-child {
-            display: flex !important;
-            justify-content: center !important;
-            align-items: flex-start !important;
-            width: 100% !important;
-        }
-
-        /* Login box with green gradient background and border - CENTERED */
-        section[data-testid="stForm"] {
-            background: linear-gradient(135deg,
-                #f8fdf5 0%,
-                #f0f9ec 25%,
-                #e5f3df 50%,
-                #d8ecce 75%,
-                #cce5bd 100%) !important;
-            backdrop-filter: blur(20px) !important;
-            -webkit-backdrop-filter: blur(20px) !important;
-            border-radius: 24px !important;
-            padding: 48px 40px !important;
-            box-shadow:
-                0 8px 32px rgba(10, 75, 75, 0.12),
-                0 4px 16px rgba(0, 0, 0, 0.08) !important;
-            border: 3px solid transparent !important;
-            border-image: linear-gradient(135deg, #4d7a40 0%, #0a4b4b 100%) 1 !important;
-            position: relative !important;
-            margin: 0 auto !important;
-            width: 100% !important;
-            max-width: 600px !important;
-        }
-
-        /* Force the form's parent containers to be narrow */
-        section[data-testid="stForm"] > div,
-        section[data-testid="stForm"] form {
-            max-width: 100% !important;
-        }
-
-        /* Input fields - Override all Streamlit defaults */
-        input,
-        input[type="text"],
-        input[type="password"],
-        section[data-testid="stForm"] input,
-        input[aria-invalid="false"],
-        input[aria-invalid="true"],
-        .st-ba.st-bb.st-bc.st-bd.st-be.st-bf.st-bg.st-bh.st-bi.st-bj input,
-        div[data-baseweb="base-input"] input {
-            border-radius: 14px !important;
-            border: 2px solid #4d7a40 !important;
-            border-color: #4d7a40 !important;
-            border-style: solid !important;
-            padding: 18px 24px !important;
-            font-size: 15px !important;
-            background: #ffffff !important;
-            caret-color: #4d7a40 !important;
-            outline: none !important;
-            box-shadow: none !important;
-        }
-
-        input:focus,
-        input[type="text"]:focus,
-        input[type="password"]:focus,
-        section[data-testid="stForm"] input:focus,
-        input:focus-visible,
-        input[type="text"]:focus-visible,
-        input[type="password"]:focus-visible,
-        input[aria-invalid="false"]:focus,
-        input[aria-invalid="true"]:focus,
-        .st-ba.st-bb.st-bc.st-bd.st-be.st-bf.st-bg.st-bh.st-bi.st-bj input:focus,
-        div[data-baseweb="base-input"] input:focus {
-            border: 2px solid #d4ff00 !important;
-            border-color: #d4ff00 !important;
-            border-style: solid !important;
-            box-shadow: 0 0 0 4px rgba(212, 255, 0, 0.2) !important;
-            outline: none !important;
-            caret-color: #4d7a40 !important;
-        }
-
-        /* Remove any red error styling from Streamlit */
-        input[aria-invalid="true"],
-        input[aria-invalid="false"] {
-            border: 2px solid #4d7a40 !important;
-            border-color: #4d7a40 !important;
-        }
-
-        input[aria-invalid="true"]:focus,
-        input[aria-invalid="false"]:focus {
-            border: 2px solid #d4ff00 !important;
-            border-color: #d4ff00 !important;
-            box-shadow: 0 0 0 4px rgba(212, 255, 0, 0.2) !important;
-        }
-
-        /* Target Streamlit's baseweb input wrapper */
-        div[data-baseweb="base-input"],
-        div[data-baseweb="input"] {
-            border: none !important;
-            box-shadow: none !important;
-        }
-
-        /* Override any Streamlit emotion cache classes */
-        [class*="st-emotion-cache"] input,
-        [class*="st-ba"] input {
-            border: 2px solid #4d7a40 !important;
-            border-color: #4d7a40 !important;
-        }
-
-        [class*="st-emotion-cache"] input:focus,
-        [class*="st-ba"] input:focus {
-            border: 2px solid #d4ff00 !important;
-            border-color: #d4ff00 !important;
-            box-shadow: 0 0 0 4px rgba(212, 255, 0, 0.2) !important;
-        }
-
-        /* Center the submit button container - ULTRA AGGRESSIVE */
-        section[data-testid="stForm"] [data-testid="stFormSubmitButton"],
-        section[data-testid="stForm"] div[data-testid="stFormSubmitButton"],
-        [data-testid="stFormSubmitButton"],
-        div[data-testid="stFormSubmitButton"],
-        .stFormSubmitButton,
-        section[data-testid="stForm"] > div:last-child {
-            display: flex !important;
-            justify-content: center !important;
-            align-items: center !important;
-            width: 100% !important;
-            text-align: center !important;
-        }
-
-        /* Login button - dark MetaFlex green gradient with white text - ULTRA AGGRESSIVE */
-        button[kind="primary"],
-        section[data-testid="stForm"] button[type="submit"],
-        section[data-testid="stForm"] button,
-        form button,
-        form button[type="submit"],
-        [data-testid="stForm"] button,
-        [data-testid="stFormSubmitButton"] button,
-        div[data-testid="stFormSubmitButton"] > button,
-        [class*="stFormSubmitButton"] button {
-            background: linear-gradient(135deg, #4d7a40 0%, #0a4b4b 100%) !important;
-            background-color: #4d7a40 !important;
-            background-image: linear-gradient(135deg, #4d7a40 0%, #0a4b4b 100%) !important;
-            color: #ffffff !important;
-            border: none !important;
-            border-color: transparent !important;
-            border-width: 0 !important;
-            border-style: none !important;
-            border-radius: 14px !important;
-            padding: 16px 32px !important;
-            font-weight: 700 !important;
-            font-size: 15px !important;
-            width: auto !important;
-            min-width: 200px !important;
-            max-width: 300px !important;
-            display: inline-block !important;
-            margin: 0 !important;
-            transition: all 0.2s ease !important;
-            box-shadow: 0 2px 8px rgba(10, 75, 75, 0.3) !important;
-            outline: none !important;
-        }
-
-        /* Force white text on button and all nested elements - UPPERCASE */
-        section[data-testid="stForm"] button,
-        section[data-testid="stForm"] button *,
-        section[data-testid="stForm"] button p,
-        section[data-testid="stForm"] button div,
-        [data-testid="stFormSubmitButton"] button,
-        [data-testid="stFormSubmitButton"] button * {
-            color: #ffffff !important;
-            text-transform: uppercase !important;
-            font-size: 13px !important;
-            letter-spacing: 0.1em !important;
-            font-weight: 700 !important;
-        }
-
-        /* Hover state - slightly lighter */
-        button[kind="primary"]:hover,
-        section[data-testid="stForm"] button:hover,
-        form button:hover,
-        [data-testid="stFormSubmitButton"] button:hover {
-            background: linear-gradient(135deg, #5a8a4d 0%, #0d5757 100%) !important;
-            background-image: linear-gradient(135deg, #5a8a4d 0%, #0d5757 100%) !important;
-            transform: translateY(-1px) !important;
-            box-shadow: 0 4px 12px rgba(10, 75, 75, 0.4) !important;
-            border: none !important;
-        }
-
-        /* Active/Clicked state - neon green with dark green text */
-        button[kind="primary"]:active,
-        section[data-testid="stForm"] button:active,
-        section[data-testid="stForm"] button[type="submit"]:active,
-        form button:active,
-        [data-testid="stFormSubmitButton"] button:active {
-            background: linear-gradient(135deg, #d4ff00 0%, #c8ff00 100%) !important;
-            background-image: linear-gradient(135deg, #d4ff00 0%, #c8ff00 100%) !important;
-            color: #0a4b4b !important;
-            transform: translateY(0) !important;
-            box-shadow: 0 0 0 4px rgba(212, 255, 0, 0.3) !important;
-            border: none !important;
-        }
-
-        /* Force dark green text when active */
-        section[data-testid="stForm"] button:active,
-        section[data-testid="stForm"] button:active *,
-        [data-testid="stFormSubmitButton"] button:active,
-        [data-testid="stFormSubmitButton"] button:active * {
-            color: #0a4b4b !important;
-        }
-
-        /* Password field container - needs relative positioning */
-        div[data-baseweb="input"],
-        div[data-baseweb="base-input"] {
-            position: relative !important;
-        }
-
-        /* Password visibility toggle button - make it smaller and styled */
-        button[kind="icon"],
-        button[kind="iconButton"],
-        div[data-baseweb="input"] button,
-        section[data-testid="stForm"] button[kind="icon"],
-        [data-testid="stForm"] button[kind="icon"] {
-            background: transparent !important;
-            background-color: transparent !important;
-            background-image: none !important;
-            border: none !important;
-            border-radius: 8px !important;
-            padding: 6px !important;
-            width: 36px !important;
-            min-width: 36px !important;
-            max-width: 36px !important;
-            height: 36px !important;
-            display: inline-flex !important;
-            align-items: center !important;
-            justify-content: center !important;
-            margin: 0 !important;
-            box-shadow: none !important;
-            color: #4d7a40 !important;
-            position: absolute !important;
-            right: 8px !important;
-            top: 50% !important;
-            transform: translateY(-50%) !important;
-            z-index: 10 !important;
-        }
-
-        button[kind="icon"]:hover,
-        button[kind="iconButton"]:hover,
-        section[data-testid="stForm"] button[kind="icon"]:hover {
-            background: rgba(77, 122, 64, 0.1) !important;
-            color: #0a4b4b !important;
-            transform: translateY(-50%) scale(1.1) !important;
-        }
-
-        /* Ensure password input has padding for the button */
-        input[type="password"] {
-            padding-right: 50px !important;
-        }
-
-        /* Labels - Dark green */
-        label,
-        section[data-testid="stForm"] label,
-        .stTextInput label,
-        div[class*="stText"] label {
-            color: #0a4b4b !important;
-            font-weight: 600 !important;
-            font-size: 14px !important;
-            margin-bottom: 8px !important;
-        }
-
-        /* Form title "Login" - Dark green - centered - multiple selectors */
-        section[data-testid="stForm"] h1,
-        section[data-testid="stForm"] h2,
-        .stForm h1,
-        form h1 {
-            color: #0a4b4b !important;
-            font-weight: 700 !important;
-            font-size: 32px !important;
-            text-align: center !important;
-            width: 100% !important;
-        }
-
-        /* Copyright footer at bottom */
-        .copyright-footer {
-            position: fixed;
-            bottom: 16px;
-            left: 0;
-            right: 0;
-            text-align: center;
-            font-size: 11px;
-            color: #6b7878;
-            font-weight: 500;
-            z-index: 999;
-        }
-        </style>
-    """, unsafe_allow_html=True)
+    use_styles("login")
 
     # Copyright footer
     st.markdown("""
@@ -429,175 +125,20 @@ if st.session_state.get("authentication_status") is None:
         st.error("❌ Username or password is incorrect")
 
     # Stop execution - don't show the app
+    flush_styles()
     st.stop()
 
 # If authenticated, continue with the app
-# ============================================
-# GLOBAL STYLE STANDARDIZATION
-# ============================================
-st.markdown("""
-    <style>
-    /* COMPREHENSIVE FONT & SIZE STANDARDIZATION - MetaFlex Design System */
-
-    /* Base font size for entire app */
-    html, body, [class*="st-"] {
-        font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", Arial, sans-serif !important;
-        font-size: 16px !important;
-    }
-
-    /* Page headers (H1) - Welcome back, Téa */
-    h1, .stMarkdown h1 {
-        font-size: 2rem !important;
-        font-weight: 700 !important;
-        line-height: 1.2 !important;
-    }
-
-    /* Section headers (H2) - Executive Overview - Left aligned */
-    h2, .stMarkdown h2 {
-        font-size: 1.75rem !important;
-        font-weight: 700 !important;
-        line-height: 1.2 !important;
-        color: #0a4b4b !important;
-        text-align: left !important;
-        margin: 24px 0 16px 0 !important;
-    }
-
-    /* Subsection headers (H3) */
-    h3, .stMarkdown h3 {
-        font-size: 1.2rem !important;
-        font-weight: 600 !important;
-        line-height: 1.4 !important;
-    }
-
-    /* Body text, paragraphs */
-    p, .stMarkdown p, div, span {
-        font-size: 0.95rem !important;
-        line-height: 1.6 !important;
-    }
-
-    /* ALL BUTTONS - Consistent sizing */
-    button, .stButton button {
-        font-size: 0.9rem !important;
-        font-weight: 500 !important;
-        padding: 8px 16px !important;
-    }
-
-    /* ALL PRIMARY BUTTONS - Subtle MetaFlex Teal */
-    button[kind="primary"],
-    button[data-testid="baseButton-primary"],
-    .stButton > button[kind="primary"],
-    div[data-testid="stButton"] > button[type="submit"] {
-        background: #0a4b4b !important;
-        background-color: #0a4b4b !important;
-        border: none !important;
-        color: #ffffff !important;
-        font-weight: 500 !important;
-        padding: 10px 24px !important;
-        border-radius: 8px !important;
-        box-shadow: 0 1px 3px rgba(10, 75, 75, 0.15) !important;
-        transition: all 0.3s ease !important;
-    }
-
-    button[kind="primary"]:hover,
-    button[data-testid="baseButton-primary"]:hover,
-    .stButton > button[kind="primary"]:hover,
-    div[data-testid="stButton"] > button[type="submit"]:hover {
-        background: #0d6868 !important;
-        box-shadow: 0 2px 6px rgba(10, 75, 75, 0.2) !important;
-        transform: translateY(-1px) !important;
-    }
-
-    /* Fix hamburger menu - remove baby blue, make it teal */
-    button[data-testid*="baseButton-header"] {
-        background: white !important;
-        border: 1.5px solid #0a4b4b !important;
-        color: #0a4b4b !important;
-        font-size: 0.9rem !important;
-        padding: 8px 16px !important;
-    }
-
-    button[data-testid*="baseButton-header"]:hover {
-        background: #f0f9f9 !important;
-        border-color: #0a4b4b !important;
-    }
-
-    /* Navigation buttons inside popover - FORCE consistent styling */
-    div[data-testid="stPopover"] button,
-    .stPopover button {
-        font-size: 0.9rem !important;
-        font-weight: 500 !important;
-        padding: 10px 16px !important;
-        margin: 4px 0 !important;
-    }
-
-    /* Remove ALL baby blue/light blue colors */
-    [data-baseweb="popover"] {
-        background: white !important;
-    }
-
-    /* Metric labels */
-    [data-testid="stMetricLabel"] {
-        font-size: 0.75rem !important;
-        font-weight: 600 !important;
-        text-transform: uppercase !important;
-        letter-spacing: 0.05em !important;
-    }
-
-    /* Metric values */
-    [data-testid="stMetricValue"] {
-        font-size: 2rem !important;
-        font-weight: 700 !important;
-    }
-
-    /* Dataframe/table text */
-    .dataframe, table {
-        font-size: 0.85rem !important;
-    }
-
-    /* Input fields */
-    input, textarea, select {
-        font-size: 0.9rem !important;
-    }
-
-    /* Zen Minimal Scrollbars */
-    ::-webkit-scrollbar {
-        width: 6px;
-        height: 6px;
-    }
-
-    ::-webkit-scrollbar-track {
-        background: transparent;
-    }
-
-    ::-webkit-scrollbar-thumb {
-        background: #e8eaed;
-        border-radius: 3px;
-        transition: background 0.3s ease;
-    }
-
-    ::-webkit-scrollbar-thumb:hover {
-        background: #cbd5e0;
-    }
-
-    /* Firefox scrollbar styling */
-    * {
-        scrollbar-width: thin;
-        scrollbar-color: #e8eaed transparent;
-    }
-    </style>
-""", unsafe_allow_html=True)
-
 # ============================================
 # INITIALIZE SESSION STATE
 # ============================================
 if 'current_page' not in st.session_state:
-    st.session_state.current_page = "Overview"
+    # Restore the page from the URL (?page=My+Tasks) after a refresh or a shared link
+    st.session_state.current_page = st.query_params.get("page", "Overview")
 
 # ============================================
 # NAVIGATION BAR
 # ============================================
-logo_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "logo.png")
-
 # Get the logged-in user's name
 user_name = st.session_state.get("name", "")
 user_email = st.session_state.get("username", "")
@@ -614,11 +155,32 @@ elif is_jess:
 else:
     # Regular users only see Overview, My Tasks, Archive, and Logout
     pages_list = ["Overview", "My Tasks", "Archive", "Logout"]
+nav_pages = [page for page in pages_list if page != "Logout"]
+
+# Pages from the URL are only honoured if this user may see them
+if st.session_state.current_page not in nav_pages:
+    st.session_state.current_page = "Overview"
 
-# Load logo for branding
+# Keep the current page in the URL (only written when it changes)
+if st.query_params.get("page") != st.session_state.current_page:
+    st.query_params["page"] = st.session_state.current_page
+
+
+def handle_navigation():
+    """
+    metaflex_nav on_change callback - runs before the rerun the click triggers,
+    so the new page (or the logout handled at the top) renders in that one run
+    """
+    event = st.session_state.get("metaflex_nav") or {}
+    if event.get("action") == "logout":
+        st.session_state['_logout_requested'] = True
+    elif event.get("page") in nav_pages:
+        st.session_state.current_page = event["page"]
+        st.query_params["page"] = event["page"]
+
+# Load logo for branding (hashed static URL, encoded once per process)
 logo_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "logo.png")
-with open(logo_path, "rb") as f:
-    logo_data = base64.b64encode(f.read()).decode()
+logo_url = static_assets.image_url(logo_path)
 
 nav_container = st.container()
 
@@ -637,7 +199,7 @@ with nav_container:
                 align-items: center;
                 gap: 8px;
             ">
-                <img src="data:image/png;base64,{logo_data}" style="
+                <img src="{logo_url}" style="
                     width: 48px;
                     height: 48px;
                     image-rendering: -webkit-optimize-contrast;
@@ -655,163 +217,10 @@ with nav_container:
             </div>
         """, unsafe_allow_html=True)
 
-    # Hamburger menu on the right
+    # Hamburger menu on the right - a mounted component (metaflex_nav/frontend)
+    # that reports clicks through handle_navigation instead of st.button + st.rerun
     with cols[1]:
-        # Hamburger menu button styling - completely remove all borders and outlines
-        st.markdown(f"""
-            <style>
-            /* Hamburger menu button - clean text only, no outline ever */
-            button[data-testid*="baseButton-header"],
-            button[data-testid*="baseButton-header"]:focus,
-            button[data-testid*="baseButton-header"]:active,
-            button[data-testid*="baseButton-header"]:focus-visible {{
-                background: transparent !important;
-                border: 2px solid #0a4b4b !important;
-                border-radius: 8px !important;
-                outline: none !important;
-                outline-width: 0 !important;
-                outline-style: none !important;
-                outline-color: transparent !important;
-                padding: 10px 16px !important;
-                width: 56px !important;
-                height: 56px !important;
-                box-shadow: none !important;
-                transition: all 0.3s ease !important;
-                cursor: pointer !important;
-                font-size: 1.75rem !important;
-                color: #7a9900 !important;
-                display: flex !important;
-                align-items: center !important;
-                justify-content: center !important;
-            }}
-
-            button[data-testid*="baseButton-header"]:hover {{
-                background: rgba(122, 153, 0, 0.08) !important;
-                color: #a8d900 !important;
-                border: 2px solid #7a9900 !important;
-                outline: none !important;
-                box-shadow: 0 2px 8px rgba(122, 153, 0, 0.25) !important;
-                transform: translateY(-2px) !important;
-            }}
-
-            /* Also target the div container - position to left edge */
-            div[data-testid="stPopover"],
-            div[data-testid="stPopover"] > button {{
-                outline: none !important;
-                border: 2px solid #0a4b4b !important;
-                border-radius: 8px !important;
-                width: 56px !important;
-                min-width: 56px !important;
-                max-width: 56px !important;
-                height: 56px !important;
-                min-height: 56px !important;
-                max-height: 56px !important;
-                padding: 0 !important;
-                margin: 0 !important;
-                margin-right: auto !important;
-                display: flex !important;
-                align-items: center !important;
-                justify-content: center !important;
-                overflow: hidden !important;
-                flex-shrink: 0 !important;
-            }}
-
-            div[data-testid="stPopover"] > button:focus {{
-                outline: none !important;
-                border: 2px solid #0a4b4b !important;
-                box-shadow: none !important;
-            }}
-
-            div[data-testid="stPopover"] > button:hover {{
-                border: 2px solid #0d6868 !important;
-                box-shadow: 0 2px 8px rgba(10, 75, 75, 0.2) !important;
-                transform: translateY(-2px) !important;
-            }}
-
-            /* Make popover larger */
-            div[data-testid="stPopover"] > div {{
-                min-width: 300px !important;
-            }}
-
-            /* Standardize navigation button styling - ULTRA AGGRESSIVE override */
-            /* Primary button (current page) - teal with white text */
-            div[data-testid="stPopover"] button[kind="primary"],
-            div[data-testid="stPopover"] button[type="submit"],
-            .stPopover button[kind="primary"],
-            .stPopover button[type="submit"] {{
-                background: linear-gradient(135deg, #0a4b4b 0%, #0d6868 100%) !important;
-                background-color: #0a4b4b !important;
-                background-image: linear-gradient(135deg, #0a4b4b 0%, #0d6868 100%) !important;
-                color: white !important;
-                border: none !important;
-                border-color: transparent !important;
-                font-weight: 600 !important;
-                padding: 12px 20px !important;
-                border-radius: 8px !important;
-                transition: all 0.2s ease !important;
-            }}
-
-            div[data-testid="stPopover"] button[kind="primary"]:hover,
-            div[data-testid="stPopover"] button[type="submit"]:hover,
-            .stPopover button[kind="primary"]:hover,
-            .stPopover button[type="submit"]:hover {{
-                background: linear-gradient(135deg, #0d6868 0%, #106a6a 100%) !important;
-                background-color: #0d6868 !important;
-                background-image: linear-gradient(135deg, #0d6868 0%, #106a6a 100%) !important;
-                transform: translateY(-1px) !important;
-                box-shadow: 0 2px 8px rgba(10, 75, 75, 0.2) !important;
-            }}
-
-            /* Secondary button (other pages) - soft grey with dark teal border and text */
-            div[data-testid="stPopover"] button[kind="secondary"],
-            .stPopover button[kind="secondary"],
-            div[data-testid="stPopover"] button:not([kind="primary"]):not([type="submit"]),
-            .stPopover button:not([kind="primary"]):not([type="submit"]) {{
-                background: #f5f7f8 !important;
-                background-color: #f5f7f8 !important;
-                background-image: none !important;
-                color: #0a4b4b !important;
-                border: 1.5px solid #0a4b4b !important;
-                border-color: #0a4b4b !important;
-                font-weight: 500 !important;
-                padding: 12px 20px !important;
-                border-radius: 10px !important;
-                transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1) !important;
-                box-shadow: 0 1px 3px rgba(10, 75, 75, 0.08) !important;
-            }}
-
-            div[data-testid="stPopover"] button[kind="secondary"]:hover,
-            .stPopover button[kind="secondary"]:hover,
-            div[data-testid="stPopover"] button:not([kind="primary"]):not([type="submit"]):hover,
-            .stPopover button:not([kind="primary"]):not([type="submit"]):hover {{
-                background: #ffffff !important;
-                background-color: #ffffff !important;
-                border-color: #0a4b4b !important;
-                border-width: 1.5px !important;
-                color: #0a4b4b !important;
-                transform: translateY(-2px) !important;
-                box-shadow: 0 3px 10px rgba(10, 75, 75, 0.15) !important;
-            }}
-            </style>
-        """, unsafe_allow_html=True)
-
-        # Hamburger menu popover
-        with st.popover("☰"):
-                for page_name in pages_list:
-                    if page_name == "Logout":
-                        st.markdown("---")  # Separator before logout
-                        if st.button("Logout", key="nav_logout", use_container_width=True):
-                            # Set a flag to trigger logout
-                            st.session_state['_logout_requested'] = True
-                            st.rerun()
-                    else:
-                        # Navigation button
-                        is_current = st.session_state.current_page == page_name
-                        button_label = f"{'✓ ' if is_current else ''}{page_name}"
-
-                        if st.button(button_label, key=f"nav_{page_name}", use_container_width=True, type="primary" if is_current else "secondary"):
-                            st.session_state.current_page = page_name
-                            st.rerun()
+        metaflex_nav(nav_pages, st.session_state.current_page, key="metaflex_nav", on_change=handle_navigation)
 
 # Vibrant lime green accent bar under navigation - MetaFlex personality
 st.markdown("""
@@ -832,30 +241,6 @@ st.markdown("""
     '></div>
 """, unsafe_allow_html=True)
 
-# Logo styling for navigation bar
-st.markdown("""
-<style>
-.st-emotion-cache-iun7dp {
-    padding: 0rem 0px 0.0rem 0.0rem !important;
-    position: absolute !important;
-    top: -3rem !important;
-    right: 0px !important;
-    transition: none !important;
-    opacity: 0 !important;
-}
-
-.st-emotion-cache-7czcpc > img {
-    border-radius: 0.0rem !important;
-    width: 300% !important;
-    max-width: 300% !important;
-}
-
-img, svg {
-    border-radius: 0 !important;
-}
-</style>
-""", unsafe_allow_html=True)
-
 # JavaScript to forcefully fix logo height, make nav sticky, AND force button styling
 st.markdown("""
 <script>
@@ -993,90 +378,6 @@ console.log('✅ Run window.applyMetaFlexStyling() in console to manually apply
 # Remove spacing - MetaFlex Operations sits right against gradient bar
 st.markdown("<div style='margin-bottom: 20px;'></div>", unsafe_allow_html=True)
 
-# ULTRA AGGRESSIVE NAVIGATION BUTTON OVERRIDE - LOAD LAST
-st.markdown("""
-<style>
-/* PREMIUM LIGHT THEME NAVIGATION CONTAINER - Clean white with subtle gradient accent - STICKY */
-html body [data-testid="stVerticalBlock"] > [data-testid="stHorizontalBlock"]:first-child {
-    background: #ffffff !important;
-    box-shadow: 0 1px 3px rgba(0, 0, 0, 0.1), 0 1px 2px rgba(0, 0, 0, 0.06) !important;
-    border-bottom: 3px solid #0a4b4b !important;
-    padding: 16px 48px !important;
-    position: sticky !important;
-    top: 0 !important;
-    z-index: 999 !important;
-}
-
-html body [data-testid="stVerticalBlock"] > [data-testid="stHorizontalBlock"]:first-child::after {
-    content: '' !important;
-    position: absolute !important;
-    bottom: -3px !important;
-    left: 0 !important;
-    right: 0 !important;
-    height: 3px !important;
-    background: linear-gradient(90deg, #0a4b4b 0%, #4d7a40 50%, #7a9900 100%) !important;
-}
-
-/* FINAL NUCLEAR OVERRIDE FOR NAVIGATION BUTTONS */
-html body [data-testid="stVerticalBlock"] > [data-testid="stHorizontalBlock"]:first-child button,
-html body [data-testid="stVerticalBlock"] > [data-testid="stHorizontalBlock"]:first-child button[kind="secondary"],
-html body [data-testid="stVerticalBlock"] > [data-testid="stHorizontalBlock"]:first-child button[kind="primary"],
-html body [data-testid="stVerticalBlock"] > [data-testid="stHorizontalBlock"]:first-child [class*="st-emotion"] button,
-html body div[data-testid="column"] button {
-    background: transparent !important;
-    background-color: transparent !important;
-    background-image: none !important;
-    border: none !important;
-    border-top: none !important;
-    border-left: none !important;
-    border-right: none !important;
-    border-bottom: 3px solid transparent !important;
-    box-shadow: none !important;
-    outline: none !important;
-    border-radius: 0px !important;
-    padding: 12px 24px 9px 24px !important;
-    font-size: 12px !important;
-    font-weight: 600 !important;
-    text-transform: uppercase !important;
-    letter-spacing: 0.05em !important;
-    color: #e8f5e9 !important;
-    font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif !important;
-    transition: all 0.2s ease !important;
-    transform: translateY(0) !important;
-    opacity: 0.8;
-}
-
-/* Force uppercase on all text inside buttons */
-html body [data-testid="stVerticalBlock"] > [data-testid="stHorizontalBlock"]:first-child button *,
-html body div[data-testid="column"] button * {
-    text-transform: uppercase !important;
-    color: #e8f5e9 !important;
-}
-
-/* Hover - DARK THEME */
-html body [data-testid="stVerticalBlock"] > [data-testid="stHorizontalBlock"]:first-child button:hover,
-html body div[data-testid="column"] button:hover {
-    background: rgba(212, 255, 0, 0.1) !important;
-    transform: translateY(-2px) !important;
-    border-bottom: 3px solid transparent !important;
-    color: #d4ff00 !important;
-    opacity: 1 !important;
-}
-
-/* Active button - DARK THEME */
-html body [data-testid="stVerticalBlock"] > [data-testid="stHorizontalBlock"]:first-child button[kind="primary"] {
-    background: linear-gradient(135deg, #2d5016, #3a6520) !important;
-    color: #d4ff00 !important;
-    border-bottom: 3px solid #d4ff00 !important;
-    opacity: 1 !important;
-}
-
-html body [data-testid="stVerticalBlock"] > [data-testid="stHorizontalBlock"]:first-child button[kind="primary"] * {
-    color: #d4ff00 !important;
-}
-</style>
-""", unsafe_allow_html=True)
-
 # ============================================
 # GET CURRENT DIRECTORY
 # ============================================
@@ -1086,40 +387,36 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 # LOAD METAFLEX BRAND DNA (CSS + JS)
 # ============================================
 
-def inject_css(path):
-    """Embed CSS into Streamlit app with aggressive cache busting."""
-    if os.path.exists(path):
-        with open(path) as f:
-            css = f.read()
-            # Add timestamp for cache busting
-            cache_buster = int(time.time() * 1000)  # Millisecond precision
-            st.markdown(f'<style id="metaflex-css-{cache_buster}">{css}</style>', unsafe_allow_html=True)
-            # VISIBLE indicator that CSS loaded
-            st.markdown(f'<div style="position: fixed; bottom: 10px; right: 10px; background: #d4ff00; color: #000; padding: 5px 10px; border-radius: 5px; font-size: 10px; z-index: 999999;">CSS v{cache_buster}</div>', unsafe_allow_html=True)
-            print(f"✅ MetaFlex CSS loaded with cache buster v{cache_buster}")
-    else:
-        st.error(f"⚠️ CSS file not found: {path}")
-
-def inject_js(path):
-    """Embed JS safely inside Streamlit iframe."""
-    if os.path.exists(path):
-        with open(path) as f:
-            js = f.read()
-            st.markdown(f"<script>{js}</script>", unsafe_allow_html=True)
-            print(f"✅ MetaFlex JS injected")
-    else:
-        st.warning(f"⚠️ JS file not found: {path}")
+def link_static_assets(css_path, js_path):
+    """
+    Link the minified, content-hashed brand CSS/JS (see static_assets).
+    The global style modules (base, navigation) are bundled ahead of style.css
+    so the cascade order matches the old inline blocks. Unlike the old inline
+    <script>, the linked metaflex.js really runs in the app page (see its header).
+    """
+    css_url = static_assets.bundle_url("style", [*map(style_path, GLOBAL_STYLE_MODULES), css_path])
+    js_url = static_assets.asset_url(js_path)
+    if not css_url:
+        st.error(f"⚠️ CSS file not found: {css_path}")
+    if not js_url:
+        st.warning(f"⚠️ JS file not found: {js_path}")
+
+    static_assets.link_assets({"brand-css": css_url, "brand-js": js_url})
 
 # --- Apply brand files ---
 css_path = os.path.join(current_dir, "style.css")
 js_path = os.path.join(current_dir, "static", "metaflex.js")
 
-inject_css(css_path)
-inject_js(js_path)
+link_static_assets(css_path, js_path)
+
 
 
 
 
+# ============================================
+# REPLAY PENDING SHEET WRITES (once per server process, retried until nothing is pending)
+# ============================================
+replay_sheet_journal()
 
 # ============================================
 # MAIN CONTENT AREA
@@ -1127,6 +424,9 @@ inject_js(js_path)
 content_container = st.container()
 
 with content_container:
+    # Queued edits of this user that were skipped on replay (row changed by someone else)
+    render_journal_conflicts(st.session_state.get("name"))
+
     functions = {
         "Overview": pg.show_dashboard,
         "My Tasks": pg.show_tasks,
@@ -1142,3 +442,6 @@ with content_container:
     else:
         st.error(f"⚠️ Page '{st.session_state.current_page}' is not yet implemented")
         st.info(f"Available pages: {', '.join(functions.keys())}")
+
+# Link the style modules the page declared (one bundled stylesheet)
+flush_styles()
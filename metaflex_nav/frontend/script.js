@@ -1,154 +1,124 @@
 /**
- * MetaFlex Navigation Header - Dynamic JavaScript
- * Automatically detects current page and applies active styling
- * Place this in your metaflex_nav folder and load via st.components.v1.html()
+ * MetaFlex Navigation - bidirectional Streamlit component
+ *
+ * Streamlit mounts this iframe once (same key = same iframe) and sends the
+ * current args on every rerun as a "streamlit:render" message; the menu is
+ * patched in place instead of being rebuilt. Clicks go back to Python as the
+ * component value: {page, nonce} or {action: "logout", nonce}.
  */
 
 (function() {
     'use strict';
-    
-    // Configuration
-    const CONFIG = {
-        navItems: [
-            { id: 'home', label: 'Home', page: 'Home' },
-            { id: 'my_tasks', label: 'My Tasks', page: 'My Tasks' },
-            { id: 'team_tasks', label: 'Team Tasks', page: 'Team Tasks' },
-            { id: 'archive', label: 'Archive', page: 'Archive' },
-            { id: 'sales_portal', label: 'Sales Portal', page: 'Sales Portal' },
-            { id: 'investor_portal', label: 'Investor Portal', page: 'Investor Portal' }
-        ],
-        logoText: 'X',
-        userBadgeText: 'Téa',
-        logoutText: 'Logout'
-    };
-
-    /**
-     * Get current page from Streamlit's session state
-     * This works by checking the URL or page title
-     */
-    function getCurrentPage() {
-        // Try to get page from URL parameters first
-        const urlParams = new URLSearchParams(window.location.search);
-        const pageParam = urlParams.get('page');
-        if (pageParam) return pageParam;
-
-        // Try to get from document title
-        const title = document.title;
-        for (const item of CONFIG.navItems) {
-            if (title.includes(item.page)) {
-                return item.page;
-            }
-        }
 
-        // Default to Home
-        return 'Home';
+    const root = document.getElementById('root');
+    let state = { pages: [], currentPage: null, showLogout: true, logoutLabel: 'Logout' };
+    let builtFor = null;   // pages signature the buttons were built for
+
+    // ============================================
+    // STREAMLIT PROTOCOL
+    // ============================================
+    function send(type, data) {
+        window.parent.postMessage(Object.assign({ isStreamlitMessage: true, type: type }, data), '*');
     }
 
-    /**
-     * Create the navigation HTML structure
-     */
-    function createNavHTML() {
-        const currentPage = getCurrentPage();
-        
-        let navItemsHTML = '';
-        for (const item of CONFIG.navItems) {
-            const isActive = item.page === currentPage;
-            const activeClass = isActive ? ' active' : '';
-            navItemsHTML += `
-                <button class="nav-button${activeClass}" 
-                        data-page="${item.page}" 
-                        onclick="navigateToPage('${item.page}')">
-                    ${item.label}
-                </button>
-            `;
-        }
+    function setValue(value) {
+        send('streamlit:setComponentValue', { value: value, dataType: 'json' });
+    }
 
-        return `
-            <div class="nav-container">
-                <div class="logo-section">
-                    <div class="logo">${CONFIG.logoText}</div>
-                </div>
-                
-                <div class="nav-items">
-                    ${navItemsHTML}
-                </div>
-                
-                <div class="user-section">
-                    <div class="user-badge">${CONFIG.userBadgeText}</div>
-                    <button class="logout-button" onclick="handleLogout()">
-                        ${CONFIG.logoutText}
-                    </button>
-                </div>
-            </div>
-        `;
+    function setFrameHeight() {
+        send('streamlit:setFrameHeight', { height: document.body.scrollHeight });
     }
 
-    /**
-     * Handle page navigation
-     */
-    window.navigateToPage = function(page) {
-        // Send message to Streamlit
-        if (window.parent) {
-            window.parent.postMessage({
-                type: 'streamlit:setComponentValue',
-                value: page
-            }, '*');
-        }
-        
-        // Update active state
-        updateActiveButton(page);
-    };
-
-    /**
-     * Handle logout
-     */
-    window.handleLogout = function() {
-        if (window.parent) {
-            window.parent.postMessage({
-                type: 'streamlit:setComponentValue',
-                value: 'LOGOUT'
-            }, '*');
+    window.addEventListener('message', function(event) {
+        if (!event.data || event.data.type !== 'streamlit:render') return;
+        const args = event.data.args || {};
+        state = {
+            pages: args.pages || [],
+            currentPage: args.current_page,
+            showLogout: args.show_logout !== false,
+            logoutLabel: args.logout_label || 'Logout'
+        };
+        render();
+    });
+
+    // ============================================
+    // RENDERING
+    // ============================================
+    function render() {
+        const signature = JSON.stringify([state.pages, state.showLogout, state.logoutLabel]);
+        if (signature !== builtFor) {
+            build();
+            builtFor = signature;
         }
-    };
-
-    /**
-     * Update which button appears active
-     */
-    function updateActiveButton(page) {
-        const buttons = document.querySelectorAll('.nav-button');
-        buttons.forEach(button => {
-            if (button.dataset.page === page) {
-                button.classList.add('active');
-            } else {
-                button.classList.remove('active');
-            }
-        });
+        markActive(state.currentPage);
+        setFrameHeight();
     }
 
-    /**
-     * Initialize navigation
-     */
-    function initNav() {
-        // Create nav element
-        const navElement = document.createElement('div');
-        navElement.innerHTML = createNavHTML();
-        
-        // Insert at top of body
-        if (document.body.firstChild) {
-            document.body.insertBefore(navElement, document.body.firstChild);
-        } else {
-            document.body.appendChild(navElement);
+    function build() {
+        root.textContent = '';
+
+        const toggle = document.createElement('button');
+        toggle.className = 'mf-toggle';
+        toggle.type = 'button';
+        toggle.textContent = '☰';
+        toggle.setAttribute('aria-label', 'Navigation');
+        toggle.addEventListener('click', function() {
+            setOpen(!root.classList.contains('open'));
+        });
+
+        const panel = document.createElement('div');
+        panel.className = 'mf-panel';
+
+        for (const page of state.pages) {
+            const item = document.createElement('button');
+            item.className = 'mf-item';
+            item.type = 'button';
+            item.dataset.page = page;
+            item.addEventListener('click', function() { navigate(page); });
+            panel.appendChild(item);
+        }
+
+        if (state.showLogout) {
+            panel.appendChild(Object.assign(document.createElement('hr'), { className: 'mf-separator' }));
+            const logout = document.createElement('button');
+            logout.className = 'mf-item';
+            logout.type = 'button';
+            logout.textContent = state.logoutLabel;
+            logout.addEventListener('click', function() {
+                setOpen(false);
+                setValue({ action: 'logout', nonce: Date.now() });
+            });
+            panel.appendChild(logout);
         }
 
-        // Add padding to body to account for fixed nav
-        document.body.style.paddingTop = '68px';
+        root.appendChild(toggle);
+        root.appendChild(panel);
     }
 
-    // Initialize when DOM is ready
-    if (document.readyState === 'loading') {
-        document.addEventListener('DOMContentLoaded', initNav);
-    } else {
-        initNav();
+    function markActive(page) {
+        root.querySelectorAll('.mf-item[data-page]').forEach(function(item) {
+            const isCurrent = item.dataset.page === page;
+            item.classList.toggle('active', isCurrent);
+            item.textContent = (isCurrent ? '✓ ' : '') + item.dataset.page;
+        });
     }
 
-})();
\ No newline at end of file
+    function setOpen(open) {
+        root.classList.toggle('open', open);
+        setFrameHeight();
+    }
+
+    function navigate(page) {
+        // Update immediately - the rerun confirms it via the next render
+        markActive(page);
+        setOpen(false);
+        setValue({ page: page, nonce: Date.now() });
+    }
+
+    // Close when the user clicks anywhere outside the iframe
+    window.addEventListener('blur', function() {
+        if (root.classList.contains('open')) setOpen(false);
+    });
+
+    send('streamlit:componentReady', { apiVersion: 1 });
+})();
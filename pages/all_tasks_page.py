@@ -6,8 +6,12 @@ from .dashboard_page import (
     get_column,
     has_column,
     render_editable_task_grid,
-    render_page_header
+    render_page_header,
+    scoped_view,
+    user_role,
+    fragment
 )
+from style_registry import use_styles
 
 def show_analytics():
     """
@@ -23,45 +27,21 @@ def show_analytics():
 
     # Get current user
     user_name = st.session_state.get("name", "Téa Phillips")
-    is_tea = user_name.lower() == "tea" or user_name.lower() == "tēa" or "tea" in user_name.lower()
-    is_jess = "jess" in user_name.lower()
+    role = user_role(user_name)
+    is_tea = role == "tea"
+    is_jess = role == "jess"
 
     # DEBUG: Show current user and permission level
     st.info(f"DEBUG: Logged in as '{user_name}', is_tea={is_tea}, is_jess={is_jess}, Total tasks in sheet: {len(df)}")
 
-    # Filter data based on user - ONLY Tea sees all tasks
+    # Filter data based on user - ONLY Tea sees all tasks, Jess sees her team's
+    # tasks (Jess, Megan, Justin), other users only their own
+    # (usually already computed by the post-login prefetch)
+    filtered_df = scoped_view(df, "team", user_name)
+    if filtered_df is None:
+        filtered_df = df
     if is_tea:
-        # Tea sees everyone's tasks - no filtering needed
-        filtered_df = df.copy()
         st.success(f"DEBUG: Tea mode - showing all {len(filtered_df)} tasks")
-    elif is_jess:
-        # Jess sees her team's tasks (Jess, Megan, Justin)
-        assignee_col = None
-        if has_column(df, "Assigned To"):
-            assignee_col = get_column(df, "Assigned To")
-        elif has_column(df, "Person"):
-            assignee_col = get_column(df, "Person")
-        elif has_column(df, "assignee"):
-            assignee_col = get_column(df, "assignee")
-
-        if assignee_col:
-            filtered_df = df[df[assignee_col].str.lower().str.contains('jess|megan|justin', na=False, regex=True)].copy()
-        else:
-            filtered_df = df.copy()
-    else:
-        # Other users (Megan, Justin, etc.) should only see their own tasks
-        assignee_col = None
-        if has_column(df, "Assigned To"):
-            assignee_col = get_column(df, "Assigned To")
-        elif has_column(df, "Person"):
-            assignee_col = get_column(df, "Person")
-        elif has_column(df, "assignee"):
-            assignee_col = get_column(df, "assignee")
-
-        if assignee_col:
-            filtered_df = df[df[assignee_col].str.lower().str.contains(user_name.lower(), na=False, regex=False)].copy()
-        else:
-            filtered_df = df.copy()
 
     # Use filtered_df for the rest of the page
     df = filtered_df
@@ -80,35 +60,16 @@ def show_analytics():
 
     # Add control checkboxes in a row
     # Style checkboxes to match header styling
-    st.markdown("""
-        <style>
-        /* Checkbox label styling to match headers */
-        div[data-testid="stCheckbox"] label p {
-            color: #0a4b4b !important;
-            font-size: 0.95rem !important;
-            font-weight: 600 !important;
-            letter-spacing: 0.02em !important;
-        }
-
-        /* Checkbox styling - teal theme */
-        div[data-testid="stCheckbox"] input[type="checkbox"] ~ span div svg rect {
-            fill: rgba(229, 231, 235, 0.5) !important;
-            stroke: rgba(10, 75, 75, 0.4) !important;
-            stroke-width: 1.5 !important;
-        }
-
-        div[data-testid="stCheckbox"] input[type="checkbox"]:checked ~ span div svg rect {
-            fill: #0a4b4b !important;
-            stroke: #0a4b4b !important;
-        }
-
-        div[data-testid="stCheckbox"] input[type="checkbox"]:checked ~ span div svg path {
-            fill: #ffffff !important;
-            stroke: #ffffff !important;
-        }
-        </style>
-    """, unsafe_allow_html=True)
+    use_styles("checkbox_teal")
+
+    _render_all_tasks_panel(df, user_name, is_tea)
 
+@fragment
+def _render_all_tasks_panel(df, user_name, is_tea):
+    """
+    Archive/transcript toggles, analytics charts and the editable grid.
+    Runs as a fragment: toggling a filter or editing a cell reruns only this panel.
+    """
     ctrl_col1, ctrl_col2, ctrl_col3 = st.columns([1, 1, 3])
 
     with ctrl_col1:
@@ -122,7 +83,7 @@ def show_analytics():
     # Filter to show only OPEN tasks (exclude Done/Complete/Closed) unless "Show Archived" is checked
     if has_column(df, "Status") and not show_archived:
         status_col = get_column(df, "Status")
-        df = df[~df[status_col].str.lower().isin(['done', 'complete', 'completed', 'closed'])].copy()
+        df = df[~df[status_col].str.lower().isin(['done', 'complete', 'completed', 'closed'])]
 
     # Add analytics charts for All Tasks
     from charts import create_task_completion_velocity, create_project_health_dashboard, create_tasks_by_user_chart
@@ -6,7 +6,10 @@ from .dashboard_page import (
     get_column,
     has_column,
     render_tasks_table,
-    render_page_header
+    render_page_header,
+    assignee_column,
+    scoped_view,
+    user_role
 )
 
 def show_archive():
@@ -16,8 +19,7 @@ def show_archive():
     # Get current user from session state
     user_name = st.session_state.get("name", "User")
     first_name = user_name.split()[0] if user_name else "User"
-    is_tea = user_name.lower() == "tea" or user_name.lower() == "tēa" or "tea" in user_name.lower()
-    is_jess = "jess" in user_name.lower()
+    is_tea = user_role(user_name) == "tea"
 
     # Page header matching MY TASKS / ALL TASKS style
     st.markdown("""
@@ -39,32 +41,17 @@ def show_archive():
         st.warning("No data available. Please check your Google Sheet connection.")
         return
 
-    # Filter by user if not Tea (Tea sees ALL archived tasks)
-    if not is_tea:
-        # Everyone else sees only their own archived tasks
-        assignee_col = None
-        if has_column(df, "Assigned To"):
-            assignee_col = get_column(df, "Assigned To")
-        elif has_column(df, "assignee"):
-            assignee_col = get_column(df, "assignee")
-        elif has_column(df, "Person"):
-            assignee_col = get_column(df, "Person")
-
-        if assignee_col:
-            df = df[df[assignee_col].str.lower().str.contains(user_name.lower(), na=False)].copy()
-        else:
-            st.error(f"Cannot filter tasks: No assignee column found. Available columns: {', '.join(df.columns.tolist())}")
-            return
-
-    # Filter for done tasks only
-    if has_column(df, "Status"):
-        status_col = get_column(df, "Status")
-        # Filter for done/complete status (case-insensitive)
-        archived_df = df[df[status_col].str.strip().str.lower().isin(['done', 'complete', 'completed'])]
-    else:
+    # Tea sees ALL archived tasks, everyone else only their own
+    if not is_tea and assignee_column(df) is None:
+        st.error(f"Cannot filter tasks: No assignee column found. Available columns: {', '.join(df.columns.tolist())}")
+        return
+    if not has_column(df, "Status"):
         st.warning("Status column not found in data.")
         return
 
+    # Done/complete tasks in the user's scope (usually already computed by the post-login prefetch)
+    archived_df = scoped_view(df, "archive", user_name)
+
     if archived_df.empty:
         st.info("No archived tasks found. Tasks marked as 'Done' will appear here.")
         return
@@ -1,11 +1,37 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import gspread
+import copy
+import hashlib
+import os
 import re
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from gspread.urls import DRIVE_FILES_API_V3_URL
+from gspread.utils import a1_to_rowcol, rowcol_to_a1
 from google.oauth2 import service_account
 from google.oauth2.service_account import Credentials
 from st_aggrid import AgGrid, GridOptionsBuilder, GridUpdateMode
 from charts import create_team_completion_donut, create_project_breakdown_chart
+import cache_backend
+import sheet_journal
+import snapshot_store
+import sheets_quota
+from sheets_quota import call_sheets
+from style_registry import use_styles
+
+# Copy-on-Write: filtered/derived frames share memory with the snapshot and only
+# copy a column when it is actually written, so pages never need defensive copies
+pd.set_option("mode.copy_on_write", True)
+
+# Partial reruns: interacting with a widget inside a fragment reruns only that
+# fragment, not the whole page (data load, KPIs, charts, CSS...).
+# st.fragment needs Streamlit 1.37+, older versions ship it as experimental_fragment.
+fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda func: func)
 
 def get_column(df, col_name):
     """
@@ -67,6 +93,25 @@ ACCESS_SCOPE = {
     "Justin Stehr": ["Marketing", "Products"],
 }
 
+# Otter_Tasks sheet schema - drives which columns are downloaded and how they are named
+SHEET_SCHEMA = {
+    "sheet_id": "1U_9CEbWHWMQVS2C20O0fpOG5gVxoYjB7BmppKlTHIzc",
+    "worksheet": "Otter_Tasks",
+    # Main task fields live in A-J, Priority in N. Everything else
+    # (Progress Bar, Confidence, Emails, Duplicate Check...) is never fetched.
+    "column_ranges": ["A:J", "N:N"],
+    # Headers dropped even if they fall inside a fetched range
+    "hidden_columns": ["Progress Bar", "Confidence", "Emails", "Duplicate Check", "0%"],
+    # Fixed names for columns whose header cell is blank in the sheet
+    "default_names": {"N": "Priority"},
+    # Low-cardinality columns stored as categoricals; everything else is string[pyarrow]
+    "categorical_columns": ["Status", "Project", "Person", "Assigned To", "Priority"],
+}
+
+# Drive files endpoint for the sheet freshness probe.
+# Set METAFLEX_DRIVE_API_URL to point the probe at a local stand-in server when testing.
+DRIVE_FILES_URL = os.environ.get("METAFLEX_DRIVE_API_URL", DRIVE_FILES_API_V3_URL)
+
 def get_scope_description(user_name, scope):
     """
     Generate a friendly description of the user's access scope
@@ -138,189 +183,989 @@ def filter_by_access(df, user_name):
         filtered_df = df[df[person_col].str.contains(user_name, case=False, na=False)]
         return filtered_df
 
-@st.cache_data(ttl=45)  # Cache for 45 seconds to reduce API calls
-def load_google_sheet():
+def _cell_text(value):
+    """Normalize a cell value to the string Google Sheets would hold"""
+    if value is None:
+        return ""
+    try:
+        if pd.isna(value):
+            return ""
+    except (TypeError, ValueError):
+        pass
+    return str(value)
+
+def _row_version(values):
     """
-    Load data from Google Sheets (Otter_Tasks worksheet)
-    Cached for 45 seconds to avoid hitting API quota limits
+    Short content hash of one sheet row (over the columns the dashboard loads).
+    Used as the row's version for optimistic concurrency checks on save.
+    """
+    joined = "\x1f".join(_cell_text(v) for v in values)
+    return hashlib.blake2b(joined.encode("utf-8"), digest_size=8).hexdigest()
+
+class SheetRowMeta:
+    """
+    Snapshot metadata attached to the task frame via df.attrs["sheet_meta"].
+
+    row_versions: {frame index: version hash}, sheet row number is index + 2
+    column_sheet_index: {frame column: 0-based column position in the sheet}
+    revision: Sheet revision the frame was loaded at (versions derived-view cache keys)
+    fetched_at: When the download started (time.time()), None if unknown
+
+    Treated as immutable - pandas deep-copies attrs on every operation,
+    so __deepcopy__ hands back the same object instead of cloning the dicts.
+    """
+
+    def __init__(self, row_versions, column_sheet_index, revision=None, fetched_at=None):
+        self.row_versions = row_versions
+        self.column_sheet_index = column_sheet_index
+        self.revision = revision
+        self.fetched_at = fetched_at
+
+    @property
+    def columns(self):
+        return list(self.column_sheet_index.keys())
+
+    @property
+    def sheet_width(self):
+        return max(self.column_sheet_index.values()) + 1 if self.column_sheet_index else 0
+
+    def __deepcopy__(self, memo):
+        return self
+
+def get_sheet_meta(df):
+    """Return the SheetRowMeta attached to a frame loaded by load_google_sheet (or None)"""
+    return df.attrs.get("sheet_meta")
+
+def _frame_version(df):
+    """
+    Cache version for a frame derived from the snapshot: the sheet revision plus
+    a digest of which rows and columns it holds. Role filters only select rows,
+    so two sessions with the same view of the same revision share one key.
+    Returns None (don't cache) for frames that didn't come from load_google_sheet.
+    """
+    meta = get_sheet_meta(df)
+    if meta is None or meta.revision is None:
+        return None
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(pd.Index(df.index).to_numpy(dtype="int64", na_value=-1).tobytes())
+    digest.update("\x1f".join(map(str, df.columns)).encode("utf-8"))
+    return f"{meta.revision}:{digest.hexdigest()}"
+
+def _apply_column_dtypes(df):
+    """
+    Store low-cardinality columns (SHEET_SCHEMA["categorical_columns"]) as
+    categoricals and free text as Arrow-backed strings instead of Python objects.
+    "" is always a category so fillna('') and blank comparisons keep working.
+    """
+    categorical = set(SHEET_SCHEMA["categorical_columns"])
+    dtypes = {}
+    for col in df.columns:
+        if str(col).rsplit("___", 1)[0] in categorical:
+            dtypes[col] = pd.CategoricalDtype(sorted(set(df[col].astype(str).unique()) | {""}))
+        else:
+            dtypes[col] = "string[pyarrow]"
+    return df.astype(dtypes)
+
+def editable_frame(df):
+    """
+    Plain-object copy of a snapshot frame for write-back paths: categoricals
+    only accept existing categories, so edited cells must land in object columns.
+    """
+    return df.astype(object)
+
+def memory_report(df):
+    """
+    Bytes per column (deep), largest first, with a "TOTAL" row.
+    """
+    usage = df.memory_usage(deep=True, index=False)
+    report = pd.DataFrame({
+        "dtype": df.dtypes.astype(str),
+        "bytes": usage,
+    }).sort_values("bytes", ascending=False)
+    report.loc["TOTAL"] = ["", int(usage.sum())]
+    return report
+
+def _schema_positions(column_range):
+    """
+    Expand a column range like "A:J" or "N:N" into 0-based sheet column positions
+    """
+    start, end = column_range.split(":")
+    first = a1_to_rowcol(f"{start}1")[1] - 1
+    last = a1_to_rowcol(f"{end}1")[1] - 1
+    return list(range(first, last + 1))
+
+def _project_sheet_values(value_ranges, column_ranges):
+    """
+    Stitch the per-range results of a batch_get back into rows.
+
+    Returns (positions, rows): positions are the 0-based sheet columns fetched,
+    rows are lists aligned to positions (header row first). The Sheets API trims
+    trailing empty cells/rows per range, so everything is padded back out.
+    """
+    range_positions = [_schema_positions(r) for r in column_ranges]
+    positions = [p for block in range_positions for p in block]
+    row_count = max((len(values) for values in value_ranges), default=0)
+
+    rows = []
+    for row_idx in range(row_count):
+        row = []
+        for values, block in zip(value_ranges, range_positions):
+            cells = list(values[row_idx]) if row_idx < len(values) else []
+            row.extend(cells[:len(block)] + [""] * (len(block) - len(cells)))
+        rows.append(row)
+
+    return positions, rows
+
+@st.cache_resource
+def _read_client():
+    """
+    Authorized read-only gspread client, shared by every session in this process
+    """
+    # Define the scope
+    scope = [
+        "https://spreadsheets.google.com/feeds",
+        "https://www.googleapis.com/auth/drive"
+    ]
+
+    # Load credentials from Streamlit secrets
+    creds_dict = st.secrets["gcp_service_account"]
+    creds = Credentials.from_service_account_info(creds_dict, scopes=scope)
+
+    # Authorize the client
+    return gspread.authorize(creds)
+
+def _open_read_worksheet():
+    """
+    Open the Otter_Tasks worksheet with read scopes
     """
+    client = _read_client()
+    spreadsheet = call_sheets(client.open_by_key, SHEET_SCHEMA["sheet_id"])
+
+    # Try to open Otter_Tasks worksheet, fallback to first sheet
     try:
-        # Define the scope
-        scope = [
-            "https://spreadsheets.google.com/feeds",
-            "https://www.googleapis.com/auth/drive"
-        ]
+        return call_sheets(spreadsheet.worksheet, SHEET_SCHEMA["worksheet"])
+    except gspread.exceptions.WorksheetNotFound:
+        return call_sheets(spreadsheet.get_worksheet, 0)
+
+@st.cache_data(ttl=45)  # Probe at most every 45 seconds
+def _sheet_revision():
+    """
+    Cheap freshness probe: the spreadsheet's Drive version / modifiedTime.
+    A few hundred bytes instead of the whole sheet - the full download only
+    happens when this value changes. Falls back to a 45 second time bucket
+    if the probe fails, which matches the old TTL-only behaviour.
+    """
+    try:
+        response = call_sheets(
+            _read_client().http_client.request,
+            "get",
+            f"{DRIVE_FILES_URL}/{SHEET_SCHEMA['sheet_id']}",
+            params={"fields": "version,modifiedTime", "supportsAllDrives": True},
+        )
+        metadata = response.json()
+        return f"rev:{metadata.get('version', '')}:{metadata.get('modifiedTime', '')}"
+    except Exception as e:
+        print(f"⚠️ Sheet revision probe failed: {str(e)}")
+        return f"ttl:{int(time.time() // 45)}"
+
+def _snapshot_revision():
+    """
+    Version the snapshot is cached under: the sheet revision plus the write
+    generation (see cache_backend.bump_write_generation), so the next load
+    after a save always downloads post-write data and row versions.
+    """
+    return f"{_sheet_revision()}:w{cache_backend.write_generation()}"
 
-        # Load credentials from Streamlit secrets
-        creds_dict = st.secrets["gcp_service_account"]
-        creds = Credentials.from_service_account_info(creds_dict, scopes=scope)
+# Last successfully loaded snapshot in this process, served while the API is unhealthy
+# (and, right after a restart, the on-disk snapshot until the first refresh finishes)
+_last_good_snapshot = {}
+_cold_start_lock = threading.Lock()
 
-        # Authorize and open the sheet
-        client = gspread.authorize(creds)
-        
-        # Use Google Sheet ID: 1U_9CEbWHWMQVS2C20O0fpOG5gVxoYjB7BmppKlTHIzc
-        sheet_id = "1U_9CEbWHWMQVS2C20O0fpOG5gVxoYjB7BmppKlTHIzc"
+# How often the fetcher process re-probes the sheet and republishes (seconds)
+SNAPSHOT_PUBLISH_SECONDS = 45
 
-        # Try to open Otter_Tasks worksheet, fallback to first sheet
-        try:
-            sheet = client.open_by_key(sheet_id).worksheet("Otter_Tasks")
-        except:
-            sheet = client.open_by_key(sheet_id).sheet1
+# Session state key: when this session last wrote to the sheet (time.time())
+WRITTEN_AT_KEY = "_sheet_written_at"
+
+@st.cache_resource(max_entries=2)  # Keyed by sheet revision - no TTL needed
+def _load_sheet_snapshot(revision):
+    """
+    Snapshot for a given revision (see _snapshot_revision). Checks the shared cache
+    tier first (see cache_backend), so with a Redis backend only one replica
+    downloads each revision. Raises on API errors so failures are never cached.
+
+    Cached as a resource: every session shares one frame per revision instead of
+    unpickling its own copy. Copy-on-Write only protects it from writes made
+    through derived frames (filters, column selections, copy(deep=False)) -
+    callers must never mutate the returned frame itself (df[col] = ...,
+    df.loc[...] = ..., df.attrs), since every session would see the change.
+    Take df.copy(deep=False) first, or editable_frame(df) for write-back.
+    """
+    df = cache_backend.cached_view(
+        "snapshot",
+        revision,
+        (SHEET_SCHEMA["sheet_id"], SHEET_SCHEMA["worksheet"], SHEET_SCHEMA["column_ranges"]),
+        lambda: _download_sheet_snapshot(revision),
+    )
 
-        # Get all values as list of lists
-        all_values = sheet.get_all_values()
+    # Persist for instant cold starts (see _serve_cold_start_snapshot)
+    meta = get_sheet_meta(df)
+    if meta is not None:
+        try:
+            snapshot_store.save_snapshot(df, revision, fetched_at=meta.fetched_at, extra={
+                "row_versions": {str(idx): version for idx, version in meta.row_versions.items()},
+                "column_sheet_index": meta.column_sheet_index,
+            })
+        except Exception as e:
+            print(f"⚠️ Could not persist sheet snapshot: {str(e)}")
 
-        if not all_values or len(all_values) < 2:
-            st.warning("Sheet is empty or has no data rows.")
-            return pd.DataFrame()
+    return df
 
-        # First row is headers, rest is data
-        headers = all_values[0]
-        data_rows = all_values[1:]
+def _download_sheet_snapshot(revision):
+    """
+    Download and shape the sheet for a given revision.
+    Only the column ranges listed in SHEET_SCHEMA are downloaded (one batch_get).
+    """
+    fetched_at = time.time()
+    sheet = _open_read_worksheet()
 
-        # Create DataFrame
-        df = pd.DataFrame(data_rows, columns=headers)
+    # Projected read: fetch only the schema's column ranges in a single request
+    column_ranges = SHEET_SCHEMA["column_ranges"]
+    value_ranges = call_sheets(sheet.batch_get, column_ranges)
+    positions, all_values = _project_sheet_values(value_ranges, column_ranges)
 
-        # Remove empty rows
-        df = df.dropna(how='all')
+    if not all_values or len(all_values) < 2:
+        st.warning("Sheet is empty or has no data rows.")
+        return pd.DataFrame()
 
-        # Remove columns with empty headers AND no data
-        # Use column indices to avoid duplicate column name issues
-        cols_to_keep = []
-        for idx, col in enumerate(df.columns):
-            # Keep column if it has a non-empty header OR has any non-empty data
-            if str(col).strip() != '':
+    # First row is headers, rest is data
+    headers = all_values[0]
+    data_rows = all_values[1:]
+
+    # Name columns whose header cell is blank but whose meaning is fixed by the schema
+    for letter, default_name in SHEET_SCHEMA["default_names"].items():
+        position = _schema_positions(f"{letter}:{letter}")[0]
+        if position in positions:
+            header_idx = positions.index(position)
+            if not str(headers[header_idx]).strip():
+                headers[header_idx] = default_name
+
+    # Create DataFrame
+    df = pd.DataFrame(data_rows, columns=headers)
+
+    # Remove empty rows
+    df = df.dropna(how='all')
+
+    # Drop schema-hidden columns, and columns with an empty header AND no data
+    # Use column indices to avoid duplicate column name issues
+    hidden = SHEET_SCHEMA["hidden_columns"]
+    cols_to_keep = []
+    for idx, col in enumerate(df.columns):
+        col_name = str(col).strip()
+        if col_name in hidden or "confidence" in col_name.lower():
+            continue
+        # Keep column if it has a non-empty header OR has any non-empty data
+        if col_name != '':
+            cols_to_keep.append(idx)
+        else:
+            # Check if column has any data (using iloc to avoid duplicate column issues)
+            col_data = df.iloc[:, idx].astype(str).str.strip()
+            if col_data.ne('').any():
                 cols_to_keep.append(idx)
-            else:
-                # Check if column has any data (using iloc to avoid duplicate column issues)
-                col_data = df.iloc[:, idx].astype(str).str.strip()
-                if col_data.ne('').any():
-                    cols_to_keep.append(idx)
-
-        # Select only the columns we want to keep
-        df = df.iloc[:, cols_to_keep]
-
-        # Store mapping of clean column names to unique column names
-        # This allows the rest of the code to reference "Person", "Task", etc.
-        original_cols = [str(col).strip() for col in df.columns]
-
-        # Define columns to hide by name
-        columns_to_hide = ["Progress Bar", "Confidence", "Emails", "Duplicate Check", "0%"]
-
-        # Filter columns: keep the first 10 columns PLUS column 14 (Priority) and exclude unwanted ones
-        filtered_indices = []
-        for i, col_name in enumerate(original_cols):
-            # Keep first 10 columns (0-9) which are the main task fields, PLUS column 13 (index 13 = column 14 in sheets)
-            # Column 14 is the Priority column
-            if i >= 10 and i != 13:
-                continue
-            # Skip columns in the hide list
-            if col_name in columns_to_hide or "confidence" in col_name.lower():
-                continue
-            filtered_indices.append(i)
 
-        # Keep only the filtered columns
-        df = df.iloc[:, filtered_indices]
-        original_cols = [original_cols[i] for i in filtered_indices]
+    # Select only the columns we want to keep
+    df = df.iloc[:, cols_to_keep]
+    original_cols = [str(df.columns[i]).strip() for i in range(len(cols_to_keep))]
+
+    # Remember where each kept column lives in the sheet (for targeted writes)
+    sheet_positions = [positions[i] for i in cols_to_keep]
+
+    # Make ALL column names absolutely unique by appending index
+    unique_cols = [f"{original_cols[i]}___{i}" for i in range(len(original_cols))]
+    df.columns = unique_cols
+
+    # Store the mapping in session state for reference
+    if 'column_mapping' not in st.session_state:
+        st.session_state.column_mapping = {}
+
+    # Map original name to unique name (for first occurrence only)
+    for i, orig_name in enumerate(original_cols):
+        if orig_name not in st.session_state.column_mapping:
+            st.session_state.column_mapping[orig_name] = unique_cols[i]
+
+    # Categoricals + Arrow strings: several times smaller than object columns,
+    # for every session, cache entry and on-disk snapshot
+    df = _apply_column_dtypes(df)
+    print(f"📊 Sheet snapshot: {len(df)} rows, {df.memory_usage(deep=True).sum() / 1024:.0f} KiB in memory")
+
+    # Version every row so saves only touch (and re-check) the rows that changed
+    df.attrs["sheet_meta"] = SheetRowMeta(
+        row_versions={idx: _row_version(row) for idx, row in zip(df.index, df.itertuples(index=False))},
+        column_sheet_index=dict(zip(unique_cols, sheet_positions)),
+        revision=revision,
+        fetched_at=fetched_at,
+    )
+
+    return df
 
-        # Ensure Priority column has a name (it's column 14, index 13 in original sheet)
-        # If column 13 was included and has empty name, name it "Priority"
-        if 13 in filtered_indices:
-            priority_position = filtered_indices.index(13)
-            if not original_cols[priority_position] or original_cols[priority_position].strip() == '':
-                original_cols[priority_position] = "Priority"
+def _read_disk_snapshot():
+    """
+    Memory-map the persisted snapshot and re-attach its SheetRowMeta.
+    Returns (df, info) or (None, None).
+    """
+    disk_df, info = snapshot_store.load_snapshot()
+    if disk_df is None:
+        return None, None
+    extra = info.get("extra", {})
+    disk_df.attrs["sheet_meta"] = SheetRowMeta(
+        row_versions={int(idx): version for idx, version in extra.get("row_versions", {}).items()},
+        column_sheet_index=extra.get("column_sheet_index", {}),
+        revision=info.get("revision"),
+        fetched_at=info.get("fetched_at"),
+    )
+    return disk_df, info
 
-        # Make ALL column names absolutely unique by appending index
-        unique_cols = [f"{original_cols[i]}___{i}" for i in range(len(original_cols))]
-        df.columns = unique_cols
+@st.cache_resource(max_entries=1)
+def _published_snapshot(version):
+    """
+    Reader processes: map the snapshot published by the fetcher process.
+    Cached as a resource keyed by version, so every session in this process
+    shares one frame and the file is only re-mapped when the version changes.
+    """
+    disk_df, _ = _read_disk_snapshot()
+    return disk_df
 
-        # Store the mapping in session state for reference
-        if 'column_mapping' not in st.session_state:
-            st.session_state.column_mapping = {}
+def _publisher_loop():
+    """Fetcher process: keep the shared snapshot fresh even with no visitors"""
+    while True:
+        try:
+            _load_sheet_snapshot(_snapshot_revision())
+        except Exception as e:
+            print(f"⚠️ Snapshot publisher refresh failed: {str(e)}")
+        time.sleep(SNAPSHOT_PUBLISH_SECONDS)
 
-        # Map original name to unique name (for first occurrence only)
-        for i, orig_name in enumerate(original_cols):
-            if orig_name not in st.session_state.column_mapping:
-                st.session_state.column_mapping[orig_name] = unique_cols[i]
+@st.cache_resource
+def start_snapshot_publisher():
+    """
+    Start the publisher thread once per process when this process is the
+    designated fetcher (METAFLEX_SNAPSHOT_ROLE=fetcher). No-op otherwise.
+    """
+    if snapshot_store.SNAPSHOT_ROLE != "fetcher":
+        return None
+    thread = threading.Thread(target=_publisher_loop, name="metaflex-snapshot-publisher", daemon=True)
+    thread.start()
+    return thread
+
+def _background_refresh():
+    """Run the first Google Sheets load of this process off the render path"""
+    try:
+        df = _load_sheet_snapshot(_snapshot_revision())
+        if not df.empty:
+            _last_good_snapshot["df"] = df
+    except Exception as e:
+        print(f"⚠️ Background sheet refresh failed: {str(e)}")
+    finally:
+        _last_good_snapshot["refreshed"] = True
 
-        return df
+def _serve_cold_start_snapshot():
+    """
+    On a cold process, return the on-disk snapshot immediately (marked stale)
+    and kick off the first real refresh in a background thread.
+    Returns None once that refresh has finished, or if there is nothing on disk.
+    """
+    if _last_good_snapshot.get("refreshed"):
+        return None
+
+    with _cold_start_lock:
+        if "df" not in _last_good_snapshot:
+            disk_df, info = _read_disk_snapshot()
+            if disk_df is None:
+                return None
+            _last_good_snapshot["df"] = disk_df
+            _last_good_snapshot["saved_at"] = info.get("saved_at")
+
+        if not _last_good_snapshot.get("refresh_started"):
+            _last_good_snapshot["refresh_started"] = True
+            threading.Thread(target=_background_refresh, name="metaflex-sheet-refresh", daemon=True).start()
+
+    saved_at = _last_good_snapshot.get("saved_at")
+    if saved_at:
+        st.caption(f"Showing saved data from {time.strftime('%b %d, %H:%M', time.localtime(saved_at))} - refreshing from Google Sheets in the background.")
+    return _last_good_snapshot["df"]
+
+def load_google_sheet():
+    """
+    Load data from Google Sheets (Otter_Tasks worksheet)
+    A cheap revision probe runs at most every 45 seconds; the full download
+    only happens when the sheet has actually changed since the last load.
+    Right after a restart the last on-disk snapshot is served while the first refresh runs.
+    Every snapshot handed to a page also schedules the user's prefetch (see prefetch_user_views).
+    """
+    df = _current_snapshot()
+    prefetch_user_views(df, st.session_state.get("name"))
+    return df
+
+def _published_is_stale_for_session(header):
+    """
+    True if this session saved to the sheet after the published snapshot was
+    downloaded - its row versions would turn the next edit into a false conflict.
+    """
+    written_at = st.session_state.get(WRITTEN_AT_KEY)
+    if written_at is None:
+        return False
+    if (header.get("fetched_at") or 0) > written_at:
+        st.session_state.pop(WRITTEN_AT_KEY, None)  # The fetcher has caught up
+        return False
+    return True
+
+def _current_snapshot():
+    """Body of load_google_sheet"""
+    # Reader replicas never call Google Sheets for reads - they map the fetcher's snapshot.
+    # Exception: right after this session saved, read the sheet directly until the
+    # fetcher publishes a snapshot downloaded after the write (that load also
+    # republishes, see _load_sheet_snapshot).
+    if snapshot_store.SNAPSHOT_ROLE == "reader":
+        header = snapshot_store.published_header()
+        if header is not None and not _published_is_stale_for_session(header):
+            published_df = _published_snapshot(header["version"])
+            if published_df is not None:
+                return published_df
+
+    if st.session_state.get(WRITTEN_AT_KEY) is None:
+        stale_df = _serve_cold_start_snapshot()
+        if stale_df is not None:
+            return stale_df
 
+    try:
+        df = _load_sheet_snapshot(_snapshot_revision())
+        if not df.empty:
+            _last_good_snapshot["df"] = df
+        return df
     except Exception as e:
+        # Serve the last good snapshot while Sheets is throttling or down
+        last_good = _last_good_snapshot.get("df")
+        if last_good is not None:
+            st.warning("Google Sheets is temporarily unavailable - showing the most recently loaded data.")
+            print(f"⚠️ Serving last good snapshot: {str(e)} | quota metrics: {sheets_quota.get_metrics()}")
+            return last_good
         st.error(f"Error loading Google Sheet: {str(e)}")
         return pd.DataFrame()
 
-def update_google_sheet(updated_df):
+def clear_sheet_cache():
     """
-    Push edited data back to Google Sheets (Otter_Tasks worksheet)
-    SMART MODE: Updates existing rows in place, appends new rows to first blank line
+    Make every replica's next load hit Google Sheets: bump the shared write
+    generation (new snapshot version, so the cached snapshot and every view
+    derived from it are skipped) and forget this process's cached revision.
+    """
+    cache_backend.bump_write_generation()
+    _sheet_revision.clear()
+    _load_sheet_snapshot.clear()
+
+def _open_write_worksheet():
+    """
+    Open the Otter_Tasks worksheet with read/write scopes
     """
+    SCOPES = [
+        "https://www.googleapis.com/auth/spreadsheets",
+        "https://www.googleapis.com/auth/drive",
+    ]
+    creds = service_account.Credentials.from_service_account_info(
+        st.secrets["gcp_service_account"], scopes=SCOPES
+    )
+    gc = gspread.authorize(creds)
+    spreadsheet = call_sheets(gc.open_by_key, SHEET_SCHEMA["sheet_id"])
+
+    # Try to open Otter_Tasks worksheet, fallback to first sheet
     try:
-        SCOPES = [
-            "https://www.googleapis.com/auth/spreadsheets",
-            "https://www.googleapis.com/auth/drive",
-        ]
-        creds = service_account.Credentials.from_service_account_info(
-            st.secrets["gcp_service_account"], scopes=SCOPES
-        )
-        gc = gspread.authorize(creds)
+        return call_sheets(spreadsheet.worksheet, SHEET_SCHEMA["worksheet"])
+    except gspread.exceptions.WorksheetNotFound:
+        return call_sheets(spreadsheet.get_worksheet, 0)
+
+def _append_key(values):
+    """Identity of an appended row: its cell texts without trailing blanks"""
+    values = [_cell_text(v) for v in values]
+    while values and not values[-1]:
+        values.pop()
+    return tuple(values)
+
+def _unapplied_appends(ws, entry, rows):
+    """
+    Rows of a journaled append that still have to be sent.
+    The first attempt is recorded in the journal; a later replay of the same
+    entry reads the sheet and drops rows it already holds (the earlier call may
+    have timed out after Sheets added them), so appends are never duplicated.
+    Rows are matched on their full contents - a task row identical in every
+    cell to one already in the sheet is taken as applied.
+    """
+    if not rows:
+        return []
+    if not entry.get("attempted"):
+        sheet_journal.mark_attempted(entry["id"])
+        return rows
+
+    existing = Counter(_append_key(row) for row in call_sheets(ws.get_values)[1:])
+    unapplied = []
+    for row in rows:
+        key = _append_key(row)
+        if existing[key]:
+            existing[key] -= 1
+        else:
+            unapplied.append(row)
+    if len(unapplied) < len(rows):
+        print(f"⚠️ Skipped {len(rows) - len(unapplied)} row(s) already appended by an earlier attempt")
+    return unapplied
+
+def _apply_sheet_mutation(ws, entry):
+    """
+    Apply one journaled mutation to the worksheet. Raises on failure.
+    Returns the list of sheet rows skipped because of a version conflict.
+    """
+    op = entry["op"]
+    payload = entry["payload"]
+    conflicts = []
+
+    if op == "update_rows":
+        rows = payload["rows"]
+        width = payload["sheet_width"]
+
+        if rows:
+            # Targeted read: only the touched rows, in a single request
+            ranges = [
+                f"{rowcol_to_a1(r['row'], 1)}:{rowcol_to_a1(r['row'], width)}"
+                for r in rows
+            ]
+            current_rows = call_sheets(ws.batch_get, ranges)
+
+            cell_updates = []
+            for row_update, current in zip(rows, current_rows):
+                current_values = current[0] if current else []
+                current_values = list(current_values) + [""] * (width - len(current_values))
+
+                # Version check over the same columns the snapshot was hashed on
+                positions = payload["version_columns"]
+                if _row_version([current_values[p] for p in positions]) != row_update["version"]:
+                    # Already holding our values: an earlier, half-applied attempt
+                    # of this entry wrote them - not someone else's change
+                    if any(current_values[int(p)] != v for p, v in row_update["values"].items()):
+                        conflicts.append(row_update["row"])
+                    continue
+
+                # Only send cells whose value actually differs from the sheet
+                for position, value in row_update["values"].items():
+                    position = int(position)
+                    if current_values[position] != value:
+                        cell_updates.append({
+                            "range": rowcol_to_a1(row_update["row"], position + 1),
+                            "values": [[value]],
+                        })
+
+            if cell_updates:
+                call_sheets(ws.batch_update, cell_updates)
+
+        appends = _unapplied_appends(ws, entry, payload.get("appends"))
+        if appends:
+            call_sheets(ws.append_rows, appends, idempotent=False)
+
+    elif op == "append_row":
+        if _unapplied_appends(ws, entry, [payload["row"]]):
+            call_sheets(ws.append_row, payload["row"], idempotent=False)
+
+    else:
+        raise ValueError(f"Unknown sheet journal operation: {op}")
 
-        # Use Google Sheet ID: 1U_9CEbWHWMQVS2C20O0fpOG5gVxoYjB7BmppKlTHIzc
-        SHEET_ID = "1U_9CEbWHWMQVS2C20O0fpOG5gVxoYjB7BmppKlTHIzc"
+    if conflicts:
+        print(f"⚠️ Skipped sheet rows changed by someone else: {conflicts}")
+    return conflicts
 
-        # Try to open Otter_Tasks worksheet, fallback to first sheet
-        try:
-            ws = gc.open_by_key(SHEET_ID).worksheet("Otter_Tasks")
-        except:
-            ws = gc.open_by_key(SHEET_ID).sheet1
-
-        # Get current sheet data to compare
-        current_data = ws.get_all_values()
-        current_row_count = len(current_data)  # Includes header
-
-        # Strip the suffix from column names before writing back
-        df_to_write = updated_df.copy()
-        clean_columns = []
-        for col in df_to_write.columns:
-            # Remove everything from __ onwards (two or more underscores)
-            clean_col = re.sub(r'__+.*$', '', str(col))
-            clean_columns.append(clean_col)
-        df_to_write.columns = clean_columns
-
-        # Remove completely empty rows (all columns are empty/whitespace)
-        df_to_write = df_to_write.replace('', pd.NA).dropna(how='all').fillna('')
-
-        # Determine how many rows are in the updated dataframe
-        new_row_count = len(df_to_write) + 1  # +1 for header
-
-        if new_row_count > current_row_count:
-            # NEW ROWS ADDED - only append the new rows to the end
-            num_new_rows = new_row_count - current_row_count
-            new_rows = df_to_write.iloc[-num_new_rows:].values.tolist()
-
-            # Append new rows starting at the first blank row
-            for row_data in new_rows:
-                ws.append_row(row_data)
+def _flush_sheet_journal():
+    """
+    Push every pending journal entry to Google Sheets, oldest first.
+    Returns (committed_count, remaining_count).
+    """
+    if not sheet_journal.pending_entries():
+        return 0, 0
+
+    ws = _open_write_worksheet()
+    return sheet_journal.replay_pending(lambda entry: _apply_sheet_mutation(ws, entry),
+                                        retryable=sheets_quota.is_transient)
+
+# Startup journal replay: done once it leaves nothing pending, retried otherwise
+JOURNAL_REPLAY_RETRY_SECONDS = 60
+_journal_replay = {"done": False, "next_attempt": 0.0}
+_journal_replay_lock = threading.Lock()
+
+def replay_sheet_journal():
+    """
+    Replay writes left uncommitted by a crash or API outage.
+    Runs once per server process at startup; if that replay fails or leaves
+    writes pending, it is retried on a later page load (at most every
+    JOURNAL_REPLAY_RETRY_SECONDS) instead of being remembered as done.
+    """
+    if _journal_replay["done"] or time.monotonic() < _journal_replay["next_attempt"]:
+        return 0
+    if not _journal_replay_lock.acquire(blocking=False):
+        return 0  # Another session is replaying right now
+
+    try:
+        committed, remaining = _flush_sheet_journal()
+        if committed:
+            clear_sheet_cache()
+            print(f"✅ Replayed {committed} pending Google Sheet write(s) from journal")
+        if remaining:
+            print(f"⚠️ {remaining} Google Sheet write(s) still pending in journal")
         else:
-            # EXISTING ROWS UPDATED - update only the changed rows
-            # Update header + all data rows (overwrite existing range only)
-            data_to_write = [df_to_write.columns.values.tolist()] + df_to_write.values.tolist()
-            range_to_update = f'A1:{chr(65 + len(df_to_write.columns) - 1)}{len(data_to_write)}'
-            ws.update(range_to_update, data_to_write)
+            _journal_replay["done"] = True
+        return committed
+    except Exception as e:
+        print(f"⚠️ Could not replay sheet journal: {str(e)}")
+        return 0
+    finally:
+        _journal_replay["next_attempt"] = time.monotonic() + JOURNAL_REPLAY_RETRY_SECONDS
+        _journal_replay_lock.release()
 
-        return True
+def _journal_and_dispatch(op, payload):
+    """
+    Journal a mutation, then flush the journal (including older pending writes).
+
+    Returns:
+        "committed" once this mutation reached Google Sheets without conflicts,
+        "queued" if it is safely journaled but Sheets is unavailable (it is synced
+        on the next save or restart - do not submit it again), "conflict", or
+        "failed" if Sheets rejected it for good (e.g. protected range, no permission)
+    """
+    entry = sheet_journal.append_entry(op, payload, author=st.session_state.get("name"))
+    conflicts_by_entry = {}
+    errors_by_entry = {}
+
+    def dispatch(pending):
+        try:
+            conflicts_by_entry[pending["id"]] = _apply_sheet_mutation(ws, pending)
+        except Exception as e:
+            errors_by_entry[pending["id"]] = e
+            raise
+        return conflicts_by_entry[pending["id"]]
+
+    try:
+        if sheet_journal.pending_entries():
+            ws = _open_write_worksheet()
+            sheet_journal.replay_pending(dispatch, retryable=sheets_quota.is_transient)
+    except Exception as e:
+        st.warning(f"Google Sheets is unavailable ({str(e)}). Your changes are saved locally and will be synced on the next save or restart.")
+        return "queued"
+
+    # Any write that reached the sheet (this one, older queued ones, or the
+    # part of a rejected one applied before the error) makes the snapshot stale
+    if conflicts_by_entry or not all(map(sheets_quota.is_transient, errors_by_entry.values())):
+        clear_sheet_cache()
+        st.session_state[WRITTEN_AT_KEY] = time.time()
+
+    error = errors_by_entry.get(entry["id"])
+    if error is not None and not sheets_quota.is_transient(error):
+        # Reported right here - no point keeping it for render_journal_conflicts
+        sheet_journal.resolve(entry["id"])
+        st.error(f"Google Sheets rejected your changes ({str(error)}), so they were not saved.")
+        return "failed"
+
+    if entry["id"] not in conflicts_by_entry:
+        st.warning("Your changes are saved locally and will be synced on the next save or restart.")
+        return "queued"
+
+    conflicts = conflicts_by_entry[entry["id"]]
+    if conflicts:
+        # Reported right here, so it does not need to wait in the journal
+        # (older entries' conflicts do - see render_journal_conflicts)
+        sheet_journal.resolve(entry["id"])
+        rows_text = ", ".join(str(r) for r in conflicts)
+        st.warning(f"Sheet row(s) {rows_text} were changed by someone else since you loaded them, so your edits to those rows were not saved. The latest data has been reloaded - please re-apply your changes.")
+        return "conflict"
+
+    return "committed"
+
+def update_google_sheet(updated_df):
+    """
+    Push edited data back to Google Sheets (Otter_Tasks worksheet)
+    SMART MODE: Only rows whose content changed since load are written (cell by cell),
+    after re-checking their version against the sheet. Rows changed by someone else
+    are reported as conflicts instead of being overwritten. New rows are appended.
+    Every write is journaled locally first so nothing is lost if Sheets fails mid-save.
+    """
+    try:
+        meta = get_sheet_meta(updated_df)
+        if meta is None or any(col not in updated_df.columns for col in meta.columns):
+            st.error("Cannot save: this table is no longer linked to the loaded sheet. Please reload the page and try again.")
+            return False
+
+        version_columns = [meta.column_sheet_index[col] for col in meta.columns]
+        rows_to_update = []
+        rows_to_append = []
+
+        for idx, row in zip(updated_df.index, updated_df[meta.columns].itertuples(index=False)):
+            values = [_cell_text(v) for v in row]
+
+            if idx not in meta.row_versions:
+                # Row did not exist in the snapshot - append it (skip fully blank rows)
+                if any(v.strip() for v in values):
+                    new_row = [""] * meta.sheet_width
+                    for position, value in zip(version_columns, values):
+                        new_row[position] = value
+                    rows_to_append.append(new_row)
+                continue
+
+            version = meta.row_versions[idx]
+            if _row_version(values) == version:
+                continue  # Untouched row
+
+            rows_to_update.append({
+                "row": int(idx) + 2,  # +1 for header, +1 for 1-based rows
+                "version": version,
+                "values": {str(position): value for position, value in zip(version_columns, values)},
+            })
+
+        if not rows_to_update and not rows_to_append:
+            return True
+
+        return _journal_and_dispatch("update_rows", {
+            "sheet_width": meta.sheet_width,
+            "version_columns": version_columns,
+            "column_names": list(clean_column_names(tuple(meta.columns))),
+            "rows": rows_to_update,
+            "appends": rows_to_append,
+        }) == "committed"
     except Exception as e:
         st.error(f"Error updating Google Sheet: {str(e)}")
         return False
 
+def _journal_entry_rows(entry, only_rows=None):
+    """Values a journaled write tried to save, one dict per sheet row (for display)"""
+    payload = entry["payload"]
+    if entry["op"] == "append_row":
+        return [{"Sheet row": "new", **{f"Column {i + 1}": v for i, v in enumerate(payload["row"])}}]
+
+    positions = payload.get("version_columns", [])
+    names = payload.get("column_names") or [str(p) for p in positions]
+    rows = [
+        {"Sheet row": r["row"], **{name: r["values"].get(str(p), "") for name, p in zip(names, positions)}}
+        for r in payload.get("rows", [])
+        if only_rows is None or r["row"] in only_rows
+    ]
+    if only_rows is None:
+        rows += [
+            {"Sheet row": "new", **{name: row[p] for name, p in zip(names, positions)}}
+            for row in payload.get("appends", [])
+        ]
+    return rows
+
+def _dismiss_journal_entry(entry):
+    if st.button("Dismiss", key=f"dismiss_conflict_{entry['id']}"):
+        sheet_journal.resolve(entry["id"])
+        st.rerun()
+
+def render_journal_conflicts(user_name):
+    """
+    Show the user edits of theirs that were queued (Sheets unavailable) and
+    could not be applied when synced later - because someone else changed
+    those rows in the meantime, or because Sheets rejected the write for good.
+    They stay in the journal until dismissed.
+    """
+    if not user_name:
+        return
+
+    for entry in sheet_journal.conflicted_entries(author=user_name):
+        saved_at = time.strftime('%b %d, %H:%M', time.localtime(entry["ts"]))
+        rows_text = ", ".join(str(r) for r in entry["conflict_rows"])
+        st.warning(f"Your changes saved locally on {saved_at} were synced, except sheet row(s) {rows_text}: someone else changed them in the meantime. Your values for those rows are below - please re-apply them.")
+        st.dataframe(pd.DataFrame(_journal_entry_rows(entry, entry["conflict_rows"])), hide_index=True)
+        _dismiss_journal_entry(entry)
+
+    for entry in sheet_journal.failed_entries(author=user_name):
+        saved_at = time.strftime('%b %d, %H:%M', time.localtime(entry["ts"]))
+        st.error(f"Your changes saved locally on {saved_at} could not be synced: Google Sheets rejected them ({entry['error']}). Your values are below - please re-apply them once the problem is fixed.")
+        st.dataframe(pd.DataFrame(_journal_entry_rows(entry)), hide_index=True)
+        _dismiss_journal_entry(entry)
+
+def append_task_row(row):
+    """
+    Append a single new task row to Google Sheets (journaled like every other write)
+
+    Returns:
+        "committed", "queued" (journaled while Sheets is unavailable - it will be
+        added on the next save or restart, so the form must not resubmit it),
+        "failed" if Sheets rejected it, or None if the row could not be journaled
+    """
+    try:
+        return _journal_and_dispatch("append_row", {"row": row})
+    except Exception as e:
+        st.error(f"Error adding task: {str(e)}")
+        return None
+
+# ============================================
+# PRINCIPAL-SCOPED VIEWS
+# ============================================
+# Rows each page shows a user, cached as row positions per snapshot version
+# (small to store and share across replicas) and applied with take().
+
+# Jess sees her own, Megan's and Justin's tasks
+TEAM_PATTERN = 'jess|megan|justin'
+DONE_STATUSES = ['done', 'complete', 'completed']
+
+def user_role(user_name):
+    """
+    "tea" (admin, sees everything), "jess" (her team) or "user" (own tasks only)
+    """
+    # Handle various spellings: Tea, Téa, Tēa, tea phillips, etc.
+    user_lower = (user_name or "").lower()
+    if "tea" in user_lower or "téa" in user_lower or "tēa" in user_lower:
+        return "tea"
+    if "jess" in user_lower:
+        return "jess"
+    return "user"
+
+def assignee_column(df):
+    """The column tasks are assigned by ("Assigned To", "assignee" or "Person"), or None"""
+    for name in ("Assigned To", "assignee", "Person"):
+        if has_column(df, name):
+            return get_column(df, name)
+    return None
+
+def _view_positions(df, view, user_name):
+    """Uncached body of scoped_view: row positions, or None if a needed column is missing"""
+    role = user_role(user_name)
+    assignee_col = assignee_column(df)
+    mask = pd.Series(True, index=df.index)
+
+    if role == "jess" and view == "team":
+        if assignee_col:
+            mask = df[assignee_col].str.lower().str.contains(TEAM_PATTERN, na=False, regex=True)
+    elif role != "tea":
+        if not assignee_col:
+            return None
+        mask = df[assignee_col].str.lower().str.contains(user_name.lower(), na=False, regex=False)
+
+    if view == "archive":
+        if not has_column(df, "Status"):
+            return None
+        status_col = get_column(df, "Status")
+        mask = mask & df[status_col].str.strip().str.lower().isin(DONE_STATUSES)
+
+    return np.flatnonzero(mask.to_numpy(dtype=bool, na_value=False))
+
+def scoped_view(df, view, user_name):
+    """
+    Rows of the snapshot a page shows to user_name (cached per snapshot version).
+
+    Args:
+        df: Snapshot from load_google_sheet
+        view: "team" (Overview / All Tasks), "personal" (My Tasks) or "archive" (done tasks)
+        user_name: User's full name
+
+    Returns:
+        The filtered DataFrame, or None if a column the view needs is missing
+    """
+    if user_role(user_name) == "tea" and view != "archive":
+        return df
+    positions = cache_backend.cached_view(
+        "scoped_view",
+        _frame_version(df),
+        (view, user_name),
+        lambda: _view_positions(df, view, user_name),
+    )
+    return None if positions is None else df.take(positions)
+
+def project_task_counts(df):
+    """
+    Tasks per project (lower-cased, stripped) for the "Tasks by Project" chart
+    (cached per snapshot version, see cache_backend)
+    """
+    def compute():
+        if df.empty or not has_column(df, "Project"):
+            return pd.Series(dtype="int64")
+        return df[get_column(df, "Project")].str.lower().str.strip().value_counts()
+
+    return cache_backend.cached_view("project_counts", _frame_version(df), (), compute)
+
+# ============================================
+# POST-LOGIN PREFETCH
+# ============================================
+# As soon as a user's first page has the snapshot, every other page's views
+# for that user are computed on a small thread pool. Pages ask the same
+# caches, so switching pages is a cache hit (or waits for the in-flight job).
+PREFETCH_WORKERS = int(os.environ.get("METAFLEX_PREFETCH_WORKERS", "4"))
+
+_prefetch_pool = ThreadPoolExecutor(max_workers=max(PREFETCH_WORKERS, 1), thread_name_prefix="metaflex-prefetch")
+_prefetched = set()  # (snapshot version, user) pairs already scheduled
+_prefetched_lock = threading.Lock()
+
+def _prefetch_jobs(df, user_name):
+    """The views each page computes for this user, as callables"""
+    role = user_role(user_name)
+
+    def team_views():
+        team_df = scoped_view(df, "team", user_name)
+        if team_df is None:
+            return
+        calculate_kpis(team_df, user_name, is_personal=(role == "user"))
+        if role != "user":
+            project_task_counts(team_df)
+
+    def personal_views():
+        personal_df = scoped_view(df, "personal", user_name)
+        if personal_df is not None and not personal_df.empty:
+            calculate_kpis(personal_df, user_name, is_personal=True)
+
+    def archive_views():
+        scoped_view(df, "archive", user_name)
+
+    jobs = [team_views, personal_views, archive_views]
+    if role == "tea":
+        jobs.append(lambda: calculate_executive_metrics(df))
+    return jobs
+
+def _run_prefetch_job(job, user_name):
+    try:
+        job()
+    except Exception as e:
+        print(f"⚠️ Prefetch failed for {user_name}: {str(e)}")
+
+def prefetch_user_views(df, user_name):
+    """
+    Schedule the user's page views (personal, team and archive rows, KPIs,
+    executive metrics, chart aggregates) on the prefetch pool - once per
+    snapshot version and user. Returns immediately.
+    """
+    if PREFETCH_WORKERS <= 0 or not user_name or df.empty:
+        return
+    version = _frame_version(df)
+    if version is None:
+        return
+
+    with _prefetched_lock:
+        if (version, user_name) in _prefetched:
+            return
+        if len(_prefetched) > 256:
+            _prefetched.clear()
+        _prefetched.add((version, user_name))
+
+    for job in _prefetch_jobs(df, user_name):
+        _prefetch_pool.submit(_run_prefetch_job, job, user_name)
+
 def calculate_kpis(df, user_name, is_personal=False):
     """
-    Calculate KPI metrics from filtered data
+    Calculate KPI metrics from filtered data (cached per snapshot version, see cache_backend)
 
     Args:
         df: DataFrame to calculate metrics from
         user_name: User's full name
         is_personal: If True, calculate only user's personal tasks
     """
+    return cache_backend.cached_view(
+        "kpis",
+        _frame_version(df),
+        (user_name, is_personal),
+        lambda: _compute_kpis(df, user_name, is_personal),
+    )
+
+def _compute_kpis(df, user_name, is_personal=False):
+    """Uncached body of calculate_kpis"""
     if df.empty:
         return {
             "my_open_tasks": 0,
@@ -343,7 +1188,8 @@ def calculate_kpis(df, user_name, is_personal=False):
         }
 
     # Normalize status values (case-insensitive)
-    df_copy = df.copy()
+    # Shallow, Copy-on-Write: only the normalized Status column is materialized
+    df_copy = df.copy(deep=False)
     status_col = get_column(df_copy, "Status")
     df_copy[status_col] = df_copy[status_col].str.strip().str.lower()
 
@@ -565,7 +1411,7 @@ def render_personal_kpi_section(kpis):
             </div>
         """, unsafe_allow_html=True)
 
-def render_charts_section(kpis, filtered_df, show_project_chart=True):
+def render_charts_section(kpis, filtered_df, show_project_chart=True, project_counts=None):
     """
     Render chart visualizations with generous spacing
     (All styling now in style.css)
@@ -574,6 +1420,7 @@ def render_charts_section(kpis, filtered_df, show_project_chart=True):
         kpis: Dictionary of KPI metrics
         filtered_df: Filtered dataframe for charts
         show_project_chart: If False, only show Task Completion Status (for regular users)
+        project_counts: Tasks per project if already computed (see project_task_counts)
     """
     # Single row - one or two columns depending on user type
     if show_project_chart:
@@ -586,23 +1433,8 @@ def render_charts_section(kpis, filtered_df, show_project_chart=True):
         # Use Streamlit container to keep everything together
         container1 = st.container()
         with container1:
+            use_styles("chart_cards")
             st.markdown("""
-                <style>
-                /* Target this specific column */
-                div[data-testid="column"]:nth-child(1) div[data-testid="stVerticalBlock"] {
-                    background: linear-gradient(135deg, #f5faf2 0%, #f8fbf8 100%) !important;
-                    border-radius: 12px !important;
-                    padding: 24px !important;
-                    border: 1px solid rgba(10, 75, 75, 0.1) !important;
-                    box-shadow: 0 2px 8px rgba(0, 0, 0, 0.04), 0 1px 3px rgba(0, 0, 0, 0.02) !important;
-                    transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1) !important;
-                }
-                div[data-testid="column"]:nth-child(1) div[data-testid="stVerticalBlock"]:hover {
-                    transform: translateY(-4px) !important;
-                    box-shadow: 0 8px 16px rgba(0, 0, 0, 0.08), 0 2px 6px rgba(0, 0, 0, 0.04) !important;
-                    border: 1px solid rgba(10, 75, 75, 0.2) !important;
-                }
-                </style>
                 <h3 style="text-align: left; margin: 0 0 20px 0; color: #0a4b4b; font-weight: 500; font-size: 1.0rem; font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;">Task Completion Status</h3>
             """, unsafe_allow_html=True)
 
@@ -664,27 +1496,14 @@ def render_charts_section(kpis, filtered_df, show_project_chart=True):
             # Use Streamlit container to keep everything together
             container2 = st.container()
             with container2:
+                use_styles("chart_cards")
                 st.markdown("""
-                    <style>
-                    /* Target this specific column */
-                    div[data-testid="column"]:nth-child(2) div[data-testid="stVerticalBlock"] {
-                        background: linear-gradient(135deg, #f5faf2 0%, #f8fbf8 100%) !important;
-                        border-radius: 12px !important;
-                        padding: 24px !important;
-                        border: 1px solid rgba(10, 75, 75, 0.1) !important;
-                        box-shadow: 0 2px 8px rgba(0, 0, 0, 0.04), 0 1px 3px rgba(0, 0, 0, 0.02) !important;
-                        transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1) !important;
-                    }
-                    div[data-testid="column"]:nth-child(2) div[data-testid="stVerticalBlock"]:hover {
-                        transform: translateY(-4px) !important;
-                        box-shadow: 0 8px 16px rgba(0, 0, 0, 0.08), 0 2px 6px rgba(0, 0, 0, 0.04) !important;
-                        border: 1px solid rgba(10, 75, 75, 0.2) !important;
-                    }
-                    </style>
                     <h3 style="text-align: left; margin: 0 0 20px 0; color: #0a4b4b; font-weight: 500; font-size: 1.0rem; font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;">Tasks by Project</h3>
                 """, unsafe_allow_html=True)
 
-                project_fig = create_project_breakdown_chart(filtered_df)
+                if project_counts is None:
+                    project_counts = project_task_counts(filtered_df)
+                project_fig = create_project_breakdown_chart(filtered_df, project_counts)
                 if project_fig:
                     st.plotly_chart(project_fig, use_container_width=True, config={
                         'displayModeBar': True,
@@ -698,7 +1517,172 @@ def render_charts_section(kpis, filtered_df, show_project_chart=True):
                         }
                     })
 
-def render_tasks_table(filtered_df, limit=10, hide_project_column=False, show_transcript_checked=False):
+# ============================================
+# DISPLAY FRAMES
+# ============================================
+# Tables and grids show a copy of the rows with clean column names and
+# emoji status labels. The copy is built once per (snapshot version, view,
+# column set) and served from cache_backend on later reruns.
+_COLUMN_SUFFIX = re.compile(r'__+.*$')
+
+# Status keywords -> label, checked in order (unrecognized values are "Open")
+STATUS_LABEL_RULES = {
+    "table": [
+        ("🟥 Open", ('open', 'not started', 'to do', 'todo')),
+        ("🟨 In Progress", ('working', 'in progress', 'started', 'ongoing')),
+        ("🟩 Done", ('done', 'complete', 'finished', 'closed')),
+    ],
+    "grid": [
+        ("🟥 Open", ('open', 'not started', 'to do', 'todo')),
+        ("🟨 In Progress", ('working', 'in progress', 'progress')),
+        ("🟩 Done", ('done', 'complete', 'closed')),
+    ],
+}
+
+@lru_cache(maxsize=64)
+def clean_column_names(columns):
+    """Display names for a tuple of columns (everything from __ onwards removed)"""
+    return tuple(_COLUMN_SUFFIX.sub('', str(col)) for col in columns)
+
+def _status_label(value, view):
+    status_str = str(value).strip().lower()
+    for label, words in STATUS_LABEL_RULES[view]:
+        if any(word in status_str for word in words):
+            return label
+    return "🟥 Open"
+
+def _progress_value(value):
+    try:
+        val_str = str(value).strip().replace('%', '')
+        if val_str == '' or val_str.lower() == 'nan':
+            return 0
+        return float(val_str)
+    except:
+        return 0
+
+def _progress_status_label(value):
+    val = _progress_value(value)
+    if val == 0:
+        return "🟥 Not Started"
+    elif val < 100:
+        return "🟨 In Progress"
+    return "🟩 Complete"
+
+def _progress_display_label(value):
+    val = _progress_value(value)
+    if val == 0:
+        return f"🔴 {int(val)}%"
+    elif val < 100:
+        return f"🟡 {int(val)}%"
+    return f"🟢 {int(val)}%"
+
+def _label_by_code(series, label):
+    """
+    Apply a scalar label function once per distinct value and broadcast it by
+    code: categorical columns already carry the codes, other columns are
+    factorized. Missing values (code -1) take the label of NaN.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes, uniques = series.cat.codes.to_numpy(), series.cat.categories
+    else:
+        codes, uniques = pd.factorize(series)
+    lookup = np.array([label(v) for v in uniques] + [label(np.nan)], dtype=object)
+    return lookup[codes]
+
+def _build_display_frame(df, view, columns):
+    """Uncached body of display_frame"""
+    data = {}
+    column_mapping = {}
+    for clean_col, col in zip(clean_column_names(columns), columns):
+        data[clean_col] = df[col].to_numpy(dtype=object)
+        column_mapping[clean_col] = col
+    display_df = pd.DataFrame(data)
+
+    def source(clean_col):
+        return df[column_mapping[clean_col]]
+
+    if view == "table":
+        # Status and Progress % are combined into a single Status dropdown
+        if "Status" in display_df.columns and "Progress %" in display_df.columns:
+            display_df["Status"] = _label_by_code(source("Status"), lambda v: _status_label(v, "table"))
+            display_df = display_df.drop(columns=["Progress %"])
+        elif "Progress %" in display_df.columns:
+            # Fallback: If only Progress % exists (no Status column)
+            display_df["Progress"] = _label_by_code(source("Progress %"), _progress_display_label)
+            display_df = display_df.drop(columns=["Progress %"])
+        return display_df, column_mapping
+
+    # Grid: Progress Status (editable squares) right after Status
+    if "Progress %" in display_df.columns:
+        display_df["Progress Status"] = _label_by_code(source("Progress %"), _progress_status_label)
+        cols = display_df.columns.tolist()
+        if "Status" in cols:
+            cols.remove("Progress Status")
+            cols.insert(cols.index("Status") + 1, "Progress Status")
+            display_df = display_df[cols]
+
+    if "Status" in display_df.columns:
+        display_df["Status"] = _label_by_code(source("Status"), lambda v: _status_label(v, "grid"))
+
+    # Snapshot row labels as row IDs, so edits map back to the right sheet rows
+    display_df.insert(0, "_row_id", df.index.to_numpy())
+    return display_df, column_mapping
+
+@st.cache_resource(max_entries=64)
+def _cached_display_frame(version, view, columns, _df):
+    """Display frames kept in-process as objects, keyed by _frame_version (not the frame)"""
+    return _build_display_frame(_df, view, columns)
+
+def display_frame(df, view, columns=None):
+    """
+    Display copy of df with clean column names, object columns and emoji
+    status labels (cached per snapshot version, view and column set).
+
+    Kept in this process rather than the shared cache tier: rebuilding a frame
+    is cheaper than unpickling one. The cached frame is shared by every session,
+    so callers must not mutate it.
+
+    Args:
+        df: Rows to display
+        view: "table" (render_tasks_table) or "grid" (render_editable_task_grid, adds _row_id)
+        columns: Actual columns of df to show, in order (default: all)
+
+    Returns:
+        (display DataFrame, {clean column name: actual column name})
+    """
+    columns = tuple(df.columns if columns is None else columns)
+    version = _frame_version(df)
+    if version is None:
+        return _build_display_frame(df, view, columns)
+    return _cached_display_frame(version, view, columns, df)
+
+def table_display_columns(df, hide_project_column=False, show_transcript_checked=False):
+    """
+    Actual columns of df shown by render_tasks_table, in display order
+    """
+    display_columns = []
+
+    # Only add Transcript ID column if "Show Transcript" is checked (passed from parent)
+    if show_transcript_checked:
+        for transcript_name in ["Transcript ID", "Transcript Number", "Transcript #", "ID", "Transcript"]:
+            if has_column(df, transcript_name):
+                display_columns.append(get_column(df, transcript_name))
+                break
+
+    # Add other columns (including Date Assigned, Notes, excluding Project if hide_project_column is True)
+    # Note: We'll combine Status and Progress % into a single column, so we'll handle them separately
+    columns_to_add = ["Task", "Person", "Status", "Progress %", "Date Assigned", "Due Date", "Notes"]
+    if not hide_project_column:
+        columns_to_add.insert(3, "Project")  # Add Project after Status
+
+    for col in columns_to_add:
+        if has_column(df, col):
+            display_columns.append(get_column(df, col))
+
+    return display_columns
+
+@fragment
+def render_tasks_table(filtered_df, limit=10, hide_project_column=False, show_transcript_checked=False, ctx=None):
     """
     Render tasks table with color-coded progress bars
 
@@ -707,45 +1691,18 @@ def render_tasks_table(filtered_df, limit=10, hide_project_column=False, show_tr
         limit: Maximum number of rows to show
         hide_project_column: If True, don't show the Project column (for project-specific views)
         show_transcript_checked: If True, show the Transcript ID column
+        ctx: Optional RenderContext of the page run (shares column resolution)
     """
     if not filtered_df.empty:
-        # Select and order columns for display using helper function
-        display_columns = []
-
-        # Only add Transcript ID column if "Show Transcript" is checked (passed from parent)
-        transcript_col_found = False
-        if show_transcript_checked:
-            for transcript_name in ["Transcript ID", "Transcript Number", "Transcript #", "ID", "Transcript"]:
-                if has_column(filtered_df, transcript_name):
-                    display_columns.append(get_column(filtered_df, transcript_name))
-                    transcript_col_found = True
-                    break
-
-        # Add other columns (including Date Assigned, Notes, excluding Project if hide_project_column is True)
-        # Note: We'll combine Status and Progress % into a single column, so we'll handle them separately
-        columns_to_add = ["Task", "Person", "Status", "Progress %", "Date Assigned", "Due Date", "Notes"]
-        if not hide_project_column:
-            columns_to_add.insert(3, "Project")  # Add Project after Status
-
-        for col in columns_to_add:
-            if has_column(filtered_df, col):
-                display_columns.append(get_column(filtered_df, col))
+        # Select and order columns for display (resolved once per rerun when a context is passed)
+        if ctx is not None:
+            display_columns = ctx.table_columns(hide_project_column, show_transcript_checked)
+        else:
+            display_columns = table_display_columns(filtered_df, hide_project_column, show_transcript_checked)
 
         if display_columns:
-            table_df = filtered_df[display_columns].head(limit).copy()
-
-            # Remove suffix patterns like __N, ___N, __N__N__, __... from column names
-            # Use a fresh DataFrame to ensure clean column names
-            clean_data = {}
-            column_mapping = {}
-            for col in table_df.columns:
-                # Remove everything from __ onwards (two or more underscores)
-                clean_col = re.sub(r'__+.*$', '', str(col))
-                clean_data[clean_col] = table_df[col].values
-                column_mapping[clean_col] = col
-
-            # Create new DataFrame with clean column names
-            clean_table_df = pd.DataFrame(clean_data)
+            # Clean names and status labels come from the cached display frame
+            clean_table_df, column_mapping = display_frame(filtered_df.head(limit), "table", display_columns)
 
             # Configure column settings for wrapping and progress bars
             column_config = {
@@ -788,29 +1745,8 @@ def render_tasks_table(filtered_df, limit=10, hide_project_column=False, show_tr
                 )
             }
 
-            # Combine Status and Progress % into a single column with dropdown selector
-            if "Status" in clean_table_df.columns and "Progress %" in clean_table_df.columns:
-                # Normalize status values to match dropdown options
-                def normalize_status(status):
-                    status_str = str(status).strip().lower()
-
-                    # Map various status values to our three standard options
-                    if any(word in status_str for word in ['open', 'not started', 'to do', 'todo']):
-                        return "🟥 Open"
-                    elif any(word in status_str for word in ['working', 'in progress', 'started', 'ongoing']):
-                        return "🟨 In Progress"
-                    elif any(word in status_str for word in ['done', 'complete', 'finished', 'closed']):
-                        return "🟩 Done"
-                    else:
-                        # Default to Open if status is unrecognized
-                        return "🟥 Open"
-
-                # Apply normalization to Status column
-                clean_table_df["Status"] = clean_table_df["Status"].apply(normalize_status)
-
-                # Remove the Progress % column as it's now combined with Status
-                clean_table_df = clean_table_df.drop(columns=["Progress %"])
-
+            # Status and Progress % were combined into a single Status column by display_frame
+            if "Status" in column_mapping and "Progress %" in column_mapping:
                 # Configure Status as a dropdown with the three color-coded options
                 column_config["Status"] = st.column_config.SelectboxColumn(
                     "Status",
@@ -819,30 +1755,7 @@ def render_tasks_table(filtered_df, limit=10, hide_project_column=False, show_tr
                     options=["🟥 Open", "🟨 In Progress", "🟩 Done"],
                     required=True
                 )
-            elif "Progress %" in clean_table_df.columns:
-                # Fallback: If only Progress % exists (no Status column)
-                progress_values = []
-                for val in clean_table_df["Progress %"]:
-                    try:
-                        val_str = str(val).strip().replace('%', '')
-                        if val_str == '' or val_str.lower() == 'nan':
-                            progress_values.append(0)
-                        else:
-                            progress_values.append(float(val_str))
-                    except:
-                        progress_values.append(0)
-
-                def create_progress_display(value):
-                    if value == 0:
-                        return f"🔴 {int(value)}%"
-                    elif value < 100:
-                        return f"🟡 {int(value)}%"
-                    else:
-                        return f"🟢 {int(value)}%"
-
-                clean_table_df["Progress"] = [create_progress_display(val) for val in progress_values]
-                clean_table_df = clean_table_df.drop(columns=["Progress %"])
-
+            elif "Progress" in clean_table_df.columns:
                 column_config["Progress"] = st.column_config.TextColumn(
                     "Progress",
                     help="Task completion progress",
@@ -855,166 +1768,20 @@ def render_tasks_table(filtered_df, limit=10, hide_project_column=False, show_tr
             """, unsafe_allow_html=True)
 
             # Add MetaFlex premium light theme styling for tables (both dataframe and data_editor)
-            st.markdown("""
-                <style>
-                /* Premium SaaS light theme styling for dataframes AND data_editor */
-                div[data-testid="stDataFrame"],
-                div[data-testid="stDataFrame"] > div,
-                div[data-testid="stDataFrame"] > div > div,
-                div[data-testid="stDataFrame"] iframe,
-                [data-testid="stDataFrame"],
-                div[data-testid="data-editor"],
-                div[data-testid="data-editor"] > div,
-                [data-testid="data-editor"] {
-                    background: #ffffff !important;
-                    border-radius: 8px !important;
-                    padding: 0 !important;
-                    border: 1px solid #e8eaed !important;
-                    box-shadow: 0 1px 3px rgba(0, 0, 0, 0.04) !important;
-                    overflow: hidden !important;
-                }
-
-                /* Target ALL table elements */
-                div[data-testid="stDataFrame"] table,
-                div[data-testid="stDataFrame"] thead,
-                div[data-testid="stDataFrame"] tbody,
-                [data-testid="stDataFrame"] table,
-                div[data-testid="data-editor"] table,
-                div[data-testid="data-editor"] thead,
-                div[data-testid="data-editor"] tbody,
-                table {
-                    background: transparent !important;
-                }
+            use_styles("tasks_table")
 
-                /* Style the table header - premium light theme */
-                div[data-testid="stDataFrame"] thead tr th,
-                div[data-testid="stDataFrame"] th,
-                div[data-testid="data-editor"] thead tr th,
-                div[data-testid="data-editor"] th,
-                [data-testid="stDataFrame"] thead tr th,
-                thead tr th,
-                th {
-                    background: #f9fafb !important;
-                    color: #374151 !important;
-                    font-weight: 600 !important;
-                    border-bottom: 1px solid #e5e7eb !important;
-                    border-top: none !important;
-                    padding: 16px 12px !important;
-                    text-transform: uppercase !important;
-                    font-size: 0.7rem !important;
-                    letter-spacing: 0.05em !important;
-                }
+            # Editable data table
+            edited_df = st.data_editor(
+                clean_table_df,
+                use_container_width=True,
+                hide_index=True,
+                column_config=column_config,
+                num_rows="fixed",
+                key=f"project_table_{hash(str(filtered_df.iloc[0].to_dict()) if len(filtered_df) > 0 else 'empty')}"
+            )
 
-                /* Alternate row colors - subtle light gray */
-                div[data-testid="stDataFrame"] tbody tr:nth-child(even),
-                div[data-testid="stDataFrame"] tbody tr:nth-child(even) td,
-                [data-testid="stDataFrame"] tbody tr:nth-child(even),
-                tbody tr:nth-child(even),
-                tbody tr:nth-child(even) td {
-                    background: #fafbfc !important;
-                    background-color: #fafbfc !important;
-                }
-
-                div[data-testid="stDataFrame"] tbody tr:nth-child(odd),
-                div[data-testid="stDataFrame"] tbody tr:nth-child(odd) td,
-                [data-testid="stDataFrame"] tbody tr:nth-child(odd),
-                tbody tr:nth-child(odd),
-                tbody tr:nth-child(odd) td {
-                    background: #ffffff !important;
-                    background-color: #ffffff !important;
-                }
-
-                /* Hover effect - subtle teal accent */
-                div[data-testid="stDataFrame"] tbody tr:hover,
-                div[data-testid="stDataFrame"] tbody tr:hover td,
-                [data-testid="stDataFrame"] tbody tr:hover,
-                div[data-testid="data-editor"] tbody tr:hover,
-                div[data-testid="data-editor"] tbody tr:hover td,
-                tbody tr:hover,
-                tbody tr:hover td {
-                    background: rgba(10, 75, 75, 0.02) !important;
-                    background-color: rgba(10, 75, 75, 0.02) !important;
-                    transition: all 0.2s ease !important;
-                }
-
-                /* Cell styling - dark gray text on light background */
-                div[data-testid="stDataFrame"] tbody tr td,
-                div[data-testid="stDataFrame"] td,
-                [data-testid="stDataFrame"] tbody tr td,
-                tbody tr td,
-                td {
-                    border-bottom: 1px solid #f3f4f6 !important;
-                    border-left: none !important;
-                    border-right: none !important;
-                    padding: 14px 12px !important;
-                    color: #2d3748 !important;
-                }
-
-                /* Scrollbar styling for light theme */
-                /* Translucent dark MetaFlex teal scrollbars for tables */
-                div[data-testid="stDataFrame"] ::-webkit-scrollbar,
-                div[data-testid="data-editor"] ::-webkit-scrollbar {
-                    width: 8px !important;
-                    height: 8px !important;
-                }
-
-                div[data-testid="stDataFrame"] ::-webkit-scrollbar-track,
-                div[data-testid="data-editor"] ::-webkit-scrollbar-track {
-                    background: rgba(10, 75, 75, 0.08) !important;
-                    border-radius: 4px !important;
-                }
-
-                div[data-testid="stDataFrame"] ::-webkit-scrollbar-thumb,
-                div[data-testid="data-editor"] ::-webkit-scrollbar-thumb {
-                    background: rgba(10, 75, 75, 0.4) !important;
-                    border-radius: 4px !important;
-                }
-
-                div[data-testid="stDataFrame"] ::-webkit-scrollbar-thumb:hover,
-                div[data-testid="data-editor"] ::-webkit-scrollbar-thumb:hover {
-                    background: rgba(10, 75, 75, 0.6) !important;
-                }
-                </style>
-            """, unsafe_allow_html=True)
-
-            # Editable data table
-            edited_df = st.data_editor(
-                clean_table_df,
-                use_container_width=True,
-                hide_index=True,
-                column_config=column_config,
-                num_rows="fixed",
-                key=f"project_table_{hash(str(filtered_df.iloc[0].to_dict()) if len(filtered_df) > 0 else 'empty')}"
-            )
-
-            # Custom button styling - soft grey with dark teal text, rounded corners, translucent
-            st.markdown("""
-                <style>
-                /* Target all Streamlit buttons more aggressively */
-                div[data-testid="column"] button,
-                div[data-testid="column"] button[kind="primary"],
-                div[data-testid="column"] button[kind="secondary"],
-                .stButton > button,
-                .stDownloadButton > button {
-                    background: rgba(229, 231, 235, 0.7) !important;
-                    color: #0a4b4b !important;
-                    border: 1px solid rgba(10, 75, 75, 0.2) !important;
-                    border-radius: 12px !important;
-                    font-weight: 500 !important;
-                    transition: all 0.2s ease !important;
-                }
-
-                div[data-testid="column"] button:hover,
-                div[data-testid="column"] button[kind="primary"]:hover,
-                div[data-testid="column"] button[kind="secondary"]:hover,
-                .stButton > button:hover,
-                .stDownloadButton > button:hover {
-                    background: rgba(229, 231, 235, 0.9) !important;
-                    border: 1px solid rgba(10, 75, 75, 0.4) !important;
-                    box-shadow: 0 2px 8px rgba(10, 75, 75, 0.15) !important;
-                }
-                </style>
-            """, unsafe_allow_html=True)
+            # Custom button styling - soft grey with dark teal text, rounded corners, translucent
+            use_styles("table_buttons")
 
             # Save and Export buttons - Centered
             _, save_col, export_col, _ = st.columns([1.5, 1, 1, 1.5])
@@ -1024,6 +1791,8 @@ def render_tasks_table(filtered_df, limit=10, hide_project_column=False, show_tr
                     # We need to reverse the cleaning process and update the original df
                     with st.spinner("Syncing to Google Sheets..."):
                         try:
+                            filtered_df = editable_frame(filtered_df)
+
                             # Update the original dataframe with edited values
                             for clean_col, orig_col in column_mapping.items():
                                 if clean_col in edited_df.columns:
@@ -1078,6 +1847,193 @@ def render_tasks_table(filtered_df, limit=10, hide_project_column=False, show_tr
     else:
         st.info("No tasks to display.")
 
+TRANSCRIPT_GRID_COLUMNS = ["Transcript ID", "Transcript Number", "Transcript #", "Transcript"]
+
+def grid_hidden_columns(key_prefix, show_transcript_id):
+    """
+    Display-frame columns the task grid never shows. They are not sent to the
+    client at all (see render_editable_task_grid) and are rejoined by _row_id on save.
+    """
+    # Status: replaced by Progress Status with colored squares
+    # Project: project name is in the heading
+    # Progress %: derived from Progress Status on save
+    hidden = {"Status", "Project", "Progress %"}
+    # Transcript ID column - hidden unless the checkbox is checked
+    if not show_transcript_id:
+        hidden.update(TRANSCRIPT_GRID_COLUMNS)
+    # Person column - hidden on My Tasks page for everyone (including Tea)
+    # Only shown on All Tasks page where Tea manages all users
+    if key_prefix == "my_tasks_":
+        hidden.add("Person")
+    return hidden
+
+@lru_cache(maxsize=64)
+def _build_task_grid_options(schema, is_tea, key_prefix, show_transcript_id):
+    """Uncached body of task_grid_options (schema: ((column, dtype), ...) of the display frame)"""
+    schema_df = pd.DataFrame({col: pd.Series(dtype=dtype) for col, dtype in schema})
+
+    # Configure AgGrid - DISABLE pagination to show all on one page
+    gb = GridOptionsBuilder.from_dataframe(schema_df)
+    gb.configure_pagination(enabled=False)  # Disable pagination
+    # The paged All Tasks grid only holds one page of rows: sorting/filtering
+    # there would only act on that page, so it's done on the server instead
+    client_query = key_prefix != ""
+    gb.configure_default_column(editable=True, filter=client_query, sortable=client_query, resizable=True)
+
+    # Hide the internal row ID column
+    gb.configure_column("_row_id", hide=True)
+
+    # Configure specific columns using clean names
+    # (hidden columns are not in the schema, see grid_hidden_columns)
+    # Date columns - configure for proper sorting
+    if "Date Assigned" in schema_df.columns:
+        gb.configure_column("Date Assigned", editable=True, type=["customDateTimeFormat"], custom_format_string='MM/dd/yyyy')
+
+    if "Due Date" in schema_df.columns:
+        gb.configure_column("Due Date", editable=True, type=["customDateTimeFormat"], custom_format_string='MM/dd/yyyy')
+
+    if "Task" in schema_df.columns:
+        gb.configure_column("Task", editable=True)
+
+    # Transcript ID column - read-only when shown
+    for transcript_col_name in TRANSCRIPT_GRID_COLUMNS:
+        if transcript_col_name in schema_df.columns:
+            gb.configure_column(transcript_col_name, editable=False)
+
+    # Person column - only Tea reassigns tasks
+    if "Person" in schema_df.columns:
+        gb.configure_column("Person", editable=is_tea)
+
+    # Priority column - editable dropdown for everyone with green color coding
+    if "Priority" in schema_df.columns:
+        # Define cell style function for priority colors
+        priority_cell_style = {
+            'styleConditions': [
+                {
+                    'condition': 'params.value === "High"',
+                    'style': {'backgroundColor': '#39ff14', 'color': '#064e3b', 'fontWeight': '600'}
+                },
+                {
+                    'condition': 'params.value === "Medium"',
+                    'style': {'backgroundColor': '#4ade80', 'color': '#ffffff', 'fontWeight': '600'}
+                },
+                {
+                    'condition': 'params.value === "Low"',
+                    'style': {'backgroundColor': '#0a4b4b', 'color': '#ffffff', 'fontWeight': '600'}
+                }
+            ]
+        }
+
+        # Everyone can edit Priority on My Tasks, but only Tea on All Tasks
+        is_editable = (key_prefix == "my_tasks_") or is_tea
+
+        gb.configure_column(
+            "Priority",
+            editable=is_editable,
+            cellEditor='agSelectCellEditor',
+            cellEditorParams={
+                'values': ['High', 'Medium', 'Low']
+            },
+            width=120,
+            headerClass='priority-header'
+        )
+
+    # Progress Status - editable dropdown with the three options (SQUARES)
+    if "Progress Status" in schema_df.columns:
+        gb.configure_column(
+            "Progress Status",
+            editable=True,
+            cellEditor='agSelectCellEditor',
+            cellEditorParams={
+                'values': ['🟥 Not Started', '🟨 In Progress', '🟩 Complete']
+            },
+            width=180,
+            headerClass='progress-status-header'
+        )
+
+    # Set getRowId using GridOptionsBuilder to avoid unsafe JavaScript
+    gb.configure_grid_options(getRowNodeId='_row_id')
+
+    return gb.build()
+
+def task_grid_options(display_df, is_tea, key_prefix, show_transcript_id):
+    """
+    AgGrid gridOptions for render_editable_task_grid. They depend only on the
+    display frame's schema, the user's role/page (is_tea, key_prefix) and
+    show_transcript_id, so they are built once per combination and reused.
+    Returns a copy - AgGrid writes into the dict it is given.
+    """
+    schema = tuple((str(col), str(dtype)) for col, dtype in display_df.dtypes.items())
+    return copy.deepcopy(_build_task_grid_options(schema, is_tea, key_prefix, show_transcript_id))
+
+# ============================================
+# ALL TASKS GRID PAGING
+# ============================================
+# The All Tasks grid only receives one page of rows. Filtering, sorting and
+# slicing happen here on the snapshot; filter results and per-column sort
+# orders are row positions cached per snapshot version (see cache_backend).
+GRID_PAGE_SIZE = int(os.environ.get("METAFLEX_GRID_PAGE_SIZE", "100"))
+GRID_PAGE_SIZES = sorted({50, 100, 250, 500, GRID_PAGE_SIZE})
+GRID_SORT_COLUMNS = ["Due Date", "Date Assigned", "Priority", "Status", "Project", "Person", "Task"]
+PRIORITY_ORDER = {"high": 0, "medium": 1, "low": 2}
+
+def _grid_filter_mask(df, project, search):
+    """Uncached body of grid_row_positions' filter step"""
+    mask = np.ones(len(df), dtype=bool)
+    if project != "All Projects" and has_column(df, "Project"):
+        mask &= (df[get_column(df, "Project")] == project).to_numpy(dtype=bool, na_value=False)
+    if search:
+        # One vectorized pass per column instead of a Python call per row
+        hits = np.zeros(len(df), dtype=bool)
+        for col in df.columns:
+            hits |= df[col].astype(str).str.contains(search, case=False, na=False, regex=False).to_numpy(dtype=bool)
+        mask &= hits
+    return mask
+
+def _grid_sort_order(df, column, descending):
+    """Uncached body of grid_row_positions' sort step: all row positions, missing values last"""
+    values = df[get_column(df, column)]
+    if column in ("Due Date", "Date Assigned"):
+        key = pd.to_datetime(values.astype(object), errors="coerce", format="mixed")
+    elif column == "Priority":
+        key = _per_value(values, lambda s: s.str.strip().str.lower().map(PRIORITY_ORDER))
+    else:
+        key = _per_value(values, lambda s: s.str.strip().str.lower().replace("", np.nan))
+    key = pd.Series(key).reset_index(drop=True)
+    return key.sort_values(ascending=not descending, na_position="last", kind="stable").index.to_numpy()
+
+def grid_row_positions(df, project="All Projects", search="", sort_by=None, descending=False):
+    """
+    Row positions of df for the All Tasks grid, filtered and sorted server-side.
+
+    Args:
+        df: Rows the user may see (a view of the snapshot)
+        project: Project to keep, or "All Projects"
+        search: Case-insensitive keyword matched against every column
+        sort_by: Clean column name from GRID_SORT_COLUMNS, or None for sheet order
+        descending: Reverse the sort
+
+    Returns:
+        numpy array of positions into df, in display order
+    """
+    version = _frame_version(df)
+    search = (search or "").strip()
+    mask = cache_backend.cached_view(
+        "grid_filter", version, (project, search),
+        lambda: _grid_filter_mask(df, project, search),
+    )
+    if not sort_by or not has_column(df, sort_by):
+        return np.flatnonzero(mask)
+    order = cache_backend.cached_view(
+        "grid_sort", version, (sort_by, descending),
+        lambda: _grid_sort_order(df, sort_by, descending),
+    )
+    return order[mask[order]]
+
+def _step_grid_page(key, step):
+    st.session_state[key] = st.session_state.get(key, 0) + step
+
+@fragment
 def render_editable_task_grid(df, current_user, is_tea=False, key_prefix="", show_title=True, show_transcript_id=False):
     """
     Render editable AgGrid for task management
@@ -1092,7 +2048,7 @@ def render_editable_task_grid(df, current_user, is_tea=False, key_prefix="", sho
     """
     # Filter based on user permissions
     if is_tea:
-        visible_df = df.copy()  # Téa sees all tasks
+        visible_df = df  # Téa sees all tasks
         section_title = "## All Task Management"
         section_caption = "Edit any field directly. Then commit to Google Sheets by pressing the button 'Send to Google Sheets'."
     else:
@@ -1123,58 +2079,10 @@ def render_editable_task_grid(df, current_user, is_tea=False, key_prefix="", sho
     st.markdown("<br>", unsafe_allow_html=True)
 
     # Add CSS to highlight Progress Status column and Priority column
-    st.markdown("""
-        <style>
-        /* Highlight Progress Status header */
-        .ag-header-cell.progress-status-header {
-            background-color: #fbbf24 !important;
-            font-weight: bold !important;
-        }
-        /* Make Progress Status cells stand out */
-        .ag-cell[col-id="Progress Status"] {
-            background-color: rgba(251, 191, 36, 0.1) !important;
-            font-weight: 600 !important;
-            cursor: pointer !important;
-        }
-        .ag-cell[col-id="Progress Status"]:hover {
-            background-color: rgba(251, 191, 36, 0.2) !important;
-        }
-
-        /* Priority column styling with green shades */
-        .ag-header-cell.priority-header {
-            background-color: #0a4b4b !important;
-            color: white !important;
-            font-weight: bold !important;
-        }
-
-        /* High Priority - Neon Green */
-        .ag-cell[col-id="Priority"][aria-colindex] {
-            font-weight: 600 !important;
-            cursor: pointer !important;
-        }
-
-        /* Apply colors based on cell content */
-        .ag-cell[col-id="Priority"]:has-text("High") {
-            background-color: #39ff14 !important;
-            color: #064e3b !important;
-        }
-
-        /* Medium Priority - Medium Green */
-        .ag-cell[col-id="Priority"]:has-text("Medium") {
-            background-color: #4ade80 !important;
-            color: #ffffff !important;
-        }
-
-        /* Low Priority - Dark Teal */
-        .ag-cell[col-id="Priority"]:has-text("Low") {
-            background-color: #0a4b4b !important;
-            color: #ffffff !important;
-        }
-        </style>
-    """, unsafe_allow_html=True)
+    use_styles("task_grid")
 
     # Only show filters for "All Task Management" (when key_prefix is empty)
-    filtered_df = visible_df.copy()
+    filtered_df = visible_df
 
     if key_prefix == "":
         # NOTE: Archive filtering is now handled in all_tasks_page.py
@@ -1196,23 +2104,45 @@ def render_editable_task_grid(df, current_user, is_tea=False, key_prefix="", sho
             project_filter = st.selectbox("🔍 Filter by Project", options=project_options, key=f"{key_prefix}_project_filter")
 
         with col2:
-            search_term = st.text_input("🔎 Search Tasks", placeholder="Search by keywords...", key=f"{key_prefix}_search_tasks")
+            search_term = st.text_input("🔎 Search Tasks", placeholder="Search by exact text (no wildcards)...", key=f"{key_prefix}_search_tasks")
+
+        # Server-side sort (the grid only holds the current page, so sorting there
+        # would only reorder that page)
+        sort_options = ["Sheet order"] + [name for name in GRID_SORT_COLUMNS if has_column(visible_df, name)]
+        col3, col4, col5 = st.columns([2, 1, 1])
+        with col3:
+            sort_by = st.selectbox("↕️ Sort by", options=sort_options, key=f"{key_prefix}_sort_by")
+        with col4:
+            page_size = st.selectbox("Rows per page", options=GRID_PAGE_SIZES, index=GRID_PAGE_SIZES.index(GRID_PAGE_SIZE), key=f"{key_prefix}_page_size")
+        with col5:
+            st.markdown("<div style='height: 1.9rem;'></div>", unsafe_allow_html=True)
+            descending = st.checkbox("Descending", key=f"{key_prefix}_sort_desc")
 
         # Check if filters are active
         filters_active = project_filter != "All Projects" or (search_term and search_term.strip() != "")
 
-        # Apply filters
-        if project_filter != "All Projects" and has_column(filtered_df, "Project"):
-            project_col = get_column(filtered_df, "Project")
-            filtered_df = filtered_df[filtered_df[project_col] == project_filter]
+        # Apply filters and sort on the server (cached row positions per snapshot version)
+        positions = grid_row_positions(
+            visible_df,
+            project=project_filter,
+            search=search_term,
+            sort_by=None if sort_by == "Sheet order" else sort_by,
+            descending=descending,
+        )
+        matched_count = len(positions)
 
-        # Apply keyword search
-        if search_term:
-            search_mask = filtered_df.astype(str).apply(
-                lambda row: row.str.contains(search_term, case=False, na=False).any(),
-                axis=1
-            )
-            filtered_df = filtered_df[search_mask]
+        # Back to the first page whenever the query changes
+        page_key = f"{key_prefix}_grid_page"
+        query = (project_filter, search_term, sort_by, descending, page_size)
+        if st.session_state.get(f"{key_prefix}_grid_query") != query:
+            st.session_state[f"{key_prefix}_grid_query"] = query
+            st.session_state[page_key] = 0
+        page_count = max((matched_count + page_size - 1) // page_size, 1)
+        page = min(max(st.session_state.get(page_key, 0), 0), page_count - 1)
+        st.session_state[page_key] = page
+
+        # Only the current page of rows is sent to the grid
+        filtered_df = visible_df.take(positions[page * page_size:(page + 1) * page_size])
 
         # Show filter indicator if filters are active
         if filters_active:
@@ -1235,182 +2165,49 @@ def render_editable_task_grid(df, current_user, is_tea=False, key_prefix="", sho
                     font-weight: 600;
                     box-shadow: 0 2px 4px rgba(10, 75, 75, 0.1);
                 '>
-                    🔍 Active Filters: {filter_text} • Showing {len(filtered_df)} of {len(visible_df)} tasks
+                    🔍 Active Filters: {filter_text} • Showing {matched_count} of {len(visible_df)} tasks
                 </div>
             """, unsafe_allow_html=True)
 
+        # Page navigation
+        if page_count > 1:
+            prev_col, info_col, next_col = st.columns([1, 2, 1])
+            with prev_col:
+                st.button("◀ Previous", key=f"{key_prefix}_prev_page", disabled=page == 0,
+                          on_click=_step_grid_page, args=(page_key, -1), width='stretch')
+            with info_col:
+                first_row = page * page_size + 1
+                last_row = min((page + 1) * page_size, matched_count)
+                st.markdown(
+                    f"<div style='text-align: center; color: #0a4b4b; font-weight: 600; padding-top: 0.5rem;'>"
+                    f"Page {page + 1} of {page_count} • Tasks {first_row}-{last_row} of {matched_count}</div>",
+                    unsafe_allow_html=True,
+                )
+            with next_col:
+                st.button("Next ▶", key=f"{key_prefix}_next_page", disabled=page >= page_count - 1,
+                          on_click=_step_grid_page, args=(page_key, 1), width='stretch')
+
         st.markdown("<br>", unsafe_allow_html=True)
 
     if filtered_df.empty:
         st.info("No tasks to display with current filters.")
         return df
 
-    # Create a display copy with clean column names (remove ___N suffix)
-    # Build a completely new DataFrame with clean column names
-    clean_data = {}
-    clean_column_mapping = {}  # Map clean names back to original names with suffix
-
-    for col in filtered_df.columns:
-        # Remove everything from __ onwards (two or more underscores)
-        clean_col = re.sub(r'__+.*$', '', str(col))
-        clean_data[clean_col] = filtered_df[col].values
-        clean_column_mapping[clean_col] = col
-
-    display_df = pd.DataFrame(clean_data)
-
-    # Transform Progress % to simple status icons for easy editing
-    if "Progress %" in display_df.columns:
-        def get_progress_status(value):
-            try:
-                # Convert to numeric
-                val_str = str(value).strip().replace('%', '')
-                if val_str == '' or val_str.lower() == 'nan':
-                    val = 0
-                else:
-                    val = float(val_str)
-            except:
-                val = 0
-
-            # Determine status based on progress - using SQUARES
-            if val == 0:
-                return "🟥 Not Started"
-            elif val < 100:
-                return "🟨 In Progress"
-            else:
-                return "🟩 Complete"
-
-        display_df["Progress Status"] = display_df["Progress %"].apply(get_progress_status)
-        # Keep Progress % for reference but we'll use Progress Status for editing
-
-        # Reorder columns to put Progress Status right after Status
-        cols = display_df.columns.tolist()
-        if "Progress Status" in cols and "Status" in cols:
-            # Remove Progress Status from its current position
-            cols.remove("Progress Status")
-            # Find Status column index and insert Progress Status after it
-            status_idx = cols.index("Status")
-            cols.insert(status_idx + 1, "Progress Status")
-            display_df = display_df[cols]
-
-    # Transform Status column to include colored squares (same as in render_tasks_table)
-    if "Status" in display_df.columns:
-        def normalize_status(status):
-            status_str = str(status).strip().lower()
-
-            # Map various status values to our three standard options
-            if any(word in status_str for word in ['open', 'not started', 'to do', 'todo']):
-                return "🟥 Open"
-            elif any(word in status_str for word in ['working', 'in progress', 'progress']):
-                return "🟨 In Progress"
-            elif any(word in status_str for word in ['done', 'complete', 'closed']):
-                return "🟩 Done"
-            else:
-                # Default to Open if status is unrecognized
-                return "🟥 Open"
-
-        # Apply normalization to Status column
-        display_df["Status"] = display_df["Status"].apply(normalize_status)
-
-    # Add unique row IDs for proper AG-Grid tracking
-    display_df = display_df.reset_index(drop=False)
-    display_df = display_df.rename(columns={'index': '_row_id'})
-
-    # Configure AgGrid - DISABLE pagination to show all on one page
-    gb = GridOptionsBuilder.from_dataframe(display_df)
-    gb.configure_pagination(enabled=False)  # Disable pagination
-    gb.configure_default_column(editable=True, filter=True, sortable=True, resizable=True)
-
-    # Hide the internal row ID column
-    gb.configure_column("_row_id", hide=True)
-
-    # Configure specific columns using clean names
-    # Status column - hide it (we use Progress Status with colored squares instead)
-    if "Status" in display_df.columns:
-        gb.configure_column("Status", hide=True, editable=False)  # Hidden
-
-    # Date columns - configure for proper sorting
-    if "Date Assigned" in display_df.columns:
-        gb.configure_column("Date Assigned", editable=True, type=["customDateTimeFormat"], custom_format_string='MM/dd/yyyy')
-
-    if "Due Date" in display_df.columns:
-        gb.configure_column("Due Date", editable=True, type=["customDateTimeFormat"], custom_format_string='MM/dd/yyyy')
-
-    if "Project" in display_df.columns:
-        gb.configure_column("Project", hide=True)  # Hide since project name is in heading
-    if "Task" in display_df.columns:
-        gb.configure_column("Task", editable=True)
-
-    # Transcript ID column - hidden by default, shown only if checkbox is checked
-    for transcript_col_name in ["Transcript ID", "Transcript Number", "Transcript #", "Transcript"]:
-        if transcript_col_name in display_df.columns:
-            gb.configure_column(transcript_col_name, hide=not show_transcript_id, editable=False)
-
-    # Person column - hidden on My Tasks page for everyone (including Tea)
-    # Only shown on All Tasks page where Tea manages all users
-    if "Person" in display_df.columns:
-        # Hide on My Tasks page (when key_prefix is "my_tasks_")
-        hide_person = (key_prefix == "my_tasks_")
-        gb.configure_column("Person", editable=is_tea, hide=hide_person)
-
-    # Priority column - editable dropdown for everyone with green color coding
-    if "Priority" in display_df.columns:
-        # Define cell style function for priority colors
-        priority_cell_style = {
-            'styleConditions': [
-                {
-                    'condition': 'params.value === "High"',
-                    'style': {'backgroundColor': '#39ff14', 'color': '#064e3b', 'fontWeight': '600'}
-                },
-                {
-                    'condition': 'params.value === "Medium"',
-                    'style': {'backgroundColor': '#4ade80', 'color': '#ffffff', 'fontWeight': '600'}
-                },
-                {
-                    'condition': 'params.value === "Low"',
-                    'style': {'backgroundColor': '#0a4b4b', 'color': '#ffffff', 'fontWeight': '600'}
-                }
-            ]
-        }
-
-        # Everyone can edit Priority on My Tasks, but only Tea on All Tasks
-        is_editable = (key_prefix == "my_tasks_") or is_tea
-
-        gb.configure_column(
-            "Priority",
-            editable=is_editable,
-            cellEditor='agSelectCellEditor',
-            cellEditorParams={
-                'values': ['High', 'Medium', 'Low']
-            },
-            width=120,
-            headerClass='priority-header'
-        )
-
-    # Progress Status - editable dropdown with the three options (SQUARES)
-    if "Progress Status" in display_df.columns:
-        gb.configure_column(
-            "Progress Status",
-            editable=True,
-            cellEditor='agSelectCellEditor',
-            cellEditorParams={
-                'values': ['🟥 Not Started', '🟨 In Progress', '🟩 Complete']
-            },
-            width=180,
-            headerClass='progress-status-header'
-        )
-
-    # Progress % - hide in home view (still used for data syncing)
-    if "Progress %" in display_df.columns:
-        gb.configure_column("Progress %", hide=True)
+    # Display copy with clean column names (remove ___N suffix), Progress Status
+    # squares, colored Status and _row_id (cached per snapshot version and filters)
+    display_df, clean_column_mapping = display_frame(filtered_df, "grid")
 
-    # Set getRowId using GridOptionsBuilder to avoid unsafe JavaScript
-    gb.configure_grid_options(getRowNodeId='_row_id')
+    # Column definitions are cached per schema, role and transcript toggle;
+    # only the row data changes between reruns
+    # Projection: the client only gets the visible columns plus _row_id.
+    # Hidden fields stay in display_df and are rejoined by _row_id on save.
+    hidden_columns = grid_hidden_columns(key_prefix, show_transcript_id)
+    grid_df = display_df[[col for col in display_df.columns if col not in hidden_columns]]
+    grid_options = task_grid_options(grid_df, is_tea, key_prefix, show_transcript_id)
 
-    grid_options = gb.build()
-
-    # Render AgGrid with display dataframe (clean column names)
+    # Render AgGrid with the projected display dataframe (clean column names)
     response = AgGrid(
-        display_df,
+        grid_df,
         gridOptions=grid_options,
         theme="streamlit",
         update_mode=GridUpdateMode.MODEL_CHANGED,
@@ -1421,8 +2218,10 @@ def render_editable_task_grid(df, current_user, is_tea=False, key_prefix="", sho
 
     edited_df = pd.DataFrame(response["data"])
 
-    # Remove internal row ID column if present
+    # Remove internal row ID column if present (keep the IDs to map edits back to snapshot rows)
+    edited_row_ids = None
     if "_row_id" in edited_df.columns:
+        edited_row_ids = edited_df["_row_id"].tolist()
         edited_df = edited_df.drop(columns=["_row_id"])
 
     # Add manual "Send to Google Sheets" button
@@ -1430,7 +2229,7 @@ def render_editable_task_grid(df, current_user, is_tea=False, key_prefix="", sho
 
     # Check if any changes were made (compare without _row_id column)
     # Also check if number of rows changed (new tasks added or deleted)
-    display_df_compare = display_df.drop(columns=["_row_id"]) if "_row_id" in display_df.columns else display_df
+    display_df_compare = grid_df.drop(columns=["_row_id"])
     has_changes = (len(edited_df) != len(display_df_compare)) or not edited_df.equals(display_df_compare)
 
     if has_changes:
@@ -1446,8 +2245,17 @@ def render_editable_task_grid(df, current_user, is_tea=False, key_prefix="", sho
             completed_mask = edited_df["Progress Status"].str.contains("🟩|Complete", case=False, na=False)
             completed_tasks_count = completed_mask.sum()
         with st.spinner("Saving changes to Google Sheets..."):
+            edited_df_to_save = edited_df.copy(deep=False)
+
+            # Rejoin the hidden fields (Status, Progress %...) by row ID, in display order
+            if edited_row_ids is not None:
+                hidden_df = display_df.set_index("_row_id").reindex(edited_row_ids)
+                for col in display_df.columns:
+                    if col in hidden_columns:
+                        edited_df_to_save[col] = hidden_df[col].to_numpy()
+                edited_df_to_save = edited_df_to_save[[col for col in display_df.columns if col in edited_df_to_save.columns]]
+
             # Convert Progress Status back to Progress %
-            edited_df_to_save = edited_df.copy()
             if "Progress Status" in edited_df_to_save.columns:
                 def status_to_percentage(status):
                     if "🟥" in str(status) or "Not Started" in str(status):
@@ -1477,7 +2285,7 @@ def render_editable_task_grid(df, current_user, is_tea=False, key_prefix="", sho
                 )
 
             # Restore the ___N suffix to column names for proper mapping
-            edited_df_with_suffix = edited_df_to_save.copy()
+            edited_df_with_suffix = edited_df_to_save.copy(deep=False)
             suffix_cols = []
             for col in edited_df_to_save.columns:
                 # Find the original column name with suffix from clean_column_mapping
@@ -1487,18 +2295,22 @@ def render_editable_task_grid(df, current_user, is_tea=False, key_prefix="", sho
                     suffix_cols.append(col)
             edited_df_with_suffix.columns = suffix_cols
 
-            # ALWAYS use the FULL dataframe to prevent data loss
-            # Merge edited rows back into the full dataset (df contains ALL rows, edited_df_with_suffix has filtered/edited rows)
-            full_df_to_save = df.copy()
+            # Index edited rows by their original snapshot row (the grid returns a fresh 0..n index)
+            if edited_row_ids is not None:
+                edited_df_with_suffix.index = edited_row_ids
+
+            # Merge the edited rows into an editable copy of just those snapshot rows.
+            # update_google_sheet writes row by row (version-checked), so every other
+            # row - archived, hidden, other pages - stays untouched without being copied
+            edited_ids = [idx for idx in edited_df_with_suffix.index if idx in df.index]
+            rows_to_save = editable_frame(df.loc[edited_ids])
 
-            # Update only the rows that were edited in the filtered view
-            # Match by index to update the correct rows
-            for idx in edited_df_with_suffix.index:
-                if idx in full_df_to_save.index:
-                    full_df_to_save.loc[idx] = edited_df_with_suffix.loc[idx]
+            # Match by index to update the correct rows (only columns the grid actually returned)
+            shared_cols = [col for col in edited_df_with_suffix.columns if col in rows_to_save.columns]
+            for idx in edited_ids:
+                rows_to_save.loc[idx, shared_cols] = edited_df_with_suffix.loc[idx, shared_cols].values
 
-            # Save the FULL dataset (including all archived/hidden rows)
-            success = update_google_sheet(full_df_to_save)
+            success = update_google_sheet(rows_to_save)
 
             if success:
                 if completed_tasks_count > 0:
@@ -1517,7 +2329,17 @@ def calculate_executive_metrics(df):
     """
     Calculate executive-level metrics for Tea's admin view
     Returns detailed project breakdown and team metrics
+    (cached per snapshot version, see cache_backend)
     """
+    return cache_backend.cached_view(
+        "executive_metrics",
+        _frame_version(df),
+        (),
+        lambda: _compute_executive_metrics(df),
+    )
+
+def _compute_executive_metrics(df):
+    """Uncached body of calculate_executive_metrics"""
     if df.empty:
         return {
             "total_tasks": 0,
@@ -1530,7 +2352,8 @@ def calculate_executive_metrics(df):
             "overdue_tasks": 0
         }
 
-    df_copy = df.copy()
+    # Shallow, Copy-on-Write: only the normalized Status column is materialized
+    df_copy = df.copy(deep=False)
 
     # Normalize status
     if has_column(df_copy, "Status"):
@@ -1621,24 +2444,8 @@ def render_executive_dashboard(exec_metrics, df):
     Render executive dashboard for Tea with enhanced metrics
     """
     # Add KPI card hover effects
+    use_styles("kpi_cards")
     st.markdown("""
-        <style>
-        .kpi-card {
-            background: #ffffff;
-            padding: 48px 32px;
-            border-radius: 12px;
-            border: 1px solid #e8eaed;
-            box-shadow: 0 1px 3px rgba(0, 0, 0, 0.05);
-            text-align: center;
-            transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-            cursor: default;
-        }
-        .kpi-card:hover {
-            transform: translateY(-4px);
-            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.08);
-            border-color: #d1d5db;
-        }
-        </style>
         <h2 style='
             margin: 0 0 48px 0;
             font-size: 1.5rem;
@@ -1703,6 +2510,360 @@ def render_executive_dashboard(exec_metrics, df):
     # - Completion Velocity & Project Health -> All Tasks page
 
 
+# Overview project sections: tables load only when a section is expanded, one page at a time.
+# METAFLEX_LAZY_PROJECTS=0 restores the old "render every table up front" behaviour.
+LAZY_PROJECT_SECTIONS = os.environ.get("METAFLEX_LAZY_PROJECTS", "1") != "0"
+PROJECT_PAGE_SIZE = int(os.environ.get("METAFLEX_PROJECT_PAGE_SIZE", "25"))
+# Upper bound on expanded project tables per rerun (keeps widget count and payload bounded)
+MAX_OPEN_PROJECT_SECTIONS = int(os.environ.get("METAFLEX_MAX_OPEN_PROJECTS", "3"))
+
+# Status buckets for the per-project cards on the Overview page (matched on lowercase status)
+PROJECT_STATUS_PATTERNS = {
+    "open": "open|not started",
+    "in_progress": "in progress|working",
+    "complete": "done|complete",
+}
+
+def _per_value(series, transform):
+    """
+    Run a vectorized string transform once per distinct value and broadcast
+    it back to the rows. Meant for low-cardinality columns (Project, Status):
+    a handful of string ops instead of one per row.
+    """
+    uniques = pd.Series(series.dropna().unique(), dtype=object)
+    mapping = dict(zip(uniques, transform(uniques.astype(str))))
+    return series.astype(object).map(mapping)
+
+def partition_projects(projects_df):
+    """
+    Split the frame once by canonical project (trimmed, case-insensitive) and
+    precompute each partition's status counts and completion rate.
+
+    Returns:
+        List of dicts sorted by project name, each with "name", "frame",
+        "total", "open", "in_progress", "complete" and "completion_rate"
+    """
+    if projects_df.empty or not has_column(projects_df, "Project"):
+        return []
+
+    project_key = _per_value(projects_df[get_column(projects_df, "Project")], lambda s: s.str.strip().str.lower())
+
+    # One boolean column per status bucket, summed per project in a single groupby
+    flags = pd.DataFrame({"total": 1}, index=projects_df.index)
+    status = projects_df[get_column(projects_df, "Status")] if has_column(projects_df, "Status") else None
+    for bucket, pattern in PROJECT_STATUS_PATTERNS.items():
+        if status is None:
+            flags[bucket] = False
+        else:
+            flags[bucket] = _per_value(status, lambda s, p=pattern: s.str.lower().str.contains(p, na=False)).eq(True)
+    counts = flags.groupby(project_key, sort=False).sum()
+
+    partitions = []
+    for code, frame in projects_df.groupby(project_key, sort=False):
+        if not code:
+            continue
+        row = counts.loc[code]
+        total = int(row["total"])
+        complete = int(row["complete"])
+        partitions.append({
+            "name": code.title(),
+            "frame": frame,
+            "total": total,
+            "open": int(row["open"]),
+            "in_progress": int(row["in_progress"]),
+            "complete": complete,
+            "completion_rate": int(complete / total * 100) if total > 0 else 0,
+        })
+
+    return sorted(partitions, key=lambda p: p["name"])
+
+class RenderContext:
+    """
+    Derived data for one page run: the snapshot plus every view the render
+    functions take from it (team rows, KPIs, project partitions, resolved
+    column names...), each computed lazily and at most once.
+
+    show_dashboard builds one per full rerun and passes it down. Fragments keep
+    the arguments they were called with, so a fragment rerun (a filter toggle,
+    paging a project table) reuses the same context instead of re-deriving.
+    """
+
+    def __init__(self, df, user_name):
+        self.df = df
+        self.user_name = user_name
+        self.role = user_role(user_name)
+        self._memo = {}
+
+    def _get(self, key, compute):
+        if key not in self._memo:
+            self._memo[key] = compute()
+        return self._memo[key]
+
+    @property
+    def is_tea(self):
+        return self.role == "tea"
+
+    @property
+    def is_jess(self):
+        return self.role == "jess"
+
+    def column(self, name):
+        """
+        Actual column for a base name ("Status" -> "Status___1"), or None.
+        Every derived view is a row subset of df, so they all share it.
+        """
+        return self._get(("column", name), lambda: get_column(self.df, name) if has_column(self.df, name) else None)
+
+    @property
+    def filtered(self):
+        """
+        Rows the user sees on the Overview (Tea: all, Jess: her team, others: their own).
+        None if there is no assignee column to filter a regular user's tasks by.
+        """
+        def compute():
+            view = scoped_view(self.df, "team", self.user_name)
+            if view is None and self.is_jess:
+                return self.df
+            return view
+        return self._get("filtered", compute)
+
+    @property
+    def kpis(self):
+        return self._get("kpis", lambda: calculate_kpis(self.filtered, self.user_name, is_personal=(self.role == "user")))
+
+    @property
+    def exec_metrics(self):
+        return self._get("exec_metrics", lambda: calculate_executive_metrics(self.df))
+
+    @property
+    def project_counts(self):
+        return self._get("project_counts", lambda: project_task_counts(self.filtered))
+
+    def projects(self, include_archived):
+        """
+        Partitions (see partition_projects) for the project breakdown panel:
+        Jess's team rows or, for Tea, every row - without done tasks unless include_archived
+        """
+        def compute():
+            projects_df = self.filtered if self.is_jess else self.df
+            status_col = self.column("Status")
+            if not include_archived and status_col:
+                is_done = _per_value(projects_df[status_col], lambda s: s.str.strip().str.lower().isin(DONE_STATUSES))
+                projects_df = projects_df[~is_done.eq(True)]
+            return partition_projects(projects_df)
+        return self._get(("projects", include_archived), compute)
+
+    def table_columns(self, hide_project_column, show_transcript_checked):
+        """render_tasks_table's display columns (see table_display_columns)"""
+        return self._get(
+            ("table_columns", hide_project_column, show_transcript_checked),
+            lambda: table_display_columns(self.df, hide_project_column, show_transcript_checked),
+        )
+
+def _lazy_section(label, key):
+    """
+    Collapsed expander whose body only needs to run while it is open.
+    Returns (container, is_open). Falls back to a toggle inside a plain
+    expander on Streamlit versions without expander state tracking.
+    """
+    try:
+        section = st.expander(label, expanded=False, key=key, on_change="rerun")
+        return section, bool(section.open)
+    except TypeError:
+        section = st.expander(label, expanded=False)
+        with section:
+            is_open = st.toggle("Load tasks", key=key)
+        return section, is_open
+
+def _project_section_key(project_name):
+    """Widget key of a project section's expander (see _lazy_section)"""
+    key_base = re.sub(r'\W+', '_', project_name.lower())
+    return f"project_section_{key_base}"
+
+def _open_project_sections(project_names):
+    """
+    Update st.session_state.open_project_sections from the section expanders'
+    state, before any section renders: sections stay in the order they were
+    opened, newly opened ones are appended in display order, and closed or
+    no longer listed projects (e.g. archive filter changed) are dropped.
+    Returns the names whose tables may load this run (the first MAX_OPEN_PROJECT_SECTIONS).
+    """
+    is_open = {name: bool(st.session_state.get(_project_section_key(name))) for name in project_names}
+    open_sections = [name for name in st.session_state.get("open_project_sections", []) if is_open.get(name)]
+    open_sections += [name for name in project_names if is_open[name] and name not in open_sections]
+    st.session_state.open_project_sections = open_sections
+    return set(open_sections[:MAX_OPEN_PROJECT_SECTIONS])
+
+def render_project_section_table(project_name, project_df, show_transcript_checked=False, ctx=None, loaded=True):
+    """
+    Lazy, paginated task table for one Overview project section.
+    Not a fragment of its own: opening, closing or paging a section reruns
+    render_project_breakdown, which decides which sections may load (see
+    _open_project_sections) so every section's "Up to N" caption stays current.
+
+    Args:
+        project_name: Display name (also used for widget keys)
+        project_df: The project's partition
+        show_transcript_checked: Passed through to render_tasks_table
+        ctx: RenderContext of the page run, passed through to render_tasks_table
+        loaded: False if MAX_OPEN_PROJECT_SECTIONS other sections are already open
+    """
+    key_base = re.sub(r'\W+', '_', project_name.lower())
+    task_count = len(project_df)
+    section, is_open = _lazy_section(f"View {task_count} task{'s' if task_count != 1 else ''}", key=_project_section_key(project_name))
+    if not is_open:
+        return
+
+    with section:
+        if not loaded:
+            st.caption(f"Up to {MAX_OPEN_PROJECT_SECTIONS} projects load at once - collapse another project, then reopen this one.")
+            return
+
+        page_count = max(1, -(-task_count // PROJECT_PAGE_SIZE))
+        page = 1
+        if page_count > 1:
+            page = st.number_input(
+                f"Page (of {page_count})",
+                min_value=1,
+                max_value=page_count,
+                value=1,
+                step=1,
+                key=f"project_page_{key_base}",
+            )
+        start = (page - 1) * PROJECT_PAGE_SIZE
+        page_df = project_df.iloc[start:start + PROJECT_PAGE_SIZE]
+
+        render_tasks_table(page_df, limit=len(page_df), hide_project_column=True, show_transcript_checked=show_transcript_checked, ctx=ctx)
+
+@fragment
+def render_project_breakdown(ctx):
+    """
+    Overview "Breakdown of tasks by project" panel: archive/transcript filters
+    plus one section per project. Runs as a fragment, so toggling a filter or
+    paging a project table reruns only this panel (with the same RenderContext,
+    so the partitions are computed once per filter setting).
+    """
+    # Add archive filter with calm styling
+    show_archived_projects = st.checkbox("Include archived", value=False, key="show_archived_projects")
+
+    # Add "Show Transcript #" checkbox right below
+    show_transcript_global = st.checkbox("Show Transcript #", value=False, key="show_transcript_global")
+
+    # Style checkboxes with calm, subdued dark teal - minimal interference.
+    # Project table modules are declared up front too, so opening a section
+    # doesn't re-link the bundle.
+    use_styles("checkbox_subdued", "tasks_table", "table_buttons")
+
+    st.markdown("<div style='margin-bottom: 32px;'></div>", unsafe_allow_html=True)
+
+    # Dynamically show all projects from Google Sheets with editable grids
+    # Partitioned once (case-insensitive, trimmed) with counts precomputed per project.
+    # Jess: her team's rows, Tea: all rows; done tasks only with "Include archived"
+    if ctx.column("Project"):
+        project_partitions = ctx.projects(show_archived_projects)
+
+        if len(project_partitions) > 0:
+            # Which open sections load their table, decided once for every section
+            loaded_sections = _open_project_sections([partition["name"] for partition in project_partitions])
+
+            # Display each project's tasks with editable grids
+            for idx, partition in enumerate(project_partitions):
+                project_name = partition["name"]
+                project_df = partition["frame"]
+
+                # Project KPIs
+                task_count = partition["total"]
+                open_count = partition["open"]
+                in_progress_count = partition["in_progress"]
+                completion_rate = partition["completion_rate"]
+
+                # Project header - Subdued styling
+                st.markdown(f"""<h3 style='
+                    text-align: left;
+                    font-size: 1.1rem;
+                    font-weight: 500;
+                    color: #6b7280;
+                    margin: 24px 0 16px 0;
+                    text-transform: uppercase;
+                    letter-spacing: 0.05em;
+                '>{project_name}</h3>""", unsafe_allow_html=True)
+
+                # Premium KPI cards using Streamlit columns
+                kpi_col1, kpi_col2, kpi_col3, kpi_col4 = st.columns(4)
+
+                with kpi_col1:
+                    st.markdown(f"""<div style='
+                        background: #ffffff;
+                        border-radius: 10px;
+                        padding: 20px 16px;
+                        border: 1px solid #e8eaed;
+                        border-left: 2px solid #0a4b4b;
+                        text-align: center;
+                        box-shadow: 0 1px 3px rgba(0, 0, 0, 0.04);
+                    '>
+                        <p style='margin: 0 0 8px 0; font-size: 0.65rem; font-weight: 500; text-transform: uppercase; letter-spacing: 0.08em; color: #9ca3af;'>TOTAL</p>
+                        <h3 style='margin: 0; font-size: 1.6rem; font-weight: 400; color: #2d3748;'>{task_count}</h3>
+                    </div>""", unsafe_allow_html=True)
+
+                with kpi_col2:
+                    st.markdown(f"""<div style='
+                        background: #ffffff;
+                        border-radius: 10px;
+                        padding: 20px 16px;
+                        border: 1px solid #e8eaed;
+                        border-left: 2px solid #0a4b4b;
+                        text-align: center;
+                        box-shadow: 0 1px 3px rgba(0, 0, 0, 0.04);
+                    '>
+                        <p style='margin: 0 0 8px 0; font-size: 0.65rem; font-weight: 500; text-transform: uppercase; letter-spacing: 0.08em; color: #9ca3af;'>OPEN</p>
+                        <h3 style='margin: 0; font-size: 1.6rem; font-weight: 400; color: #4a5568;'>{open_count}</h3>
+                    </div>""", unsafe_allow_html=True)
+
+                with kpi_col3:
+                    st.markdown(f"""<div style='
+                        background: #ffffff;
+                        border-radius: 10px;
+                        padding: 20px 16px;
+                        border: 1px solid #e8eaed;
+                        border-left: 2px solid #0a4b4b;
+                        text-align: center;
+                        box-shadow: 0 1px 3px rgba(0, 0, 0, 0.04);
+                    '>
+                        <p style='margin: 0 0 8px 0; font-size: 0.65rem; font-weight: 500; text-transform: uppercase; letter-spacing: 0.08em; color: #9ca3af;'>IN PROGRESS</p>
+                        <h3 style='margin: 0; font-size: 1.6rem; font-weight: 400; color: #4a5568;'>{in_progress_count}</h3>
+                    </div>""", unsafe_allow_html=True)
+
+                with kpi_col4:
+                    st.markdown(f"""<div style='
+                        background: #ffffff;
+                        border-radius: 10px;
+                        padding: 20px 16px;
+                        border: 1px solid #e8eaed;
+                        border-left: 2px solid #4d7a40;
+                        text-align: center;
+                        box-shadow: 0 1px 3px rgba(0, 0, 0, 0.04);
+                    '>
+                        <p style='margin: 0 0 8px 0; font-size: 0.65rem; font-weight: 500; text-transform: uppercase; letter-spacing: 0.08em; color: #9ca3af;'>COMPLETE</p>
+                        <h3 style='margin: 0; font-size: 1.6rem; font-weight: 400; color: #4d7a40;'>{completion_rate}%</h3>
+                    </div>""", unsafe_allow_html=True)
+
+                # Spacing after KPI cards
+                st.markdown("<div style='margin-bottom: 20px;'></div>", unsafe_allow_html=True)
+
+                if not project_df.empty:
+                    # Hide Project column since we're already showing project-specific tables
+                    if LAZY_PROJECT_SECTIONS:
+                        # Headers + KPI cards only; the table loads when the section is expanded
+                        render_project_section_table(project_name, project_df, show_transcript_checked=show_transcript_global, ctx=ctx,
+                                                     loaded=project_name in loaded_sections)
+                    else:
+                        render_tasks_table(project_df, limit=len(project_df), hide_project_column=True, show_transcript_checked=show_transcript_global, ctx=ctx)
+
+                # Elegant spacing between project sections
+                if idx < len(project_partitions) - 1:  # Don't add extra space after last project
+                    st.markdown("<div style='margin-bottom: 40px;'></div>", unsafe_allow_html=True)
+
+
 def show_dashboard():
     """
     Home page: Team and Project Overview with charts and analytics
@@ -1715,283 +2876,76 @@ def show_dashboard():
         st.warning("Please log in to view the dashboard.")
         st.stop()
 
+    # Progressive rendering: lay out the page skeleton first, then fill each
+    # section as soon as its data is ready (KPIs -> charts -> project tables).
+    # tests/test_render_timing.py benchmarks the time to the KPI paint.
+    kpi_slot = st.empty()
+    charts_slot = st.empty()
+    projects_slot = st.empty()
+    charts_slot.caption("Loading charts...")
+
     # Load data from Google Sheet
-    with st.spinner("Loading dashboard data..."):
-        df = load_google_sheet()
+    with kpi_slot.container():
+        with st.spinner("Loading dashboard data..."):
+            df = load_google_sheet()
 
     if df.empty:
-        st.warning("No data available. Please check your Google Sheet connection.")
+        charts_slot.empty()
+        kpi_slot.warning("No data available. Please check your Google Sheet connection.")
         return
 
-    # Determine if user is Tea (admin), Jess (view_all_tasks), or regular user
-    # Handle various spellings: Tea, Téa, Tēa, tea phillips, etc.
-    user_lower = user_name.lower()
-    is_tea = "tea" in user_lower or "téa" in user_lower or "tēa" in user_lower
-    is_jess = "jess" in user_lower
-
-
-    # Filter data based on user type
-    if is_tea:
-        # Tea sees all data with team KPIs
-        filtered_df = df
-        kpis = calculate_kpis(filtered_df, user_name, is_personal=False)
-        exec_metrics = calculate_executive_metrics(df)
-    elif is_jess:
-        # Jess sees only her, Megan's, and Justin's tasks
-        assignee_col = None
-        if has_column(df, "Assigned To"):
-            assignee_col = get_column(df, "Assigned To")
-        elif has_column(df, "assignee"):
-            assignee_col = get_column(df, "assignee")
-        elif has_column(df, "Person"):
-            assignee_col = get_column(df, "Person")
-
-        if assignee_col:
-            # Filter for Jess, Megan, and Justin
-            filtered_df = df[
-                df[assignee_col].str.lower().str.contains('jess|megan|justin', na=False, regex=True)
-            ].copy()
-        else:
-            filtered_df = df
-        kpis = calculate_kpis(filtered_df, user_name, is_personal=False)
-    else:
-        # Other users only see their own tasks
-        # Try different possible column names for assignee
-        assignee_col = None
-        if has_column(df, "Assigned To"):
-            assignee_col = get_column(df, "Assigned To")
-        elif has_column(df, "assignee"):
-            assignee_col = get_column(df, "assignee")
-        elif has_column(df, "Person"):
-            assignee_col = get_column(df, "Person")
+    # Everything derived from the snapshot for this rerun is computed once, on
+    # first use, and shared by the render functions below (see RenderContext).
+    # Tea sees all data, Jess her team's tasks, other users only their own
+    # (usually already computed by the post-login prefetch)
+    ctx = RenderContext(df, user_name)
+    is_tea = ctx.is_tea
+    is_jess = ctx.is_jess
+
+    if ctx.filtered is None:
+        charts_slot.empty()
+        kpi_slot.error(f"Cannot filter tasks: No assignee column found. Available columns: {', '.join(df.columns.tolist())}")
+        return
 
-        if assignee_col:
-            filtered_df = df[df[assignee_col].str.lower().str.contains(user_name.lower(), na=False)].copy()
-        else:
-            st.error(f"Cannot filter tasks: No assignee column found. Available columns: {', '.join(df.columns.tolist())}")
-            return
-        kpis = calculate_kpis(filtered_df, user_name, is_personal=True)
+    if is_tea or is_jess:
+        projects_slot.caption("Loading projects...")
 
     # Render KPIs based on user type
-    if is_tea:
-        # Tea sees enhanced executive dashboard only (no duplicate basic KPIs)
-        render_executive_dashboard(exec_metrics, df)
-    elif is_jess:
-        # Jess sees all 3 KPI cards
-        render_kpi_section(kpis)
-    else:
-        # Other users see only 2 KPI cards (My Open Tasks, Active Projects)
-        render_personal_kpi_section(kpis)
+    with kpi_slot.container():
+        if is_tea:
+            # Tea sees enhanced executive dashboard only (no duplicate basic KPIs)
+            render_executive_dashboard(ctx.exec_metrics, df)
+        elif is_jess:
+            # Jess sees all 3 KPI cards
+            render_kpi_section(ctx.kpis)
+        else:
+            # Other users see only 2 KPI cards (My Open Tasks, Active Projects)
+            render_personal_kpi_section(ctx.kpis)
 
-    # Section: Performance Overview
-    st.markdown("<div style='margin-top: 48px;'></div>", unsafe_allow_html=True)
+    with charts_slot.container():
+        # Section: Performance Overview
+        st.markdown("<div style='margin-top: 48px;'></div>", unsafe_allow_html=True)
 
-    # Charts (filtered based on user)
-    # Only Tea and Jess see the "Tasks by Project" chart; regular users only see Task Completion Status
-    render_charts_section(kpis, filtered_df, show_project_chart=(is_tea or is_jess))
+        # Charts (filtered based on user)
+        # Only Tea and Jess see the "Tasks by Project" chart; regular users only see Task Completion Status
+        show_project_chart = is_tea or is_jess
+        render_charts_section(ctx.kpis, ctx.filtered, show_project_chart=show_project_chart,
+                              project_counts=ctx.project_counts if show_project_chart else None)
 
     # === PROJECT BREAKDOWN === (Only show for Tea and Jess)
     if is_tea or is_jess:
-        st.markdown("<div style='margin-top: 64px;'></div>", unsafe_allow_html=True)
-
-        st.markdown("""
-            <h2 style='
-                margin: 0 0 32px 0;
-                font-size: 2rem;
-                font-weight: 700;
-                color: #2d3748;
-                letter-spacing: 0.05em;
-                text-transform: uppercase;
-            '>BREAKDOWN OF TASKS BY PROJECT</h2>
-        """, unsafe_allow_html=True)
+        with projects_slot.container():
+            st.markdown("<div style='margin-top: 64px;'></div>", unsafe_allow_html=True)
 
-        # Add archive filter with calm styling
-        show_archived_projects = st.checkbox("Include archived", value=False, key="show_archived_projects")
-
-        # Add "Show Transcript #" checkbox right below
-        show_transcript_global = st.checkbox("Show Transcript #", value=False, key="show_transcript_global")
-
-        # Style checkboxes with calm, subdued dark teal - minimal interference
-        st.markdown("""
-            <style>
-            /* Style checkbox label text - calm and subdued */
-            div[data-testid="stCheckbox"] label p {
-                color: #5a6c7d !important;
-                font-size: 0.9rem !important;
-                font-weight: 400 !important;
-            }
-
-            /* Unchecked checkbox - soft grey with subtle teal border */
-            div[data-testid="stCheckbox"] input[type="checkbox"] ~ span div svg rect {
-                fill: rgba(229, 231, 235, 0.5) !important;
-                stroke: rgba(10, 75, 75, 0.3) !important;
-                stroke-width: 1.5 !important;
-            }
-
-            /* Checked checkbox - calm dark teal */
-            div[data-testid="stCheckbox"] input[type="checkbox"]:checked ~ span div svg rect {
-                fill: #0a4b4b !important;
-                stroke: #0a4b4b !important;
-            }
-
-            /* Make checkmark white when checked */
-            div[data-testid="stCheckbox"] input[type="checkbox"]:checked ~ span div svg path {
-                fill: #ffffff !important;
-                stroke: #ffffff !important;
-                stroke-width: 2 !important;
-            }
-
-            /* Hover effect - subtle */
-            div[data-testid="stCheckbox"]:hover input[type="checkbox"] ~ span div svg rect {
-                stroke: rgba(10, 75, 75, 0.5) !important;
-            }
-
-            div[data-testid="stCheckbox"]:hover input[type="checkbox"]:checked ~ span div svg rect {
-                fill: #0d5a5a !important;
-            }
-            </style>
-        """, unsafe_allow_html=True)
+            st.markdown("""
+                <h2 style='
+                    margin: 0 0 32px 0;
+                    font-size: 2rem;
+                    font-weight: 700;
+                    color: #2d3748;
+                    letter-spacing: 0.05em;
+                    text-transform: uppercase;
+                '>BREAKDOWN OF TASKS BY PROJECT</h2>
+            """, unsafe_allow_html=True)
 
-        st.markdown("<div style='margin-bottom: 32px;'></div>", unsafe_allow_html=True)
-
-        # Apply archive filter to dataframe
-        # Use filtered_df for Jess (already filtered to Jess/Megan/Justin), full df for Tea
-        projects_df = filtered_df.copy() if is_jess else df.copy()
-        if not show_archived_projects and has_column(projects_df, "Status"):
-            status_col = get_column(projects_df, "Status")
-            projects_df = projects_df[~projects_df[status_col].str.strip().str.lower().isin(['done', 'complete', 'completed'])]
-
-        # Dynamically show all projects from Google Sheets with editable grids
-        if has_column(projects_df, "Project"):
-            project_col = get_column(projects_df, "Project")
-
-            # Get unique projects (case-insensitive, trimmed)
-            unique_projects = projects_df[project_col].str.strip().str.title().dropna().unique()
-            unique_projects = sorted([p for p in unique_projects if p])  # Sort alphabetically
-
-            if len(unique_projects) > 0:
-                # Display each project's tasks with editable grids
-                for idx, project_name in enumerate(unique_projects):
-                    # Filter tasks for this project (case-insensitive)
-                    project_df = projects_df[projects_df[project_col].str.strip().str.lower() == project_name.lower()].copy()
-
-                    # Calculate project KPIs
-                    task_count = len(project_df)
-                    open_count = 0
-                    in_progress_count = 0
-                    complete_count = 0
-
-                    if has_column(project_df, "Status"):
-                        status_col = get_column(project_df, "Status")
-                        open_count = len(project_df[project_df[status_col].str.lower().str.contains("open|not started", case=False, na=False)])
-                        in_progress_count = len(project_df[project_df[status_col].str.lower().str.contains("in progress|working", case=False, na=False)])
-                        complete_count = len(project_df[project_df[status_col].str.lower().str.contains("done|complete", case=False, na=False)])
-
-                    completion_rate = int((complete_count / task_count * 100)) if task_count > 0 else 0
-
-                    # Project header - Subdued styling
-                    st.markdown(f"""<h3 style='
-                        text-align: left;
-                        font-size: 1.1rem;
-                        font-weight: 500;
-                        color: #6b7280;
-                        margin: 24px 0 16px 0;
-                        text-transform: uppercase;
-                        letter-spacing: 0.05em;
-                    '>{project_name}</h3>""", unsafe_allow_html=True)
-
-                    # Premium KPI cards using Streamlit columns
-                    kpi_col1, kpi_col2, kpi_col3, kpi_col4 = st.columns(4)
-
-                    with kpi_col1:
-                        st.markdown(f"""<div style='
-                            background: #ffffff;
-                            border-radius: 10px;
-                            padding: 20px 16px;
-                            border: 1px solid #e8eaed;
-                            border-left: 2px solid #0a4b4b;
-                            text-align: center;
-                            box-shadow: 0 1px 3px rgba(0, 0, 0, 0.04);
-                        '>
-                            <p style='margin: 0 0 8px 0; font-size: 0.65rem; font-weight: 500; text-transform: uppercase; letter-spacing: 0.08em; color: #9ca3af;'>TOTAL</p>
-                            <h3 style='margin: 0; font-size: 1.6rem; font-weight: 400; color: #2d3748;'>{task_count}</h3>
-                        </div>""", unsafe_allow_html=True)
-
-                    with kpi_col2:
-                        st.markdown(f"""<div style='
-                            background: #ffffff;
-                            border-radius: 10px;
-                            padding: 20px 16px;
-                            border: 1px solid #e8eaed;
-                            border-left: 2px solid #0a4b4b;
-                            text-align: center;
-                            box-shadow: 0 1px 3px rgba(0, 0, 0, 0.04);
-                        '>
-                            <p style='margin: 0 0 8px 0; font-size: 0.65rem; font-weight: 500; text-transform: uppercase; letter-spacing: 0.08em; color: #9ca3af;'>OPEN</p>
-                            <h3 style='margin: 0; font-size: 1.6rem; font-weight: 400; color: #4a5568;'>{open_count}</h3>
-                        </div>""", unsafe_allow_html=True)
-
-                    with kpi_col3:
-                        st.markdown(f"""<div style='
-                            background: #ffffff;
-                            border-radius: 10px;
-                            padding: 20px 16px;
-                            border: 1px solid #e8eaed;
-                            border-left: 2px solid #0a4b4b;
-                            text-align: center;
-                            box-shadow: 0 1px 3px rgba(0, 0, 0, 0.04);
-                        '>
-                            <p style='margin: 0 0 8px 0; font-size: 0.65rem; font-weight: 500; text-transform: uppercase; letter-spacing: 0.08em; color: #9ca3af;'>IN PROGRESS</p>
-                            <h3 style='margin: 0; font-size: 1.6rem; font-weight: 400; color: #4a5568;'>{in_progress_count}</h3>
-                        </div>""", unsafe_allow_html=True)
-
-                    with kpi_col4:
-                        st.markdown(f"""<div style='
-                            background: #ffffff;
-                            border-radius: 10px;
-                            padding: 20px 16px;
-                            border: 1px solid #e8eaed;
-                            border-left: 2px solid #4d7a40;
-                            text-align: center;
-                            box-shadow: 0 1px 3px rgba(0, 0, 0, 0.04);
-                        '>
-                            <p style='margin: 0 0 8px 0; font-size: 0.65rem; font-weight: 500; text-transform: uppercase; letter-spacing: 0.08em; color: #9ca3af;'>COMPLETE</p>
-                            <h3 style='margin: 0; font-size: 1.6rem; font-weight: 400; color: #4d7a40;'>{completion_rate}%</h3>
-                        </div>""", unsafe_allow_html=True)
-
-                    # Spacing after KPI cards
-                    st.markdown("<div style='margin-bottom: 20px;'></div>", unsafe_allow_html=True)
-
-                    if not project_df.empty:
-                        # Render STATIC read-only table for display
-                        # Hide Project column since we're already showing project-specific tables
-                        render_tasks_table(project_df, limit=len(project_df), hide_project_column=True, show_transcript_checked=show_transcript_global)
-
-                    # Elegant spacing between project sections
-                    if idx < len(unique_projects) - 1:  # Don't add extra space after last project
-                        st.markdown("<div style='margin-bottom: 40px;'></div>", unsafe_allow_html=True)
-
-    # LOAD METAFLEX JAVASCRIPT AT END OF PAGE
-    import os
-    import streamlit.components.v1 as components
-
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    js_path = os.path.join(os.path.dirname(current_dir), "static", "metaflex.js")
-
-    if os.path.exists(js_path):
-        with open(js_path, 'r') as f:
-            js_code = f.read()
-
-        # Inject via iframe (only way to run JS in Streamlit)
-        components.html(
-            f"""
-            <script>
-            {js_code}
-            </script>
-            """,
-            height=0,
-            width=0
-        )
-        print(f"✅ MetaFlex JS loaded on Home page from: {js_path}")
-    else:
-        print(f"❌ JS not found at: {js_path}")
\ No newline at end of file
+            render_project_breakdown(ctx)
@@ -10,8 +10,13 @@ from .dashboard_page import (
     render_charts_section,
     render_tasks_table,
     render_page_header,
-    render_editable_task_grid
+    render_editable_task_grid,
+    append_task_row,
+    scoped_view,
+    user_role,
+    fragment
 )
+from style_registry import use_styles
 
 def show_tasks():
     """
@@ -22,8 +27,8 @@ def show_tasks():
     first_name = user_name.split()[0] if user_name else "User"
 
     # Determine if user is Tea (admin sees everything)
-    is_tea = user_name.lower() == "tea" or user_name.lower() == "tēa" or "tea" in user_name.lower()
-    is_jess = "jess" in user_name.lower()
+    role = user_role(user_name)
+    is_tea = role == "tea"
 
     # Page header matching Executive Overview style
     st.markdown("""
@@ -46,52 +51,12 @@ def show_tasks():
         return
 
     # Style checkboxes to match header styling
-    st.markdown("""
-        <style>
-        /* Checkbox label styling to match headers */
-        div[data-testid="stCheckbox"] label p {
-            color: #0a4b4b !important;
-            font-size: 0.95rem !important;
-            font-weight: 600 !important;
-            letter-spacing: 0.02em !important;
-        }
-
-        /* Checkbox styling - teal theme */
-        div[data-testid="stCheckbox"] input[type="checkbox"] ~ span div svg rect {
-            fill: rgba(229, 231, 235, 0.5) !important;
-            stroke: rgba(10, 75, 75, 0.4) !important;
-            stroke-width: 1.5 !important;
-        }
-
-        div[data-testid="stCheckbox"] input[type="checkbox"]:checked ~ span div svg rect {
-            fill: #0a4b4b !important;
-            stroke: #0a4b4b !important;
-        }
-
-        div[data-testid="stCheckbox"] input[type="checkbox"]:checked ~ span div svg path {
-            fill: #ffffff !important;
-            stroke: #ffffff !important;
-        }
-        </style>
-    """, unsafe_allow_html=True)
+    use_styles("checkbox_teal")
 
-    # Filter for user's tasks based on assignee column
-    assignee_col = None
-    if has_column(df, "Assigned To"):
-        assignee_col = get_column(df, "Assigned To")
-    elif has_column(df, "Person"):
-        assignee_col = get_column(df, "Person")
-    elif has_column(df, "assignee"):
-        assignee_col = get_column(df, "assignee")
-
-    if assignee_col:
-        # For Tea, show all tasks; for everyone else (including Jess), filter by user name
-        if is_tea:
-            personal_df = df.copy()
-        else:
-            # All users (Jess, Megan, Justin) see only their own personal tasks on "My Tasks"
-            personal_df = df[df[assignee_col].str.lower().str.contains(user_name.lower(), na=False)].copy()
-    else:
+    # Tea sees all tasks; everyone else (including Jess) only their own personal tasks
+    # (usually already computed by the post-login prefetch)
+    personal_df = scoped_view(df, "personal", user_name)
+    if personal_df is None:
         personal_df = pd.DataFrame()
 
     if personal_df.empty:
@@ -269,28 +234,7 @@ def show_tasks():
     st.markdown("<br>", unsafe_allow_html=True)
 
     # Add "Add New Task" and "Save Changes" buttons with KPI card styling
-    st.markdown("""
-        <style>
-        /* KPI card-style buttons - matching the pale forest green gradient */
-        button[kind="secondary"], button[kind="primary"] {
-            background: linear-gradient(135deg, #f5faf2 0%, #f8fbf8 100%) !important;
-            color: #2d5016 !important;
-            border: 1px solid #e8eced !important;
-            border-left: 4px solid #0a4b4b !important;
-            font-weight: 700 !important;
-            padding: 12px 24px !important;
-            border-radius: 8px !important;
-            transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1) !important;
-            box-shadow: 0 2px 4px rgba(0, 0, 0, 0.04), 0 1px 2px rgba(0, 0, 0, 0.02) !important;
-        }
-        button[kind="secondary"]:hover, button[kind="primary"]:hover {
-            background: linear-gradient(135deg, #f0f5ec 0%, #f5faf2 100%) !important;
-            transform: translateY(-2px) !important;
-            box-shadow: 0 4px 12px rgba(10, 75, 75, 0.15), 0 2px 4px rgba(0, 0, 0, 0.08) !important;
-            border-left-color: #0a4b4b !important;
-        }
-        </style>
-    """, unsafe_allow_html=True)
+    use_styles("kpi_buttons")
 
     # Search and action buttons in one row - search left, buttons right
     col_search, col_spacer, col_btn1, col_btn2 = st.columns([3, 0.5, 1, 1])
@@ -306,6 +250,15 @@ def show_tasks():
 
     st.markdown("<br>", unsafe_allow_html=True)
 
+    # Result of the last Add Task submission (shown after its rerun)
+    notice = st.session_state.pop("add_task_notice", None)
+    if notice:
+        level, message = notice
+        if level == "warning":
+            st.warning(message)
+        else:
+            st.success(message)
+
     # Handle adding new task
     if add_task:
         st.session_state.show_add_task_form = True
@@ -333,76 +286,51 @@ def show_tasks():
 
             col_submit, col_cancel = st.columns(2)
             with col_submit:
-                st.markdown("""
-                    <style>
-                    /* KPI card-style for form submit buttons */
-                    button[kind="formSubmit"] {
-                        background: linear-gradient(135deg, #f5faf2 0%, #f8fbf8 100%) !important;
-                        color: #2d5016 !important;
-                        border: 1px solid #e8eced !important;
-                        border-left: 4px solid #0a4b4b !important;
-                        font-weight: 700 !important;
-                        width: 100% !important;
-                        border-radius: 8px !important;
-                        padding: 12px 24px !important;
-                        transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1) !important;
-                        box-shadow: 0 2px 4px rgba(0, 0, 0, 0.04), 0 1px 2px rgba(0, 0, 0, 0.02) !important;
-                    }
-                    button[kind="formSubmit"]:hover {
-                        background: linear-gradient(135deg, #f0f5ec 0%, #f5faf2 100%) !important;
-                        transform: translateY(-2px) !important;
-                        box-shadow: 0 4px 12px rgba(10, 75, 75, 0.15), 0 2px 4px rgba(0, 0, 0, 0.08) !important;
-                        border-left-color: #0a4b4b !important;
-                    }
-                    </style>
-                """, unsafe_allow_html=True)
+                use_styles("form_buttons")
                 submit = st.form_submit_button("Add Task")
             with col_cancel:
                 cancel = st.form_submit_button("Cancel")
 
             if submit and new_task:
                 # Add new task to Google Sheet
-                try:
-                    scope = [
-                        "https://spreadsheets.google.com/feeds",
-                        "https://www.googleapis.com/auth/drive"
-                    ]
-                    creds_dict = st.secrets["gcp_service_account"]
-                    from google.oauth2.service_account import Credentials
-                    creds = Credentials.from_service_account_info(creds_dict, scopes=scope)
-                    import gspread
-                    client = gspread.authorize(creds)
-                    sheet_id = "1U_9CEbWHWMQVS2C20O0fpOG5gVxoYjB7BmppKlTHIzc"
-                    sheet = client.open_by_key(sheet_id).worksheet("Otter_Tasks")
-
-                    # Append new row with all fields including Transcript ID, Date Added, and Priority
-                    # Column order: Transcript, Date Assigned, Person, Task, Project, Status, Due Date, Notes, Progress %, (empty cols), Priority (col 14)
-                    # For append_row, we need to specify values up to column 14
-                    new_row = [
-                        new_transcript_id,      # Col 1: Transcript
-                        new_date_added,         # Col 2: Date Assigned
-                        user_name,              # Col 3: Person
-                        new_task,               # Col 4: Task
-                        new_project,            # Col 5: Project
-                        new_status,             # Col 6: Status
-                        new_due_date,           # Col 7: Due Date
-                        "",                     # Col 8: Notes (empty)
-                        new_progress,           # Col 9: Progress %
-                        "", "", "", "",         # Cols 10-13: Empty
-                        new_priority            # Col 14: Priority
-                    ]
-                    sheet.append_row(new_row)
-
-                    st.success("Task added successfully!")
+                # Column order: Transcript, Date Assigned, Person, Task, Project, Status, Due Date, Notes, Progress %, (empty cols), Priority (col 14)
+                # For append_row, we need to specify values up to column 14
+                new_row = [
+                    new_transcript_id,      # Col 1: Transcript
+                    new_date_added,         # Col 2: Date Assigned
+                    user_name,              # Col 3: Person
+                    new_task,               # Col 4: Task
+                    new_project,            # Col 5: Project
+                    new_status,             # Col 6: Status
+                    new_due_date,           # Col 7: Due Date
+                    "",                     # Col 8: Notes (empty)
+                    new_progress,           # Col 9: Progress %
+                    "", "", "", "",         # Cols 10-13: Empty
+                    new_priority            # Col 14: Priority
+                ]
+
+                # A queued row is already journaled - close the form so it can't be submitted twice
+                result = append_task_row(new_row)
+                if result in ("committed", "queued"):
                     st.session_state.show_add_task_form = False
+                    if result == "queued":
+                        st.session_state.add_task_notice = ("warning", "Google Sheets is unavailable - your task is saved locally and will be added on the next save or restart.")
+                    else:
+                        st.session_state.add_task_notice = ("success", "Task added successfully!")
                     st.rerun()
-                except Exception as e:
-                    st.error(f"Error adding task: {str(e)}")
 
             if cancel:
                 st.session_state.show_add_task_form = False
                 st.rerun()
 
+    _render_my_tasks_panel(personal_df, user_name, is_tea)
+
+@fragment
+def _render_my_tasks_panel(personal_df, user_name, is_tea):
+    """
+    Archive/transcript toggles and the editable grid.
+    Runs as a fragment: toggling a filter or editing a cell reruns only this panel.
+    """
     # Add control checkboxes right above the table
     ctrl_col1, ctrl_col2, ctrl_col3 = st.columns([1, 1, 3])
 
@@ -0,0 +1,272 @@
+"""
+MetaFlex Sheet Write Journal
+Local write-ahead log for every mutation sent to Google Sheets.
+
+Each outgoing write is appended (and fsync'd) to a JSON-lines file BEFORE it is
+dispatched, then a "committed" marker is appended once Sheets accepts it.
+Anything still pending after a crash, restart or API error is replayed in order.
+
+A replayed write whose rows were changed by someone else in the meantime gets a
+"conflict" marker instead: it stays in the journal (with the skipped rows) until
+its author has been shown the edits that were not applied and dismisses them
+("resolved" marker). A write that fails for good (e.g. a protected range or lost
+permission) is kept the same way with a "failed" marker, so it neither blocks
+the writes queued behind it nor gets retried forever.
+"""
+
+import json
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows: no OS lock, single-process deployments only
+    fcntl = None
+
+# Journal lives next to the app, outside of git (see .gitignore)
+JOURNAL_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".metaflex")
+JOURNAL_PATH = os.path.join(JOURNAL_DIR, "sheet_journal.jsonl")
+
+# Every server process on the host shares the journal file, so each lock is a
+# thread lock (sessions of one process) plus an flock on a sibling lock file
+# (other processes). The journal lock covers each read/append/compact, the
+# replay lock a whole replay so no entry is dispatched by two processes at once.
+_journal_lock = threading.Lock()
+_replay_lock = threading.Lock()
+
+
+@contextmanager
+def _locked(thread_lock, suffix):
+    with thread_lock:
+        os.makedirs(JOURNAL_DIR, exist_ok=True)
+        with open(JOURNAL_PATH + suffix, "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            yield  # Closing the file releases the flock
+
+
+def _journal_locked():
+    return _locked(_journal_lock, ".lock")
+
+
+def _write_line(record):
+    """Append a single JSON record and force it to disk"""
+    os.makedirs(JOURNAL_DIR, exist_ok=True)
+    line = json.dumps(record, ensure_ascii=False, default=str) + "\n"
+    with open(JOURNAL_PATH, "a", encoding="utf-8") as f:
+        f.write(line)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def _read_records():
+    """Read every record in the journal, skipping a torn trailing line"""
+    if not os.path.exists(JOURNAL_PATH):
+        return []
+
+    records = []
+    with open(JOURNAL_PATH, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                # A crash mid-write can leave a partial last line - ignore it
+                continue
+    return records
+
+
+# Markers that take an entry out of the pending queue / out of the journal
+_DONE_STATES = {"committed", "conflict", "failed", "resolved"}
+_CLOSED_STATES = {"committed", "resolved"}
+
+
+def append_entry(op, payload, author=None):
+    """
+    Record a mutation before it is dispatched to Google Sheets.
+
+    Args:
+        op: Operation name understood by the dispatcher (e.g. "sync_rows", "append_row")
+        payload: JSON-serializable operation arguments
+        author: User who made the change (told about conflicts on replay)
+
+    Returns:
+        The new entry dict (with its "id")
+    """
+    entry = {
+        "id": uuid.uuid4().hex,
+        "ts": time.time(),
+        "state": "pending",
+        "op": op,
+        "payload": payload,
+        "author": author,
+    }
+    with _journal_locked():
+        _write_line(entry)
+    return entry
+
+
+def mark_committed(entry_id):
+    """Record that a journaled mutation was accepted by Google Sheets"""
+    with _journal_locked():
+        _write_line({"id": entry_id, "ts": time.time(), "state": "committed"})
+
+
+def mark_attempted(entry_id):
+    """
+    Record that a non-idempotent call (an append) of this mutation is about to
+    be sent. Replays of it see entry["attempted"] and must first check whether
+    Sheets already applied it (a timeout can arrive after the rows were added).
+    """
+    with _journal_locked():
+        _write_line({"id": entry_id, "ts": time.time(), "state": "attempted"})
+
+
+def mark_conflict(entry_id, rows):
+    """
+    Record that a replayed mutation was applied except for `rows` (sheet row
+    numbers changed by someone else). Kept until resolve() is called.
+    """
+    with _journal_locked():
+        _write_line({"id": entry_id, "ts": time.time(), "state": "conflict", "rows": list(rows)})
+
+
+def mark_failed(entry_id, error):
+    """
+    Record that a mutation failed with an error retrying won't fix.
+    Kept (with the error message) until resolve() is called.
+    """
+    with _journal_locked():
+        _write_line({"id": entry_id, "ts": time.time(), "state": "failed", "error": str(error)})
+
+
+def resolve(entry_id):
+    """Record that the author has seen a conflicted or failed entry - it is dropped on the next compact"""
+    with _journal_locked():
+        _write_line({"id": entry_id, "ts": time.time(), "state": "resolved"})
+
+
+def pending_entries():
+    """Return all journaled mutations that were never applied, oldest first"""
+    with _journal_locked():
+        records = _read_records()
+
+    done_ids = {r["id"] for r in records if r.get("state") in _DONE_STATES}
+    attempted_ids = {r["id"] for r in records if r.get("state") == "attempted"}
+    return [
+        dict(r, attempted=r["id"] in attempted_ids) for r in records
+        if r.get("state") == "pending" and r["id"] not in done_ids
+    ]
+
+
+def _unresolved_entries(state, field, default, author):
+    """Pending records marked `state` and not resolved, with the marker's `field` attached"""
+    with _journal_locked():
+        records = _read_records()
+
+    resolved_ids = {r["id"] for r in records if r.get("state") == "resolved"}
+    details = {
+        r["id"]: r.get(field, default) for r in records
+        if r.get("state") == state and r["id"] not in resolved_ids
+    }
+    return [
+        r for r in records
+        if r.get("state") == "pending" and r["id"] in details
+        and (author is None or r.get("author") == author)
+    ], details
+
+
+def conflicted_entries(author=None):
+    """
+    Return unresolved conflicted mutations, oldest first, each with a
+    "conflict_rows" list. Pass author to get only that user's entries.
+    """
+    entries, rows = _unresolved_entries("conflict", "rows", [], author)
+    return [dict(r, conflict_rows=rows[r["id"]]) for r in entries]
+
+
+def failed_entries(author=None):
+    """
+    Return unresolved failed mutations, oldest first, each with the "error"
+    that stopped it. Pass author to get only that user's entries.
+    """
+    entries, errors = _unresolved_entries("failed", "error", "", author)
+    return [dict(r, error=errors[r["id"]]) for r in entries]
+
+
+def compact():
+    """
+    Rewrite the journal keeping only entries still pending or in conflict.
+    Uses an atomic rename so a crash never leaves a half-written journal.
+    """
+    with _journal_locked():
+        records = _read_records()
+        closed_ids = {r["id"] for r in records if r.get("state") in _CLOSED_STATES}
+        live = [r for r in records if r["id"] not in closed_ids]
+
+        if not records or len(live) == len(records):
+            return
+
+        tmp_path = JOURNAL_PATH + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for record in live:
+                f.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, JOURNAL_PATH)
+
+
+def replay_pending(dispatch, retryable=None):
+    """
+    Re-apply every uncommitted mutation in order.
+
+    Args:
+        dispatch: Callable taking a journal entry and applying it to Google Sheets.
+                  Must raise on failure. May return the sheet rows it skipped
+                  because of conflicts - the entry is then marked "conflict".
+        retryable: Callable telling whether an exception is worth retrying later.
+                   Entries failing with anything else are marked "failed" and
+                   replay moves on. None treats every error as retryable.
+
+    Returns:
+        Tuple of (applied_count, remaining_count). Replay stops at the first
+        retryable failure so later writes are never applied ahead of earlier ones.
+        Replays are serialized across processes; a caller that had to wait only
+        sees what the previous replay left pending.
+    """
+    with _locked(_replay_lock, ".replay.lock"):
+        return _replay_pending(dispatch, retryable)
+
+
+def _replay_pending(dispatch, retryable):
+    # Read under the replay lock: entries another process just replayed are done
+    pending = pending_entries()
+    applied = 0
+    failed = 0
+
+    for entry in pending:
+        try:
+            conflicts = dispatch(entry)
+        except Exception as e:
+            if retryable is None or retryable(e):
+                print(f"⚠️ Sheet journal replay stopped at {entry['id']}: {str(e)}")
+                break
+            print(f"⚠️ Sheet journal entry {entry['id']} failed for good: {str(e)}")
+            mark_failed(entry["id"], e)
+            failed += 1
+            continue
+        if conflicts:
+            mark_conflict(entry["id"], conflicts)
+        else:
+            mark_committed(entry["id"])
+        applied += 1
+
+    if applied:
+        compact()
+
+    return applied, len(pending) - applied - failed
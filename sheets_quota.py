@@ -0,0 +1,211 @@
+"""
+MetaFlex Sheets Quota Guard
+Process-wide rate limiting, retry and circuit breaking for Google Sheets calls.
+
+- Token bucket tuned to the Sheets per-minute quota, shared by every session
+- Exponential backoff with full jitter on 429 / 5xx / connection errors
+  (non-idempotent calls such as appends are only retried on 429, see call_sheets)
+- Circuit breaker: after repeated failures, calls fail fast for a cool-down
+  period so callers can serve the last good snapshot instead of hammering the API
+"""
+
+import random
+import threading
+import time
+
+import requests
+from gspread.exceptions import APIError
+
+# Google Sheets default quota: 60 read requests per minute per user
+REQUESTS_PER_MINUTE = 60
+BURST = 10
+
+MAX_RETRIES = 4
+BACKOFF_BASE_SECONDS = 1.0
+BACKOFF_MAX_SECONDS = 32.0
+
+BREAKER_FAILURE_THRESHOLD = 5
+BREAKER_RESET_SECONDS = 60
+
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class SheetsUnavailable(Exception):
+    """Raised when the circuit breaker is open and Sheets calls are being skipped"""
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled continuously at rate_per_minute"""
+
+    def __init__(self, rate_per_minute, burst):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Take one token, sleeping until one is available.
+        Returns the number of seconds spent waiting (0 if not throttled).
+        """
+        waited = 0.0
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
+
+
+class CircuitBreaker:
+    """
+    Classic closed -> open -> half_open breaker.
+    Open after `failure_threshold` consecutive failures, allow one trial call
+    after `reset_seconds` (every other caller still fails fast while it runs),
+    close again on the first success.
+    """
+
+    def __init__(self, failure_threshold, reset_seconds):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self.lock = threading.Lock()
+
+    def allow(self):
+        with self.lock:
+            if self.state == "open":
+                if time.monotonic() - self.opened_at >= self.reset_seconds:
+                    self.state = "half_open"
+                    return True  # The single trial call
+                return False
+            # half_open: the trial call is still running
+            return self.state == "closed"
+
+    def record_success(self):
+        with self.lock:
+            self.state = "closed"
+            self.failures = 0
+
+    def record_failure(self):
+        """Returns True if this failure tripped the breaker open"""
+        with self.lock:
+            self.failures += 1
+            if self.state == "half_open" or self.failures >= self.failure_threshold:
+                tripped = self.state != "open"
+                self.state = "open"
+                self.opened_at = time.monotonic()
+                return tripped
+            return False
+
+
+_bucket = TokenBucket(REQUESTS_PER_MINUTE, BURST)
+_breaker = CircuitBreaker(BREAKER_FAILURE_THRESHOLD, BREAKER_RESET_SECONDS)
+
+_metrics_lock = threading.Lock()
+_metrics = {
+    "calls": 0,
+    "throttled_calls": 0,
+    "throttled_seconds": 0.0,
+    "retries": 0,
+    "failures": 0,
+    "short_circuited": 0,
+    "breaker_trips": 0,
+}
+
+
+def _count(name, amount=1):
+    with _metrics_lock:
+        _metrics[name] += amount
+
+
+def _status_code(error):
+    status = getattr(error, "code", None)
+    if status is None and getattr(error, "response", None) is not None:
+        status = error.response.status_code
+    return status
+
+
+def _is_retryable(error):
+    """429 / 5xx API errors and transport errors are worth retrying"""
+    if isinstance(error, APIError):
+        return _status_code(error) in RETRYABLE_STATUS_CODES
+    return isinstance(error, (requests.ConnectionError, requests.Timeout))
+
+
+def is_transient(error):
+    """
+    True for failures worth trying again later (quota, 5xx, network, open breaker).
+    Anything else (400/403 API errors, bad arguments...) will fail the same way on retry.
+    """
+    return isinstance(error, SheetsUnavailable) or _is_retryable(error)
+
+
+def _is_rate_limited(error):
+    """429: the request was rejected before Google did anything with it"""
+    return isinstance(error, APIError) and _status_code(error) == 429
+
+
+def call_sheets(fn, *args, idempotent=True, **kwargs):
+    """
+    Run one Google Sheets / Drive API call under the shared limiter and breaker.
+
+    Pass idempotent=False for calls that must not run twice (append_row(s)):
+    a 5xx, timeout or dropped connection can arrive after Google already
+    applied the call, so those are only retried on 429.
+
+    Raises SheetsUnavailable while the breaker is open, otherwise re-raises the
+    last error once retries are exhausted (or immediately for non-retryable errors).
+    """
+    if not _breaker.allow():
+        _count("short_circuited")
+        raise SheetsUnavailable("Google Sheets is temporarily unavailable (circuit open)")
+
+    for attempt in range(MAX_RETRIES + 1):
+        waited = _bucket.acquire()
+        if waited:
+            _count("throttled_calls")
+            _count("throttled_seconds", waited)
+        _count("calls")
+
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as e:
+            if not _is_retryable(e):
+                # Caller errors (bad range, permissions...) mean the API answered -
+                # healthy, just not worth retrying (also ends a half-open trial)
+                _breaker.record_success()
+                raise
+
+            if attempt == MAX_RETRIES or not (idempotent or _is_rate_limited(e)):
+                _count("failures")
+                if _breaker.record_failure():
+                    _count("breaker_trips")
+                    print(f"⚠️ Sheets circuit breaker OPEN for {_breaker.reset_seconds}s after: {str(e)}")
+                raise
+
+            # Exponential backoff with full jitter
+            _count("retries")
+            delay = random.uniform(0, min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * (2 ** attempt)))
+            time.sleep(delay)
+            continue
+
+        _breaker.record_success()
+        return result
+
+
+def get_metrics():
+    """Snapshot of limiter counters plus the current breaker state"""
+    with _metrics_lock:
+        metrics = dict(_metrics)
+    metrics["breaker_state"] = _breaker.state
+    metrics["breaker_failures"] = _breaker.failures
+    metrics["available_tokens"] = round(_bucket.tokens, 2)
+    return metrics
@@ -0,0 +1,123 @@
+"""
+MetaFlex Snapshot Store
+Persists the typed task snapshot to a local Arrow IPC file after each refresh,
+so a restarted server can memory-map it and render instantly (marked stale)
+while the first Google Sheets refresh runs in the background.
+
+Multi-process deployments: point METAFLEX_SNAPSHOT_DIR at a directory every
+replica can see (e.g. /dev/shm/metaflex for shared memory on one host) and set
+METAFLEX_SNAPSHOT_ROLE=fetcher on exactly one process and =reader on the rest.
+The fetcher publishes each new snapshot plus a tiny version header; readers
+only check the header and re-map the Arrow file when the version changes.
+"""
+
+import json
+import os
+import time
+
+import pandas as pd
+import pyarrow as pa
+
+SNAPSHOT_DIR = os.environ.get(
+    "METAFLEX_SNAPSHOT_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".metaflex"),
+)
+SNAPSHOT_PATH = os.path.join(SNAPSHOT_DIR, "sheet_snapshot.arrow")
+VERSION_PATH = os.path.join(SNAPSHOT_DIR, "sheet_snapshot.version")
+
+# "fetcher" polls Google Sheets and publishes, "reader" only maps published
+# snapshots, empty = standalone process (fetches and persists for itself)
+SNAPSHOT_ROLE = os.environ.get("METAFLEX_SNAPSHOT_ROLE", "").strip().lower()
+
+# Key under which our JSON metadata is stored in the Arrow schema
+_METADATA_KEY = b"metaflex"
+
+
+def save_snapshot(df, revision, extra=None, fetched_at=None):
+    """
+    Write the snapshot atomically (temp file + rename) as an uncompressed
+    Arrow IPC file, which can be memory-mapped on read.
+
+    Args:
+        df: Snapshot DataFrame
+        revision: Sheet revision the snapshot was loaded at
+        extra: Optional JSON-serializable metadata stored alongside the data
+        fetched_at: When the data was downloaded (time.time()), published in
+                    the header so readers can tell whether it predates a write
+    """
+    # df.attrs carries in-memory objects (e.g. SheetRowMeta) - persist those via `extra` instead
+    frame = df.copy(deep=False)
+    frame.attrs = {}
+    table = pa.Table.from_pandas(frame, preserve_index=True)
+    metadata = dict(table.schema.metadata or {})
+    metadata[_METADATA_KEY] = json.dumps({
+        "revision": revision,
+        "saved_at": time.time(),
+        "fetched_at": fetched_at,
+        "extra": extra or {},
+    }).encode("utf-8")
+    table = table.replace_schema_metadata(metadata)
+
+    os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+    tmp_path = SNAPSHOT_PATH + ".tmp"
+    with pa.OSFile(tmp_path, "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    # Readers that already mapped the old file keep their (unlinked) copy
+    os.replace(tmp_path, SNAPSHOT_PATH)
+
+    # Publish the version header last, so it never points at a half-written file
+    version_tmp = VERSION_PATH + ".tmp"
+    with open(version_tmp, "w", encoding="utf-8") as f:
+        json.dump({"version": f"{revision}@{time.time():.6f}", "revision": revision, "fetched_at": fetched_at}, f)
+    os.replace(version_tmp, VERSION_PATH)
+
+
+def published_header():
+    """
+    Read the published version header (a few bytes, no Arrow parsing):
+    {"version", "revision", "fetched_at"}. Returns None if nothing has been
+    published yet.
+    """
+    try:
+        with open(VERSION_PATH, encoding="utf-8") as f:
+            header = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return header if header.get("version") else None
+
+
+def published_version():
+    """The published snapshot's version, or None if nothing has been published yet"""
+    header = published_header()
+    return header["version"] if header else None
+
+
+def _arrow_string_mapper(arrow_type):
+    if arrow_type in (pa.string(), pa.large_string()):
+        return pd.StringDtype("pyarrow")
+    return None
+
+
+def load_snapshot():
+    """
+    Memory-map the saved snapshot.
+
+    Returns:
+        (df, info) where info has "revision", "saved_at" and "extra",
+        or (None, None) if there is no usable snapshot on disk.
+    """
+    if not os.path.exists(SNAPSHOT_PATH):
+        return None, None
+
+    try:
+        with pa.memory_map(SNAPSHOT_PATH, "r") as source:
+            table = pa.ipc.open_file(source).read_all()
+        raw = (table.schema.metadata or {}).get(_METADATA_KEY)
+        info = json.loads(raw.decode("utf-8")) if raw else {}
+        # Keep text columns Arrow-backed: wraps the mapped buffers instead of
+        # building one Python str object per cell
+        return table.to_pandas(types_mapper=_arrow_string_mapper), info
+    except Exception as e:
+        print(f"⚠️ Could not read snapshot {SNAPSHOT_PATH}: {str(e)}")
+        return None, None
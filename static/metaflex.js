@@ -1,452 +1,290 @@
 /* ============================================
    METAFLEX OPERATIONS SYSTEM - PREMIUM JS
-   Version 5.0 - "GET A GRIP ON LIFE"
+   Version 5.1 - "GET A GRIP ON LIFE"
    Brand Personality: Bold, Empowering, Dynamic
+
+   Incremental enhancer: each element is set up once, when Streamlit (or
+   AgGrid) adds it to the page - never by re-walking the whole DOM. Hover and
+   click effects run through one delegated listener per event type instead
+   of per-element listeners, so nothing piles up as reruns and grid scrolling
+   recycle nodes.
+
+   This script only reaches the app page since it is linked as a static
+   asset (it never executed while inlined). The motivational tooltips,
+   metric counters/sparkles, row scaling and entrance animations it used to
+   carry were dropped rather than switched on: they never shipped, the
+   counters rewrote React-owned text and row transforms fight AgGrid's own
+   row positioning.
    ============================================ */
 
 (function() {
     'use strict';
-    
-    // Wait for DOM to be fully loaded
+
+    // Max milliseconds of enhancement work per animation frame - the rest of
+    // the queue waits for the next frame so big tables never block scrolling
+    const FRAME_BUDGET_MS = 8;
+
+    // Script re-linked with a new version (see static_assets.link_assets):
+    // tear the previous instance down so listeners are never registered twice
+    if (window.MetaFlexSystem && typeof window.MetaFlexSystem.teardown === 'function') {
+        window.MetaFlexSystem.teardown();
+    }
+
+    const SELECTORS = {
+        logo: '[data-testid="stImage"] img, .logo, [alt*="MetaFlex"], img[src*="logo"]',
+        chart: '[data-testid="stPlotlyChart"]',
+        navButton: '[data-testid="stVerticalBlock"] > [data-testid="stHorizontalBlock"]:first-child button'
+    };
+
     function initMetaFlexSystem() {
         console.log('🚀 MetaFlex Operations System Initializing...');
-        
+
+        // Removes every delegated listener at once on teardown
+        const listeners = new AbortController();
+        let domObserver = null;
+
         // ============================================
-        // 1. LOGO GRIP INTERACTION
+        // 1. ONE-TIME ELEMENT ENHANCERS
         // ============================================
-        function initLogoGrip() {
-            const logos = document.querySelectorAll('[data-testid="stImage"] img, .logo, [alt*="MetaFlex"], img[src*="logo"]');
-            
-            logos.forEach(logo => {
-                if (!logo) return;
-                
-                logo.style.cursor = 'grab';
-                logo.style.transition = 'all 0.3s cubic-bezier(0.4, 0, 0.2, 1)';
-                
-                // Add pulse animation
-                logo.style.animation = 'pulse 2s ease-in-out infinite';
-                
-                logo.addEventListener('mousedown', function(e) {
-                    this.style.cursor = 'grabbing';
-                    this.style.transform = 'rotate(15deg) scale(1.15)';
-                    this.style.filter = 'drop-shadow(0 6px 20px rgba(212, 255, 0, 0.6))';
-                });
-                
-                logo.addEventListener('mouseup', function(e) {
-                    this.style.cursor = 'grab';
-                    this.style.transform = 'rotate(0deg) scale(1)';
-                    this.style.filter = 'drop-shadow(0 2px 8px rgba(212, 255, 0, 0.3))';
-                });
-                
-                logo.addEventListener('mouseleave', function(e) {
-                    this.style.cursor = 'grab';
-                    this.style.transform = 'rotate(0deg) scale(1)';
-                    this.style.filter = 'drop-shadow(0 2px 8px rgba(212, 255, 0, 0.3))';
-                });
-            });
-            
-            console.log('✅ Logo grip initialized');
+        // Run once per element (tracked in a WeakSet per enhancer, so removed
+        // nodes are garbage collected). Only setup that has to touch the
+        // element itself lives here - interaction goes through section 2.
+        const ENHANCERS = [
+            {
+                // Logo grip
+                selector: SELECTORS.logo,
+                enhance(logo) {
+                    logo.style.cursor = 'grab';
+                    logo.style.transition = 'all 0.3s cubic-bezier(0.4, 0, 0.2, 1)';
+                }
+            },
+            {
+                selector: SELECTORS.chart,
+                enhance(chart) {
+                    chart.style.transition = 'all 0.3s cubic-bezier(0.4, 0, 0.2, 1)';
+                }
+            }
+        ];
+        ENHANCERS.forEach(enhancer => { enhancer.done = new WeakSet(); });
+
+        function enhanceElement(enhancer, el) {
+            if (enhancer.done.has(el) || !el.isConnected) return;
+            enhancer.done.add(el);
+            enhancer.enhance(el);
         }
-        
+
         // ============================================
-        // 2. VICTORY SPARKLES ON METRIC HOVER
+        // 2. DELEGATED INTERACTIONS
         // ============================================
-        function initMetricSparkles() {
-            const metrics = document.querySelectorAll('[data-testid="metric-container"]');
-            
-            metrics.forEach(metric => {
-                metric.addEventListener('mouseenter', function() {
-                    // Create sparkle element
-                    const sparkle = document.createElement('div');
-                    sparkle.innerHTML = '⚡';
-                    sparkle.style.cssText = `
-                        position: absolute;
-                        top: 10px;
-                        right: 10px;
-                        font-size: 32px;
-                        animation: sparkleAnimation 0.8s ease-out;
-                        pointer-events: none;
-                        z-index: 10;
-                    `;
-                    
-                    this.style.position = 'relative';
-                    this.appendChild(sparkle);
-                    
-                    // Add grip texture on hover
-                    this.classList.add('grip-texture');
-                    
-                    setTimeout(() => {
-                        sparkle.remove();
-                        this.classList.remove('grip-texture');
-                    }, 800);
-                });
-            });
-            
-            console.log('✅ Metric sparkles initialized');
+        // One listener per event type on the document. mouseover/mouseout
+        // bubble, so they stand in for per-element mouseenter/mouseleave:
+        // an element is "entered" when the pointer comes from outside it.
+        const HOVER_EFFECTS = [
+            { selector: SELECTORS.chart, enter: liftChart, leave: dropChart },
+            { selector: SELECTORS.logo, leave: releaseLogo }
+        ];
+
+        function hoverTarget(event, selector) {
+            const el = event.target.closest && event.target.closest(selector);
+            if (!el) return null;
+            // Moving between children of the same element is not an enter/leave
+            if (event.relatedTarget && el.contains(event.relatedTarget)) return null;
+            return el;
         }
-        
-        // ============================================
-        // 3. ANIMATED NUMBER COUNTERS
-        // ============================================
-        function initNumberCounters() {
-            const metrics = document.querySelectorAll('[data-testid="stMetricValue"]');
-            
-            metrics.forEach(metric => {
-                const text = metric.textContent.trim();
-                const number = parseInt(text.replace(/[^0-9]/g, ''));
-                
-                if (isNaN(number) || number === 0) return;
-                
-                // Only animate on first load
-                if (metric.dataset.animated) return;
-                metric.dataset.animated = 'true';
-                
-                let currentValue = 0;
-                const increment = number / 40;
-                const duration = 1500;
-                const stepTime = duration / 40;
-                
-                metric.textContent = '0';
-                
-                const timer = setInterval(() => {
-                    currentValue += increment;
-                    if (currentValue >= number) {
-                        metric.textContent = text; // Restore original text with any prefixes/suffixes
-                        clearInterval(timer);
-                    } else {
-                        metric.textContent = Math.floor(currentValue);
-                    }
-                }, stepTime);
-            });
-            
-            console.log('✅ Number counters initialized');
+
+        function onMouseOver(event) {
+            for (const effect of HOVER_EFFECTS) {
+                if (!effect.enter) continue;
+                const el = hoverTarget(event, effect.selector);
+                if (el) effect.enter(el);
+            }
         }
-        
-        // ============================================
-        // 4. MOTIVATIONAL TOOLTIPS
-        // ============================================
-        function initMotivationalTooltips() {
-            const motivations = [
-                "GET A GRIP! 💪",
-                "STAY IN CONTROL 🎯",
-                "DOMINATE TODAY 🔥",
-                "GRIP LIFE 👊",
-                "CRUSH IT! ⚡",
-                "TAKE CHARGE 🚀",
-                "OWN YOUR DAY 💥",
-                "STAY FOCUSED 🎯"
-            ];
-            
-            // Get all buttons, excluding navigation buttons to avoid interference
-            const buttons = document.querySelectorAll('button:not([data-testid="stVerticalBlock"] [data-testid="stHorizontalBlock"]:first-child button)');
-            
-            buttons.forEach(btn => {
-                btn.addEventListener('mouseenter', function(e) {
-                    // Don't add tooltip if already exists
-                    if (this.querySelector('.mf-tooltip')) return;
-                    
-                    const tooltip = document.createElement('div');
-                    tooltip.className = 'mf-tooltip';
-                    tooltip.textContent = motivations[Math.floor(Math.random() * motivations.length)];
-                    tooltip.style.cssText = `
-                        position: absolute;
-                        bottom: calc(100% + 8px);
-                        left: 50%;
-                        transform: translateX(-50%) translateY(0);
-                        background: #d4ff00;
-                        color: #1a2424;
-                        padding: 6px 14px;
-                        border-radius: 6px;
-                        font-size: 11px;
-                        font-weight: 800;
-                        text-transform: uppercase;
-                        letter-spacing: 0.5px;
-                        pointer-events: none;
-                        white-space: nowrap;
-                        z-index: 10000;
-                        box-shadow: 0 4px 12px rgba(212, 255, 0, 0.4);
-                        animation: tooltipSlideIn 0.3s ease-out;
-                    `;
-                    
-                    // Arrow
-                    const arrow = document.createElement('div');
-                    arrow.style.cssText = `
-                        position: absolute;
-                        top: 100%;
-                        left: 50%;
-                        transform: translateX(-50%);
-                        width: 0;
-                        height: 0;
-                        border-left: 6px solid transparent;
-                        border-right: 6px solid transparent;
-                        border-top: 6px solid #d4ff00;
-                    `;
-                    tooltip.appendChild(arrow);
-                    
-                    this.style.position = 'relative';
-                    this.appendChild(tooltip);
-                });
-                
-                btn.addEventListener('mouseleave', function() {
-                    const tooltip = this.querySelector('.mf-tooltip');
-                    if (tooltip) {
-                        tooltip.style.animation = 'tooltipSlideOut 0.2s ease-in';
-                        setTimeout(() => tooltip.remove(), 200);
-                    }
-                });
-            });
-            
-            console.log('✅ Motivational tooltips initialized');
+
+        function onMouseOut(event) {
+            for (const effect of HOVER_EFFECTS) {
+                if (!effect.leave) continue;
+                const el = hoverTarget(event, effect.selector);
+                if (el) effect.leave(el);
+            }
         }
-        
-        // ============================================
-        // 5. CHART HOVER ENHANCEMENTS
-        // ============================================
-        function initChartEnhancements() {
-            const charts = document.querySelectorAll('[data-testid="stPlotlyChart"]');
-            
-            charts.forEach(chart => {
-                chart.style.transition = 'all 0.3s cubic-bezier(0.4, 0, 0.2, 1)';
-                
-                chart.addEventListener('mouseenter', function() {
-                    this.style.transform = 'translateY(-4px)';
-                    this.style.boxShadow = '0 12px 28px rgba(15, 106, 106, 0.15), 0 4px 12px rgba(0, 0, 0, 0.08)';
-                });
-                
-                chart.addEventListener('mouseleave', function() {
-                    this.style.transform = 'translateY(0)';
-                    this.style.boxShadow = '0 2px 6px rgba(0, 0, 0, 0.05)';
-                });
-            });
-            
-            console.log('✅ Chart enhancements initialized');
+
+        function onMouseDown(event) {
+            const logo = event.target.closest && event.target.closest(SELECTORS.logo);
+            if (!logo) return;
+            logo.style.cursor = 'grabbing';
+            logo.style.transform = 'rotate(15deg) scale(1.15)';
+            logo.style.filter = 'drop-shadow(0 6px 20px rgba(212, 255, 0, 0.6))';
         }
-        
-        // ============================================
-        // 6. TABLE ROW HOVER EFFECTS
-        // ============================================
-        function initTableEffects() {
-            const tables = document.querySelectorAll('.ag-row, table tbody tr');
-            
-            tables.forEach(row => {
-                row.addEventListener('mouseenter', function() {
-                    this.style.transform = 'scale(1.002)';
-                    this.style.transition = 'all 0.2s ease';
-                });
-                
-                row.addEventListener('mouseleave', function() {
-                    this.style.transform = 'scale(1)';
-                });
-            });
-            
-            console.log('✅ Table effects initialized');
+
+        function onMouseUp(event) {
+            const logo = event.target.closest && event.target.closest(SELECTORS.logo);
+            if (logo) releaseLogo(logo);
         }
-        
-        // ============================================
-        // 7. SCROLL ANIMATIONS
-        // ============================================
-        function initScrollAnimations() {
-            const observerOptions = {
-                threshold: 0.1,
-                rootMargin: '0px 0px -50px 0px'
-            };
-            
-            const observer = new IntersectionObserver(function(entries) {
-                entries.forEach(entry => {
-                    if (entry.isIntersecting) {
-                        entry.target.classList.add('fade-in-up');
-                    }
-                });
-            }, observerOptions);
-            
-            // Observe sections and metric cards
-            document.querySelectorAll('[data-testid="stVerticalBlock"], [data-testid="metric-container"]').forEach(element => {
-                observer.observe(element);
-            });
-            
-            console.log('✅ Scroll animations initialized');
+
+        function releaseLogo(logo) {
+            logo.style.cursor = 'grab';
+            logo.style.transform = 'rotate(0deg) scale(1)';
+            logo.style.filter = 'drop-shadow(0 2px 8px rgba(212, 255, 0, 0.3))';
         }
-        
-        // ============================================
-        // 8. SUBTLE PARALLAX EFFECT
-        // ============================================
-        function initParallaxEffect() {
-            window.addEventListener('scroll', function() {
-                const scrolled = window.pageYOffset;
-                const parallaxElements = document.querySelectorAll('[data-testid="metric-container"]');
-                
-                parallaxElements.forEach((el, index) => {
-                    const speed = 0.05 + (index * 0.01);
-                    el.style.transform = `translateY(${scrolled * speed}px)`;
-                });
-            });
-            
-            console.log('✅ Parallax effect initialized');
+
+        // Navigation active state tracking
+        function onClick(event) {
+            const button = event.target.closest && event.target.closest(SELECTORS.navButton);
+            if (!button) return;
+            document.querySelectorAll('.active-nav').forEach(btn => btn.classList.remove('active-nav'));
+            button.classList.add('active-nav');
         }
-        
-        // ============================================
-        // 9. GRIP STRENGTH PROGRESS BARS
-        // ============================================
-        function initGripProgress() {
-            const progressBars = document.querySelectorAll('[data-testid="stProgress"], .stProgress');
-            
-            progressBars.forEach(bar => {
-                bar.style.animation = 'gripPulse 2s ease-in-out infinite';
-            });
-            
-            console.log('✅ Grip progress initialized');
+
+        // Chart hover enhancements
+        function liftChart(chart) {
+            chart.style.transform = 'translateY(-4px)';
+            chart.style.boxShadow = '0 12px 28px rgba(15, 106, 106, 0.15), 0 4px 12px rgba(0, 0, 0, 0.08)';
         }
-        
-        // ============================================
-        // 10. NAVIGATION ACTIVE STATE TRACKING
-        // ============================================
-        function initNavTracking() {
-            const navButtons = document.querySelectorAll('[data-testid="stVerticalBlock"] > [data-testid="stHorizontalBlock"]:first-child button');
-            
-            navButtons.forEach(button => {
-                button.addEventListener('click', function() {
-                    // Remove active class from all buttons
-                    navButtons.forEach(btn => btn.classList.remove('active-nav'));
-                    // Add active class to clicked button
-                    this.classList.add('active-nav');
-                });
-            });
-            
-            console.log('✅ Nav tracking initialized');
+
+        function dropChart(chart) {
+            chart.style.transform = 'translateY(0)';
+            chart.style.boxShadow = '0 2px 6px rgba(0, 0, 0, 0.05)';
         }
-        
+
+        function initDelegatedListeners() {
+            const options = { signal: listeners.signal, passive: true };
+            document.addEventListener('mouseover', onMouseOver, options);
+            document.addEventListener('mouseout', onMouseOut, options);
+            document.addEventListener('mousedown', onMouseDown, options);
+            document.addEventListener('mouseup', onMouseUp, options);
+            document.addEventListener('click', onClick, options);
+
+            console.log('✅ Delegated interactions initialized');
+        }
+
         // ============================================
-        // 11. INJECT CUSTOM ANIMATIONS CSS
+        // 3. INJECT STYLES
         // ============================================
-        function injectAnimations() {
+        function injectStyles() {
+            // Already there from a previous version of this script
+            if (document.getElementById('metaflex-styles')) return;
+
             const style = document.createElement('style');
+            style.id = 'metaflex-styles';
             style.textContent = `
-                /* MetaFlex Animations */
-                @keyframes sparkleAnimation {
-                    0% {
-                        opacity: 0;
-                        transform: scale(0) rotate(0deg);
-                    }
-                    50% {
-                        opacity: 1;
-                        transform: scale(1.5) rotate(180deg);
-                    }
-                    100% {
-                        opacity: 0;
-                        transform: scale(0) rotate(360deg);
-                    }
-                }
-                
-                @keyframes tooltipSlideIn {
-                    from {
-                        opacity: 0;
-                        transform: translateX(-50%) translateY(10px);
-                    }
-                    to {
-                        opacity: 1;
-                        transform: translateX(-50%) translateY(0);
-                    }
-                }
-                
-                @keyframes tooltipSlideOut {
-                    from {
-                        opacity: 1;
-                        transform: translateX(-50%) translateY(0);
-                    }
-                    to {
-                        opacity: 0;
-                        transform: translateX(-50%) translateY(10px);
-                    }
-                }
-                
-                @keyframes fadeInUp {
-                    from {
-                        opacity: 0;
-                        transform: translateY(30px);
-                    }
-                    to {
-                        opacity: 1;
-                        transform: translateY(0);
-                    }
-                }
-                
-                @keyframes pulse {
-                    0%, 100% { transform: scale(1); }
-                    50% { transform: scale(1.05); }
-                }
-                
-                @keyframes gripPulse {
-                    0%, 100% {
-                        box-shadow: 0 0 10px rgba(212, 255, 0, 0.3);
-                    }
-                    50% {
-                        box-shadow: 0 0 20px rgba(212, 255, 0, 0.6);
-                    }
-                }
-                
-                .fade-in-up {
-                    animation: fadeInUp 0.6s ease-out;
-                }
-                
                 .active-nav {
                     background: #d4ff00 !important;
                     color: #1a2424 !important;
                     font-weight: 800 !important;
                     box-shadow: 0 4px 16px rgba(212, 255, 0, 0.3), 0 0 30px rgba(212, 255, 0, 0.3) !important;
                 }
-                
-                .grip-texture::after {
-                    content: '';
-                    position: absolute;
-                    top: 0;
-                    left: 0;
-                    right: 0;
-                    bottom: 0;
-                    background-image: 
-                        repeating-linear-gradient(
-                            45deg,
-                            transparent,
-                            transparent 2px,
-                            rgba(212, 255, 0, 0.03) 2px,
-                            rgba(212, 255, 0, 0.03) 4px
-                        );
-                    pointer-events: none;
-                    border-radius: inherit;
-                }
             `;
             document.head.appendChild(style);
-            
-            console.log('✅ Animations injected');
         }
-        
+
         // ============================================
-        // 12. HANDLE STREAMLIT RERUNS
+        // 4. INCREMENTAL RERUN HANDLING
         // ============================================
+        // The observer only queues the element nodes each mutation added
+        // (roots). A requestAnimationFrame loop expands each root into the
+        // (enhancer, element) pairs its subtree matches and enhances them one
+        // by one, checking FRAME_BUDGET_MS after every element - a single huge
+        // insertion is spread over as many frames as it needs.
+        let roots = [];
+        let nextRoot = 0;
+        let clock = 0;
+        const rootStates = new Map();   // root -> { queuedAt, expandedAt (null = waiting, 0 = skipped) }
+        let work = [];
+        let nextWork = 0;
+        let frameRequested = false;
+
+        function queueRoot(node) {
+            const state = rootStates.get(node);
+            if (state && state.expandedAt === null) return;   // Already waiting
+            rootStates.set(node, { queuedAt: ++clock, expandedAt: null });
+            roots.push(node);
+        }
+
+        function coveredByAncestor(node, queuedAt) {
+            for (let el = node.parentElement; el; el = el.parentElement) {
+                const state = rootStates.get(el);
+                // An ancestor walked after this subtree was added already saw all of it
+                if (state && state.expandedAt > queuedAt) return true;
+            }
+            return false;
+        }
+
+        function expandRoot(root) {
+            const state = rootStates.get(root);
+            state.expandedAt = 0;
+            // Skip nodes that were removed again before we got to them, and
+            // subtrees an ancestor's walk already covered
+            if (!root.isConnected || coveredByAncestor(root, state.queuedAt)) return;
+            state.expandedAt = ++clock;
+            for (const enhancer of ENHANCERS) {
+                if (root.matches(enhancer.selector)) work.push([enhancer, root]);
+                // Scoped to the added subtree, not the whole document
+                for (const el of root.querySelectorAll(enhancer.selector)) {
+                    work.push([enhancer, el]);
+                }
+            }
+        }
+
+        function scheduleDrain() {
+            if (frameRequested) return;
+            frameRequested = true;
+            requestAnimationFrame(drainQueue);
+        }
+
+        function drainQueue() {
+            frameRequested = false;
+            const deadline = performance.now() + FRAME_BUDGET_MS;
+            while (performance.now() < deadline) {
+                if (nextWork < work.length) {
+                    const [enhancer, el] = work[nextWork++];
+                    enhanceElement(enhancer, el);
+                } else if (nextRoot < roots.length) {
+                    expandRoot(roots[nextRoot++]);
+                } else {
+                    break;
+                }
+            }
+            if (nextWork < work.length || nextRoot < roots.length) {
+                scheduleDrain();
+            } else {
+                resetQueue();
+            }
+        }
+
+        function resetQueue() {
+            roots = [];
+            nextRoot = 0;
+            rootStates.clear();
+            work = [];
+            nextWork = 0;
+        }
+
         function handleStreamlitReruns() {
-            // Observe DOM changes to reinitialize effects after Streamlit reruns
-            const streamlitObserver = new MutationObserver(function(mutations) {
-                // Debounce to avoid too many reinitializations
-                clearTimeout(window.metaflexReinitTimer);
-                window.metaflexReinitTimer = setTimeout(() => {
-                    console.log('🔄 Reinitializing MetaFlex after Streamlit rerun...');
-                    initMetricSparkles();
-                    initChartEnhancements();
-                    initTableEffects();
-                    initMotivationalTooltips();
-                    initLogoGrip();
-                }, 500);
+            domObserver = new MutationObserver(function(mutations) {
+                for (const mutation of mutations) {
+                    for (const node of mutation.addedNodes) {
+                        if (node.nodeType === Node.ELEMENT_NODE) queueRoot(node);
+                    }
+                }
+                if (nextRoot < roots.length) scheduleDrain();
             });
-            
-            streamlitObserver.observe(document.body, {
+
+            domObserver.observe(document.body, {
                 childList: true,
                 subtree: true
             });
-            
+
             console.log('✅ Streamlit rerun handler initialized');
         }
-        
+
+        function teardown() {
+            listeners.abort();
+            if (domObserver) domObserver.disconnect();
+            resetQueue();
+        }
+
         // ============================================
-        // 13. PERFORMANCE METRICS LOGGER
+        // 5. PERFORMANCE METRICS LOGGER
         // ============================================
         function logPerformanceMetrics() {
             if (window.performance && window.performance.timing) {
@@ -455,56 +293,57 @@
                 console.log(`⚡ MetaFlex loaded in ${pageLoadTime}ms`);
             }
         }
-        
+
         // ============================================
         // MASTER INITIALIZATION
         // ============================================
         function init() {
             console.log('═══════════════════════════════════════');
-            console.log('   METAFLEX OPERATIONS SYSTEM v5.0    ');
+            console.log('   METAFLEX OPERATIONS SYSTEM v5.1    ');
             console.log('        "GET A GRIP ON LIFE"          ');
             console.log('═══════════════════════════════════════');
-            
-            // Inject animations first
-            injectAnimations();
-            
-            // Initialize all features
-            initLogoGrip();
-            initMetricSparkles();
-            initNumberCounters();
-            initMotivationalTooltips();
-            initChartEnhancements();
-            initTableEffects();
-            initScrollAnimations();
-            // initParallaxEffect(); // Commented out - can be too much
-            initGripProgress();
-            initNavTracking();
+
+            // Inject styles first
+            injectStyles();
+
+            initDelegatedListeners();
             handleStreamlitReruns();
-            
+
+            // Enhance what is already on the page (one pass, same frame budget)
+            queueRoot(document.body);
+            scheduleDrain();
+
             // Log performance
             logPerformanceMetrics();
-            
+
             console.log('═══════════════════════════════════════');
             console.log('✅ All MetaFlex systems operational!');
             console.log('═══════════════════════════════════════');
         }
-        
+
         // Run initialization
         init();
+        return teardown;
     }
-    
-    // Wait for window load
+
+    // Export for debugging (and teardown when a new version is linked)
+    window.MetaFlexSystem = {
+        version: '5.1',
+        brand: 'GET A GRIP ON LIFE',
+        initialized: false,
+        teardown: function() {}
+    };
+
+    function start() {
+        window.MetaFlexSystem.teardown = initMetaFlexSystem();
+        window.MetaFlexSystem.initialized = true;
+    }
+
+    // Wait for DOM to be fully loaded
     if (document.readyState === 'loading') {
-        document.addEventListener('DOMContentLoaded', initMetaFlexSystem);
+        document.addEventListener('DOMContentLoaded', start);
     } else {
-        initMetaFlexSystem();
+        start();
     }
-    
-})();
 
-// Export for debugging
-window.MetaFlexSystem = {
-    version: '5.0',
-    brand: 'GET A GRIP ON LIFE',
-    initialized: true
-};
\ No newline at end of file
+})();
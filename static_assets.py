@@ -0,0 +1,188 @@
+"""
+MetaFlex Static Assets
+Minifies and content-hashes style.css and static/metaflex.js into static/dist/,
+which Streamlit serves itself (server.enableStaticServing, see .streamlit/config.toml)
+at app/static/dist/<name>.<hash>.min.<ext>.
+
+Pages link the hashed URL instead of inlining the source on every rerun: the
+browser downloads each version once and caches it, and a new version gets a
+new URL automatically. Style modules (see style_registry) are bundled the same
+way, and images (logo.png) are published as-is with image_url().
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+STATIC_DIR = os.path.join(APP_DIR, "static")
+DIST_DIR = os.path.join(STATIC_DIR, "dist")
+
+# Streamlit serves <app dir>/static/* under this path
+STATIC_URL_PREFIX = "app/static"
+
+# {(bundle name, ((source path, mtime), ...)): url} - rebuilt only when a source changes
+_built = {}
+_build_lock = threading.Lock()
+
+
+def minify_css(source):
+    """Strip comments and collapse whitespace (selectors keep their meaningful spaces)"""
+    css = re.sub(r"/\*.*?\*/", "", source, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,])\s*", r"\1", css)
+    css = css.replace(";}", "}")
+    return css.strip()
+
+
+def minify_js(source):
+    """
+    Conservative minification: drop indentation, blank lines and comment-only
+    lines. Line breaks are kept so automatic semicolon insertion still works.
+    """
+    lines = []
+    in_block_comment = False
+    for line in source.splitlines():
+        stripped = line.strip()
+        if in_block_comment:
+            if "*/" in stripped:
+                in_block_comment = False
+            continue
+        if stripped.startswith("/*"):
+            in_block_comment = "*/" not in stripped
+            continue
+        if not stripped or stripped.startswith("//"):
+            continue
+        lines.append(stripped)
+    return "\n".join(lines)
+
+
+_MINIFIERS = {".css": minify_css, ".js": minify_js}
+
+
+def bundle_url(name, src_paths):
+    """
+    Concatenate src_paths (in order), minify, content-hash and write the bundle
+    to static/dist/. Returns its URL relative to the app root, e.g.
+    "app/static/dist/style.1a2b3c4d5e.min.css", or None if a source is missing.
+    Rebuilt only when a source file changes.
+    """
+    try:
+        key = (name, tuple((path, os.path.getmtime(path)) for path in src_paths))
+    except OSError:
+        return None
+
+    with _build_lock:
+        if key in _built:
+            return _built[key]
+
+        ext = os.path.splitext(src_paths[0])[1]
+        sources = []
+        for path in src_paths:
+            with open(path, encoding="utf-8") as f:
+                sources.append(f.read())
+        minified = _MINIFIERS.get(ext, lambda text: text)("\n".join(sources))
+
+        url = _publish(f"{name}.{{digest}}.min{ext}", minified.encode("utf-8"))
+        _built[key] = url
+        return url
+
+
+def _publish(filename_pattern, data):
+    """Write data to static/dist/ (atomically, once per content hash) and return its URL"""
+    digest = hashlib.sha256(data).hexdigest()[:10]
+    filename = filename_pattern.format(digest=digest)
+    dist_path = os.path.join(DIST_DIR, filename)
+
+    if not os.path.exists(dist_path):
+        os.makedirs(DIST_DIR, exist_ok=True)
+        tmp_path = dist_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, dist_path)
+
+    return f"{STATIC_URL_PREFIX}/dist/{filename}"
+
+
+def asset_url(src_path):
+    """Minified, content-hashed URL for a single file (see bundle_url)"""
+    return bundle_url(os.path.splitext(os.path.basename(src_path))[0], [src_path])
+
+
+def image_url(src_path):
+    """
+    Content-hashed URL for a binary asset such as logo.png, for <img src> in
+    markdown instead of a base64 data URI that is re-encoded and re-sent on
+    every rerun. Copied to static/dist/ once per process (and again only when
+    the file changes); returns None if it is missing.
+    """
+    try:
+        key = ("image", ((src_path, os.path.getmtime(src_path)),))
+    except OSError:
+        return None
+
+    with _build_lock:
+        if key in _built:
+            return _built[key]
+
+        with open(src_path, "rb") as f:
+            data = f.read()
+        name, ext = os.path.splitext(os.path.basename(src_path))
+        url = _publish(f"{name}.{{digest}}{ext}", data)
+        _built[key] = url
+        return url
+
+
+# Head order of linked assets, so later stylesheets keep overriding earlier ones
+# no matter which one was (re)linked last
+ASSET_SLOTS = ["brand-css", "component-css", "brand-js"]
+
+
+def link_assets(assets):
+    """
+    Link hashed assets into the page <head>, one element per slot.
+
+    Args:
+        assets: {slot: url} with slots from ASSET_SLOTS (.css -> <link>, .js -> <script>).
+                A None url unlinks whatever the slot held before.
+
+    The loader only touches the DOM when a slot's URL changes, and Streamlit
+    leaves an identical loader alone on later reruns - so each asset is linked
+    once per browser session and reruns ship only this tiny snippet.
+    """
+    import streamlit.components.v1 as components
+
+    components.html(f"""
+        <script>
+        (function() {{
+            const doc = window.parent.document;
+            const slots = {json.dumps(ASSET_SLOTS)};
+            const assets = {json.dumps(assets)};
+            for (const [slot, url] of Object.entries(assets)) {{
+                const current = doc.querySelector(`[data-metaflex-asset="${{slot}}"]`);
+                if (!url) {{
+                    if (current) current.remove();
+                    continue;
+                }}
+                if (current && current.dataset.url === url) continue;
+                const el = url.endsWith(".js")
+                    ? Object.assign(doc.createElement("script"), {{src: url, defer: true}})
+                    : Object.assign(doc.createElement("link"), {{rel: "stylesheet", href: url}});
+                el.dataset.metaflexAsset = slot;
+                el.dataset.url = url;
+                // Keep slot order in <head>
+                const next = slots.slice(slots.indexOf(slot) + 1)
+                    .map((later) => doc.querySelector(`[data-metaflex-asset="${{later}}"]`))
+                    .find(Boolean);
+                doc.head.insertBefore(el, next || null);
+                // Drop the previous version once the new one is in (no unstyled flash)
+                if (current) {{
+                    el.addEventListener("load", () => current.remove());
+                    el.addEventListener("error", () => current.remove());
+                }}
+            }}
+        }})();
+        </script>
+    """, height=0, width=0)
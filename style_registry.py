@@ -0,0 +1,83 @@
+"""
+MetaFlex Style Registry
+Components declare the style modules (styles/<name>.css) they need with
+use_styles(); at the end of each full run flush_styles() links the modules
+used on this page as ONE minified, content-hashed stylesheet (see static_assets).
+
+Each module appears at most once per page no matter how many times a component
+renders (e.g. once per project table), and the bundle is only re-linked when
+the set of modules changes, instead of re-sending <style> blocks every rerun.
+Fragment reruns never reach flush_styles(), so a module first requested inside
+a fragment is linked right away by use_styles().
+"""
+
+import os
+
+import streamlit as st
+
+import static_assets
+
+STYLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "styles")
+
+_SESSION_KEY = "_style_modules"
+_LINKED_KEY = "_style_modules_linked"
+
+# App-wide modules, bundled into the brand stylesheet ahead of style.css
+# (see dashboard.link_static_assets) rather than declared per page
+GLOBAL_STYLE_MODULES = ["app_base", "nav_logo", "nav_override"]
+
+
+def style_path(name):
+    return os.path.join(STYLE_DIR, f"{name}.css")
+
+
+def _in_fragment_rerun():
+    """True while only a fragment reruns (the rest of the script is skipped)"""
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+    except ImportError:
+        return False
+    ctx = get_script_run_ctx()
+    return bool(ctx and getattr(ctx, "fragment_ids_this_run", None))
+
+
+def _link_bundle(names):
+    url = None
+    if names:
+        url = static_assets.bundle_url("components", [style_path(name) for name in names])
+    static_assets.link_assets({"component-css": url})
+    st.session_state[_LINKED_KEY] = list(names)
+
+
+def begin_styles():
+    """Start collecting for a new full run (call at the top of the app script)"""
+    st.session_state[_SESSION_KEY] = []
+
+
+def use_styles(*names):
+    """
+    Declare the style modules a component needs. Cheap and idempotent -
+    call it every time the component renders.
+
+    Inside a fragment rerun a module the browser doesn't have yet is linked
+    immediately (with everything already declared), so lazily rendered
+    sections are styled on first paint.
+    """
+    requested = st.session_state.setdefault(_SESSION_KEY, [])
+    for name in names:
+        if not os.path.exists(style_path(name)):
+            raise KeyError(f"Unknown style module: {name}")
+        if name not in requested:
+            requested.append(name)
+
+    linked = st.session_state.get(_LINKED_KEY, [])
+    if _in_fragment_rerun() and any(name not in linked for name in names):
+        _link_bundle(requested)
+
+
+def flush_styles():
+    """
+    Link the bundle of every module declared during this run, in declaration
+    order. Call once per full run, after the page has rendered (or before st.stop()).
+    """
+    _link_bundle(st.session_state.get(_SESSION_KEY, []))
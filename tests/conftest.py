@@ -0,0 +1,117 @@
+import json
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+import requests
+
+# Import the app modules (pages, cache_backend...) from the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gspread.exceptions import APIError  # noqa: E402
+from gspread.utils import a1_to_rowcol  # noqa: E402
+
+import sheet_journal  # noqa: E402
+import sheets_quota  # noqa: E402
+
+
+def synthetic_sheet(rows):
+    """Task sheet as downloaded (object columns, ___N suffixes) with `rows` random rows"""
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "Transcript___0": [f"t{i}" for i in range(rows)],
+        "Date Assigned___1": rng.choice(["1/2/2025", "3/4/2025", ""], rows),
+        "Person___2": rng.choice(["Jess Lewis", "Megan Cole", "Justin Stehr", "Bob Jones"], rows),
+        "Task___3": [f"Task number {i} follow up" for i in range(rows)],
+        "Project___4": rng.choice(["IWT", "Solar", "Finance", ""], rows),
+        "Status___5": rng.choice(["Open", "Done", "In Progress", "Working On It"], rows),
+        "Due Date___6": rng.choice(["", "5/6/2025"], rows),
+        "Notes___7": rng.choice(["", "call back " * 4], rows),
+        "Progress %___8": rng.choice(["0%", "50%", "100%"], rows),
+        "Priority___9": rng.choice(["High", "Medium", "Low", ""], rows),
+    }, dtype=object)
+
+
+def api_error(status, message="error"):
+    """A gspread APIError as raised for an HTTP `status` response"""
+    response = requests.Response()
+    response.status_code = status
+    response._content = json.dumps({"error": {"code": status, "message": message}}).encode()
+    return APIError(response)
+
+
+class FakeWorksheet:
+    """In-memory stand-in for a gspread Worksheet (the calls the write path makes)"""
+
+    def __init__(self, values):
+        self.values = [list(row) for row in values]
+        self.calls = []
+        self.fail_next = {}  # method name -> exception raised by its next call
+        self.fail_after = {}  # same, but raised after the call took effect (e.g. a timeout)
+
+    def _check(self, name):
+        self.calls.append(name)
+        error = self.fail_next.pop(name, None)
+        if error is not None:
+            raise error
+
+    def _check_after(self, name):
+        error = self.fail_after.pop(name, None)
+        if error is not None:
+            raise error
+
+    def _cell(self, row, col):
+        values = self.values[row - 1] if row - 1 < len(self.values) else []
+        return values[col - 1] if col - 1 < len(values) else ""
+
+    def batch_get(self, ranges, **kwargs):
+        self._check("batch_get")
+        result = []
+        for a1_range in ranges:
+            start, end = a1_range.split(":")
+            (r1, c1), (r2, c2) = a1_to_rowcol(start), a1_to_rowcol(end)
+            result.append([[self._cell(r, c) for c in range(c1, c2 + 1)] for r in range(r1, r2 + 1)])
+        return result
+
+    def get_values(self, a1_range=None, **kwargs):
+        self._check("get_values")
+        return [list(row) for row in self.values]
+
+    def batch_update(self, updates, **kwargs):
+        self._check("batch_update")
+        for update in updates:
+            row, col = a1_to_rowcol(update["range"])
+            while len(self.values) < row:
+                self.values.append([])
+            values = self.values[row - 1]
+            values.extend([""] * (col - len(values)))
+            values[col - 1] = update["values"][0][0]
+
+    def append_rows(self, rows, **kwargs):
+        self._check("append_rows")
+        self.values.extend(list(row) for row in rows)
+        self._check_after("append_rows")
+
+    def append_row(self, row, **kwargs):
+        self._check("append_row")
+        self.values.append(list(row))
+        self._check_after("append_row")
+
+
+@pytest.fixture
+def journal(tmp_path, monkeypatch):
+    """sheet_journal writing to a throwaway file"""
+    monkeypatch.setattr(sheet_journal, "JOURNAL_DIR", str(tmp_path))
+    monkeypatch.setattr(sheet_journal, "JOURNAL_PATH", str(tmp_path / "sheet_journal.jsonl"))
+    return sheet_journal
+
+
+@pytest.fixture(autouse=True)
+def sheets_quota_state(monkeypatch):
+    """Fresh limiter and breaker per test, no throttling and no backoff sleeps"""
+    monkeypatch.setattr(sheets_quota, "_bucket", sheets_quota.TokenBucket(60_000, 1_000))
+    monkeypatch.setattr(sheets_quota, "_breaker", sheets_quota.CircuitBreaker(
+        sheets_quota.BREAKER_FAILURE_THRESHOLD, sheets_quota.BREAKER_RESET_SECONDS))
+    monkeypatch.setattr(sheets_quota, "BACKOFF_BASE_SECONDS", 0.0)
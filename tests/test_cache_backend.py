@@ -0,0 +1,131 @@
+"""
+Cache tier: versioned keys, the write generation and single-flight cached_view,
+on the in-process LRU and on a fakeredis-backed Redis backend (two "replicas"
+sharing one fake server).
+"""
+
+import threading
+import time
+
+import pytest
+
+import cache_backend
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+@pytest.fixture
+def redis_server():
+    return fakeredis.FakeServer()
+
+
+def _replica(server, secret="s3cret"):
+    return cache_backend.RedisCacheBackend(fakeredis.FakeRedis(server=server), secret)
+
+
+@pytest.fixture(params=["lru", "redis"])
+def backend(request, redis_server, monkeypatch):
+    if request.param == "lru":
+        backend = cache_backend.LRUCacheBackend()
+    else:
+        backend = _replica(redis_server)
+    monkeypatch.setattr(cache_backend, "_backend", backend)
+    return backend
+
+
+def test_versioned_key_changes_with_version_and_params():
+    key = cache_backend.versioned_key("kpis", "rev1", ("Jess", False))
+    assert key == cache_backend.versioned_key("kpis", "rev1", ("Jess", False))
+    assert key.startswith(f"{cache_backend.KEY_PREFIX}:kpis:rev1:")
+    assert key != cache_backend.versioned_key("kpis", "rev2", ("Jess", False))
+    assert key != cache_backend.versioned_key("kpis", "rev1", ("Jess", True))
+    assert key != cache_backend.versioned_key("metrics", "rev1", ("Jess", False))
+
+
+def test_cached_view_computes_once_per_version(backend):
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {"open_tasks": len(calls)}
+
+    assert cache_backend.cached_view("kpis", "rev1", (), compute) == {"open_tasks": 1}
+    assert cache_backend.cached_view("kpis", "rev1", (), compute) == {"open_tasks": 1}
+    assert cache_backend.cached_view("kpis", "rev2", (), compute) == {"open_tasks": 2}
+    assert cache_backend.cached_view("kpis", None, (), compute) == {"open_tasks": 3}
+    assert len(calls) == 3
+
+
+def test_cached_view_is_single_flight(backend):
+    calls = []
+    started = threading.Event()
+
+    def compute():
+        calls.append(1)
+        started.set()
+        time.sleep(0.1)
+        return [1, 2, 3]
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache_backend.cached_view("slow", "rev1", (), compute)))
+        for _ in range(8)
+    ]
+    threads[0].start()
+    started.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert results == [[1, 2, 3]] * 8
+
+
+def test_lru_hits_return_the_stored_object_without_pickling(monkeypatch):
+    monkeypatch.setattr(cache_backend, "_backend", cache_backend.LRUCacheBackend())
+    monkeypatch.setattr(cache_backend, "dumps", lambda value: pytest.fail("LRU must not serialize"))
+    value = {"rows": list(range(10))}
+    assert cache_backend.cached_view("view", "rev1", (), lambda: value) is value
+    assert cache_backend.cached_view("view", "rev1", (), lambda: None) is value
+
+
+def test_write_generation_is_shared_by_replicas(redis_server, monkeypatch):
+    first, second = _replica(redis_server), _replica(redis_server)
+
+    monkeypatch.setattr(cache_backend, "_backend", first)
+    assert cache_backend.write_generation() == 0
+    assert cache_backend.bump_write_generation() == 1
+
+    monkeypatch.setattr(cache_backend, "_backend", second)
+    assert cache_backend.write_generation() == 1
+    cache_backend.bump_write_generation()
+
+    monkeypatch.setattr(cache_backend, "_backend", first)
+    assert cache_backend.write_generation() == 2
+
+
+def test_replicas_share_cached_values(redis_server, monkeypatch):
+    monkeypatch.setattr(cache_backend, "_backend", _replica(redis_server))
+    cache_backend.cached_view("kpis", "rev1", (), lambda: {"open_tasks": 7})
+
+    monkeypatch.setattr(cache_backend, "_backend", _replica(redis_server))
+    assert cache_backend.cached_view("kpis", "rev1", (), lambda: pytest.fail("should hit")) == {"open_tasks": 7}
+
+
+def test_redis_values_without_a_valid_signature_are_never_unpickled(redis_server, monkeypatch):
+    key = cache_backend.versioned_key("kpis", "rev1", ())
+    client = fakeredis.FakeRedis(server=redis_server)
+    monkeypatch.setattr(cache_backend, "loads", lambda data: pytest.fail("unsigned value unpickled"))
+
+    # Written by something without the secret (or a replica with another one)
+    client.set(key, b"\0" * cache_backend.SIGNATURE_BYTES + cache_backend.dumps({"open_tasks": 666}))
+    _replica(redis_server, secret="other").set(key + "x", {"open_tasks": 666})
+    backend = _replica(redis_server)
+    assert backend.get(key) is None
+    assert backend.get(key + "x") is None
+
+
+def test_redis_backend_requires_a_secret():
+    with pytest.raises(ValueError):
+        cache_backend.RedisCacheBackend(fakeredis.FakeRedis(), "")
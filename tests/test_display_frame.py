@@ -0,0 +1,45 @@
+"""
+Display frames are cached in-process per snapshot version, view and columns.
+"""
+
+import pandas as pd
+
+import pages.dashboard_page as dp
+
+
+def _snapshot(revision):
+    df = pd.DataFrame({
+        "Task___0": ["a", "b", "c"],
+        "Status___1": ["Open", "Done", "Working On It"],
+        "Progress %___2": ["0%", "100%", "50%"],
+    })
+    df.attrs["sheet_meta"] = dp.SheetRowMeta({}, {col: i for i, col in enumerate(df.columns)}, revision=revision)
+    return df
+
+
+def test_hits_return_the_cached_frame_without_rebuilding(monkeypatch):
+    dp._cached_display_frame.clear()
+    builds = []
+    build = dp._build_display_frame
+    monkeypatch.setattr(dp, "_build_display_frame", lambda *args: builds.append(args) or build(*args))
+
+    df = _snapshot("rev-hit")
+    first, mapping = dp.display_frame(df, "grid")
+    second, _ = dp.display_frame(df, "grid")
+    assert second is first
+    assert list(first.columns) == ["_row_id", "Task", "Status", "Progress Status", "Progress %"]
+    assert mapping["Task"] == "Task___0"
+
+    dp.display_frame(df, "table")
+    dp.display_frame(df.iloc[:2], "grid")
+    dp.display_frame(_snapshot("rev-next"), "grid")
+    assert len(builds) == 4
+
+
+def test_frames_not_from_the_snapshot_are_not_cached(monkeypatch):
+    df = _snapshot("rev")
+    df.attrs.pop("sheet_meta")
+    first, _ = dp.display_frame(df, "table")
+    second, _ = dp.display_frame(df, "table")
+    assert first is not second
+    assert first.equals(second)
@@ -0,0 +1,68 @@
+"""
+All Tasks grid paging: server-side filter and sort positions (grid_row_positions).
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import pages.dashboard_page as dp
+from pages.dashboard_page import _grid_filter_mask, _grid_sort_order, grid_row_positions
+
+
+@pytest.fixture
+def tasks():
+    return pd.DataFrame({
+        "Task___0": ["Call Acme", "Fix a+b (urgent)", "Write report", "call back", "Review"],
+        "Project___1": ["IWT", "Solar", "IWT", "Finance", None],
+        "Priority___2": ["Low", " high ", "", "Medium", "HIGH"],
+        "Due Date___3": ["5/6/2025", "", "1/2/2025", "3/4/2025", "not a date"],
+        "Status___4": ["Open", "Done", "open", "In Progress", ""],
+    })
+
+
+def test_filter_by_project(tasks):
+    assert _grid_filter_mask(tasks, "IWT", "").tolist() == [True, False, True, False, False]
+    assert _grid_filter_mask(tasks, "All Projects", "").all()
+
+
+def test_search_is_literal_and_case_insensitive(tasks):
+    assert _grid_filter_mask(tasks, "All Projects", "CALL").tolist() == [True, False, False, True, False]
+    # Regex metacharacters are matched as text
+    assert _grid_filter_mask(tasks, "All Projects", "a+b (").tolist() == [False, True, False, False, False]
+
+
+def test_search_matches_any_column_within_the_project(tasks):
+    assert _grid_filter_mask(tasks, "IWT", "open").tolist() == [True, False, True, False, False]
+    assert _grid_filter_mask(tasks, "Finance", "low").tolist() == [False] * 5
+
+
+def test_priority_sort_uses_priority_order_with_blanks_last(tasks):
+    assert _grid_sort_order(tasks, "Priority", False).tolist() == [1, 4, 3, 0, 2]
+    assert _grid_sort_order(tasks, "Priority", True).tolist() == [0, 3, 1, 4, 2]
+
+
+def test_date_sort_parses_dates_with_unparseable_last(tasks):
+    assert _grid_sort_order(tasks, "Due Date", False).tolist() == [2, 3, 0, 1, 4]
+    assert _grid_sort_order(tasks, "Due Date", True).tolist() == [0, 3, 2, 1, 4]
+
+
+def test_text_sort_is_case_insensitive_and_stable(tasks):
+    assert _grid_sort_order(tasks, "Status", False).tolist() == [1, 3, 0, 2, 4]
+    assert _grid_sort_order(tasks, "Project", False).tolist() == [3, 0, 2, 1, 4]
+
+
+def test_row_positions_filter_then_sort(tasks):
+    assert grid_row_positions(tasks).tolist() == [0, 1, 2, 3, 4]
+    assert grid_row_positions(tasks, project="IWT", sort_by="Due Date").tolist() == [2, 0]
+    assert grid_row_positions(tasks, search=" call ", sort_by="Task", descending=True).tolist() == [3, 0]
+    # Unknown sort column: sheet order
+    assert grid_row_positions(tasks, search="call", sort_by="Owner").tolist() == [0, 3]
+
+
+def test_row_positions_on_a_typed_snapshot_view(tasks):
+    typed = dp._apply_column_dtypes(tasks.fillna(""))
+    view = typed[typed["Status___4"] != "Done"]
+    positions = grid_row_positions(view, project="IWT", sort_by="Priority")
+    assert isinstance(positions, np.ndarray)
+    assert view.iloc[positions]["Task___0"].tolist() == ["Call Acme", "Write report"]
@@ -0,0 +1,46 @@
+"""
+Overview project breakdown: partition_projects splits by canonical project name.
+"""
+
+import pandas as pd
+
+import pages.dashboard_page as dp
+from pages.dashboard_page import partition_projects
+
+
+def _tasks():
+    return pd.DataFrame({
+        "Task___0": ["a", "b", "c", "d", "e", "f", "g"],
+        "Project___1": ["IWT", " iwt", "Solar", "IWT ", "", None, "solar"],
+        "Status___2": ["Open", "Done", "Working On It", "Not started", "Open", "Open", "Complete"],
+    })
+
+
+def test_partitions_are_canonical_and_sorted():
+    partitions = partition_projects(_tasks())
+    assert [p["name"] for p in partitions] == ["Iwt", "Solar"]
+    assert [p["frame"]["Task___0"].tolist() for p in partitions] == [["a", "b", "d"], ["c", "g"]]
+
+
+def test_partition_counts():
+    iwt, solar = partition_projects(_tasks())
+    assert (iwt["total"], iwt["open"], iwt["in_progress"], iwt["complete"], iwt["completion_rate"]) == (3, 2, 0, 1, 33)
+    assert (solar["total"], solar["open"], solar["in_progress"], solar["complete"], solar["completion_rate"]) == (2, 0, 1, 1, 50)
+
+
+def test_typed_snapshot_partitions_like_objects():
+    tasks = _tasks().fillna("")
+    typed = dp._apply_column_dtypes(tasks)
+    for plain, categorical in zip(partition_projects(tasks), partition_projects(typed)):
+        assert {k: v for k, v in plain.items() if k != "frame"} == {k: v for k, v in categorical.items() if k != "frame"}
+        assert plain["frame"].index.tolist() == categorical["frame"].index.tolist()
+
+
+def test_without_status_column_only_totals_are_counted():
+    partitions = partition_projects(_tasks().drop(columns="Status___2"))
+    assert [(p["total"], p["open"], p["complete"]) for p in partitions] == [(3, 0, 0), (2, 0, 0)]
+
+
+def test_no_projects():
+    assert partition_projects(pd.DataFrame()) == []
+    assert partition_projects(_tasks().drop(columns="Project___1")) == []
@@ -0,0 +1,66 @@
+"""
+Overview project sections: at most MAX_OPEN_PROJECT_SECTIONS tables load at once,
+and the "Up to N projects" caption follows every open/close.
+"""
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+import pages.dashboard_page as dp
+from conftest import synthetic_sheet
+
+CAP_CAPTION = "projects load at once"
+
+
+def _render_overview():
+    import streamlit as st
+
+    import pages.dashboard_page as dp
+
+    st.session_state["name"] = "Tea Phillips"
+    dp.show_dashboard()
+
+
+@pytest.fixture
+def overview(monkeypatch):
+    df = dp._apply_column_dtypes(synthetic_sheet(60))
+    monkeypatch.setattr(dp, "load_google_sheet", lambda: df)
+    monkeypatch.setattr(dp, "MAX_OPEN_PROJECT_SECTIONS", 2)
+    at = AppTest.from_function(_render_overview, default_timeout=60)
+    at.run()
+    assert not at.exception
+    return at
+
+
+def _toggle(at, project, is_open):
+    at.session_state[dp._project_section_key(project)] = is_open
+    at.run()
+    assert not at.exception
+
+
+def _capped(at):
+    return [caption.value for caption in at.caption if CAP_CAPTION in caption.value]
+
+
+def test_sections_past_the_cap_show_the_caption(overview):
+    for project in ("Solar", "Iwt", "Finance"):
+        _toggle(overview, project, True)
+    assert overview.session_state["open_project_sections"] == ["Solar", "Iwt", "Finance"]
+    assert len(_capped(overview)) == 1
+
+
+def test_closing_a_section_loads_the_next_one_in_the_same_run(overview):
+    for project in ("Solar", "Iwt", "Finance"):
+        _toggle(overview, project, True)
+
+    # Solar renders after Finance, so Finance must not decide its cap before Solar is closed
+    _toggle(overview, "Solar", False)
+    assert overview.session_state["open_project_sections"] == ["Iwt", "Finance"]
+    assert _capped(overview) == []
+
+
+def test_unlisted_projects_are_forgotten(overview):
+    _toggle(overview, "Iwt", True)
+    overview.session_state["open_project_sections"] = ["Gone", "Iwt"]
+    overview.run()
+    assert overview.session_state["open_project_sections"] == ["Iwt"]
@@ -0,0 +1,91 @@
+"""
+Peak-allocation budgets for whole page renders (Overview and My Tasks).
+
+Each page is rendered with AppTest from a shared 50k-row typed snapshot, once
+to warm the caches and once under measurement - the steady state of every
+rerun. The snapshot's string columns live in Arrow buffers, which tracemalloc
+does not see, so pyarrow allocations are counted through a proxy memory pool
+and added to the traced peak.
+
+Budgets are multiples of the snapshot's own size. A render that copies the
+whole snapshot (every buffer, not just a shallow CoW copy) adds a full 1x on
+top of today's peak and goes over.
+"""
+
+import tracemalloc
+
+import pyarrow as pa
+import pytest
+from streamlit.testing.v1 import AppTest
+
+import pages.dashboard_page as dp
+import pages.tasks_page as tp
+from conftest import synthetic_sheet
+
+ROWS = 50_000
+
+# (page, user): peak render allocation as a multiple of the snapshot's size
+RENDER_BUDGETS = {
+    ("overview", "Jess Lewis"): 3.0,
+    ("overview", "Bob Jones"): 1.0,
+    ("tasks", "Jess Lewis"): 2.6,
+    ("tasks", "Bob Jones"): 2.6,
+}
+
+# Proxy pools must outlive every buffer allocated through them (cached frames)
+_arrow_pools = []
+
+
+def _render_page():
+    import streamlit as st
+
+    import pages.dashboard_page as dp
+    import pages.tasks_page as tp
+
+    st.session_state["name"] = st.session_state["user"]
+    if st.session_state["page"] == "overview":
+        dp.show_dashboard()
+    else:
+        tp.show_tasks()
+
+
+def _peak_bytes(fn):
+    """Peak traced Python/numpy allocation plus peak pyarrow allocation while fn runs"""
+    default_pool = pa.default_memory_pool()
+    pool = pa.proxy_memory_pool(default_pool)
+    _arrow_pools.append(pool)
+    pa.set_memory_pool(pool)
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1] + pool.max_memory()
+    finally:
+        tracemalloc.stop()
+        pa.set_memory_pool(default_pool)
+
+
+@pytest.fixture(scope="module")
+def snapshot():
+    df = dp._apply_column_dtypes(synthetic_sheet(ROWS))
+    df.attrs["sheet_meta"] = dp.SheetRowMeta(
+        {idx: dp._row_version(row) for idx, row in zip(df.index, df.itertuples(index=False))},
+        {col: i for i, col in enumerate(df.columns)},
+        revision="render-memory",
+    )
+    return df
+
+
+@pytest.mark.parametrize("page, user", list(RENDER_BUDGETS))
+def test_page_render_peak(snapshot, monkeypatch, page, user):
+    monkeypatch.setattr(dp, "load_google_sheet", lambda: snapshot)
+    monkeypatch.setattr(tp, "load_google_sheet", lambda: snapshot)
+
+    at = AppTest.from_function(_render_page, default_timeout=120)
+    at.session_state["user"] = user
+    at.session_state["page"] = page
+    at.run()
+    assert not at.exception
+
+    peak = _peak_bytes(at.run)
+    assert not at.exception
+    assert peak < RENDER_BUDGETS[(page, user)] * snapshot.memory_usage(deep=True).sum()
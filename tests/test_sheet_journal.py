@@ -0,0 +1,222 @@
+"""
+Sheet write journal: pending queue, conflicts and replay against an in-memory worksheet.
+"""
+
+import json
+import multiprocessing
+import time
+
+import requests
+
+import pages.dashboard_page as dp
+import sheet_journal
+import sheets_quota
+from conftest import FakeWorksheet, api_error
+
+HEADER = ["Task", "Status"]
+
+
+def _update_entry(journal, rows, appends=(), author="Bob Jones"):
+    """Journal an update_rows mutation the way update_google_sheet builds it"""
+    return journal.append_entry("update_rows", {
+        "sheet_width": 2,
+        "version_columns": [0, 1],
+        "column_names": HEADER,
+        "rows": [
+            {"row": row, "version": dp._row_version(old), "values": {"0": new[0], "1": new[1]}}
+            for row, old, new in rows
+        ],
+        "appends": [list(row) for row in appends],
+    }, author=author)
+
+
+def _replay(journal, ws, retryable=None):
+    return journal.replay_pending(lambda entry: dp._apply_sheet_mutation(ws, entry), retryable=retryable)
+
+
+def test_pending_entries_are_uncommitted_in_order(journal):
+    first = journal.append_entry("append_row", {"row": ["a"]}, author="Bob Jones")
+    second = journal.append_entry("append_row", {"row": ["b"]})
+    third = journal.append_entry("append_row", {"row": ["c"]})
+    journal.mark_committed(second["id"])
+
+    pending = journal.pending_entries()
+    assert [e["id"] for e in pending] == [first["id"], third["id"]]
+    assert pending[0]["payload"] == {"row": ["a"]}
+    assert pending[0]["author"] == "Bob Jones"
+
+
+def test_torn_trailing_line_is_ignored(journal):
+    entry = journal.append_entry("append_row", {"row": ["a"]})
+    with open(journal.JOURNAL_PATH, "a") as f:
+        f.write('{"id": "half-writ')
+
+    assert [e["id"] for e in journal.pending_entries()] == [entry["id"]]
+
+
+def test_compact_keeps_only_live_entries(journal):
+    committed = journal.append_entry("append_row", {"row": ["a"]})
+    pending = journal.append_entry("append_row", {"row": ["b"]})
+    journal.mark_committed(committed["id"])
+
+    journal.compact()
+    with open(journal.JOURNAL_PATH) as f:
+        records = [json.loads(line) for line in f]
+    assert [(r["id"], r["state"]) for r in records] == [(pending["id"], "pending")]
+
+
+def test_replay_commits_in_order_and_compacts(journal):
+    for row in ("a", "b", "c"):
+        journal.append_entry("append_row", {"row": [row]})
+    applied = []
+
+    assert journal.replay_pending(lambda entry: applied.append(entry["payload"]["row"][0])) == (3, 0)
+    assert applied == ["a", "b", "c"]
+    assert journal.pending_entries() == []
+    assert open(journal.JOURNAL_PATH).read() == ""
+
+
+def test_conflicting_row_is_skipped_and_reported_to_its_author(journal):
+    ws = FakeWorksheet([HEADER, ["a", "Open"], ["b", "Open"]])
+    entry = _update_entry(journal, [
+        (2, ["a", "Open"], ["a", "Done"]),
+        (3, ["b", "Open"], ["b", "Done"]),
+    ])
+    ws.values[1][1] = "Working On It"  # someone else edits row 2 meanwhile
+
+    assert _replay(journal, ws) == (1, 0)
+    assert ws.values[1:] == [["a", "Working On It"], ["b", "Done"]]
+
+    conflicted = journal.conflicted_entries(author="Bob Jones")
+    assert [(e["id"], e["conflict_rows"]) for e in conflicted] == [(entry["id"], [2])]
+    assert journal.conflicted_entries(author="Someone Else") == []
+    assert journal.pending_entries() == []
+
+
+def test_resolved_conflict_is_compacted_away(journal):
+    ws = FakeWorksheet([HEADER, ["a", "Working On It"]])
+    entry = _update_entry(journal, [(2, ["a", "Open"], ["a", "Done"])])
+    _replay(journal, ws)
+
+    journal.compact()
+    assert len(journal.conflicted_entries()) == 1  # kept until its author has seen it
+
+    journal.resolve(entry["id"])
+    journal.compact()
+    assert journal.conflicted_entries() == []
+    assert open(journal.JOURNAL_PATH).read() == ""
+
+
+def test_half_applied_entry_is_not_a_conflict_on_replay(journal):
+    ws = FakeWorksheet([HEADER, ["a", "Open"]])
+    _update_entry(journal, [(2, ["a", "Open"], ["a", "Done"])], appends=[["c", "Open"]])
+
+    # Cell updates land, then the append fails: the entry stays pending
+    ws.fail_next["append_rows"] = requests.ConnectionError("connection reset")
+    assert _replay(journal, ws) == (0, 1)
+    assert ws.values[1] == ["a", "Done"]
+
+    assert _replay(journal, ws) == (1, 0)
+    assert journal.conflicted_entries() == []
+    assert ws.values[1:] == [["a", "Done"], ["c", "Open"]]
+
+
+def test_rejected_entry_is_failed_and_does_not_block_the_queue(journal):
+    ws = FakeWorksheet([HEADER, ["a", "Open"]])
+    rejected = journal.append_entry("append_row", {"row": ["b", "Open"]}, author="Bob Jones")
+    _update_entry(journal, [(2, ["a", "Open"], ["a", "Done"])])
+
+    ws.fail_next["append_row"] = api_error(403, "protected range")
+    assert _replay(journal, ws, retryable=sheets_quota.is_transient) == (1, 0)
+    assert ws.values[1:] == [["a", "Done"]]
+
+    failed = journal.failed_entries(author="Bob Jones")
+    assert [e["id"] for e in failed] == [rejected["id"]]
+    assert "protected range" in failed[0]["error"]
+    assert journal.pending_entries() == []
+
+    journal.resolve(rejected["id"])
+    assert journal.failed_entries() == []
+
+
+def test_transient_error_stops_replay_in_order(journal):
+    ws = FakeWorksheet([HEADER, ["a", "Open"]])
+    journal.append_entry("append_row", {"row": ["b", "Open"]})
+    _update_entry(journal, [(2, ["a", "Open"], ["a", "Done"])])
+
+    ws.fail_next["append_row"] = api_error(503, "backend error")
+    assert _replay(journal, ws, retryable=sheets_quota.is_transient) == (0, 2)
+    assert ws.values[1:] == [["a", "Open"]]
+    assert journal.failed_entries() == []
+
+    assert _replay(journal, ws, retryable=sheets_quota.is_transient) == (2, 0)
+    assert ws.values[1:] == [["a", "Done"], ["b", "Open"]]
+
+
+def _append_entries(count, tag):
+    for i in range(count):
+        sheet_journal.append_entry("append_row", {"row": [f"{tag}{i}"]})
+
+
+def _compact_repeatedly(count):
+    for i in range(count):
+        entry = sheet_journal.append_entry("append_row", {"row": [f"c{i}"]})
+        sheet_journal.mark_committed(entry["id"])
+        sheet_journal.compact()
+
+
+def _replay_to(log_path):
+    def dispatch(entry):
+        time.sleep(0.005)
+        with open(log_path, "a") as f:
+            f.write(entry["id"] + "\n")
+    sheet_journal.replay_pending(dispatch)
+
+
+def _run_processes(*jobs):
+    context = multiprocessing.get_context("fork")
+    processes = [context.Process(target=target, args=args) for target, args in jobs]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(60)
+        assert process.exitcode == 0
+
+
+def test_compact_in_another_process_never_drops_appends(journal):
+    _run_processes((_append_entries, (200, "a")), (_append_entries, (200, "b")), (_compact_repeatedly, (100,)))
+    rows = [e["payload"]["row"][0] for e in journal.pending_entries()]
+    assert sorted(rows) == sorted([f"a{i}" for i in range(200)] + [f"b{i}" for i in range(200)])
+
+
+def test_concurrent_replays_dispatch_each_entry_once(journal, tmp_path):
+    _append_entries(30, "r")
+    log_path = str(tmp_path / "dispatched.log")
+    _run_processes(*[(_replay_to, (log_path,))] * 3)
+
+    dispatched = open(log_path).read().split()
+    assert sorted(dispatched) == sorted(set(dispatched))
+    assert len(dispatched) == 30
+    assert journal.pending_entries() == []
+
+
+def test_append_that_timed_out_after_landing_is_not_repeated(journal):
+    ws = FakeWorksheet([HEADER, ["a", "Open"]])
+    _update_entry(journal, [], appends=[["b", "Open"], ["b", "Open"], ["c", ""]])
+    journal.append_entry("append_row", {"row": ["d", "Open"]})
+
+    ws.fail_after["append_rows"] = requests.Timeout("read timed out")
+    assert _replay(journal, ws) == (0, 2)
+    assert _replay(journal, ws) == (2, 0)
+    assert ws.values[1:] == [["a", "Open"], ["b", "Open"], ["b", "Open"], ["c", ""], ["d", "Open"]]
+
+
+def test_append_that_never_landed_is_sent_on_replay(journal):
+    ws = FakeWorksheet([HEADER, ["a", "Open"]])
+    journal.append_entry("append_row", {"row": ["b", "Open"]})
+
+    ws.fail_next["append_row"] = requests.Timeout("connect timed out")
+    assert _replay(journal, ws) == (0, 1)
+    assert _replay(journal, ws) == (1, 0)
+    assert ws.values[1:] == [["a", "Open"], ["b", "Open"]]
+    assert ws.calls.count("get_values") == 1  # only the replay checks the sheet
@@ -0,0 +1,44 @@
+"""
+Projected sheet reads: batch_get results for several column ranges stitched back into rows.
+"""
+
+from pages.dashboard_page import _project_sheet_values, _schema_positions
+
+
+def test_schema_positions():
+    assert _schema_positions("A:C") == [0, 1, 2]
+    assert _schema_positions("N:N") == [13]
+    assert _schema_positions("Z:AB") == [25, 26, 27]
+
+
+def test_ranges_are_stitched_side_by_side():
+    positions, rows = _project_sheet_values(
+        [[["Task", "Status"], ["a", "Open"]], [["Owner"], ["Jess"]]],
+        ["A:B", "N:N"],
+    )
+    assert positions == [0, 1, 13]
+    assert rows == [["Task", "Status", "Owner"], ["a", "Open", "Jess"]]
+
+
+def test_trimmed_cells_and_rows_are_padded():
+    # The API drops trailing empty cells per row and trailing empty rows per range
+    positions, rows = _project_sheet_values(
+        [[["Task", "Status", "Notes"], ["a"], ["b", "Done"]], [["Owner"]]],
+        ["A:C", "N:N"],
+    )
+    assert positions == [0, 1, 2, 13]
+    assert rows == [
+        ["Task", "Status", "Notes", "Owner"],
+        ["a", "", "", ""],
+        ["b", "Done", "", ""],
+    ]
+
+
+def test_extra_cells_beyond_the_range_are_dropped():
+    _, rows = _project_sheet_values([[["a", "b", "c"]]], ["A:B"])
+    assert rows == [["a", "b"]]
+
+
+def test_empty_ranges():
+    assert _project_sheet_values([[], []], ["A:B", "N:N"]) == ([0, 1, 13], [])
+    assert _project_sheet_values([], []) == ([], [])
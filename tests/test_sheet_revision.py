@@ -0,0 +1,126 @@
+"""
+Sheet freshness probe against a local stand-in for the Drive files endpoint
+(see DRIVE_FILES_URL / METAFLEX_DRIVE_API_URL): the full download only runs
+when the revision changes, and a failing probe falls back to a time bucket.
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import gspread
+import pandas as pd
+import pytest
+from google.auth.credentials import AnonymousCredentials
+
+import cache_backend
+import pages.dashboard_page as dp
+
+
+class DriveStub:
+    """Serves GET /files/<id> with the current version, or 500 while failing"""
+
+    def __init__(self):
+        self.version = "1"
+        self.failing = False
+        self.requests = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = urlparse(self.path)
+                stub.requests.append((url.path, parse_qs(url.query)))
+                if stub.failing:
+                    self.send_response(500)
+                    body = {"error": {"code": 500, "message": "backend error"}}
+                else:
+                    self.send_response(200)
+                    body = {"version": stub.version, "modifiedTime": f"2025-01-0{stub.version}T00:00:00Z"}
+                payload = json.dumps(body).encode("utf-8")
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}/drive/v3/files"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def drive(monkeypatch, tmp_path):
+    stub = DriveStub()
+    monkeypatch.setattr(dp, "DRIVE_FILES_URL", stub.url)
+    monkeypatch.setattr(dp, "_read_client", lambda: gspread.Client(AnonymousCredentials()))
+    monkeypatch.setattr(cache_backend, "_backend", cache_backend.LRUCacheBackend())
+    dp._sheet_revision.clear()
+    dp._load_sheet_snapshot.clear()
+    yield stub
+    stub.close()
+    dp._sheet_revision.clear()
+    dp._load_sheet_snapshot.clear()
+
+
+@pytest.fixture
+def downloads(monkeypatch):
+    revisions = []
+
+    def download(revision):
+        revisions.append(revision)
+        return pd.DataFrame({"Task___0": [revision]})
+
+    monkeypatch.setattr(dp, "_download_sheet_snapshot", download)
+    return revisions
+
+
+def _load():
+    """One page load after the probe's cache expired"""
+    dp._sheet_revision.clear()
+    return dp._load_sheet_snapshot(dp._snapshot_revision())
+
+
+def test_probe_asks_drive_for_version_only(drive):
+    assert dp._sheet_revision() == "rev:1:2025-01-01T00:00:00Z"
+    path, query = drive.requests[-1]
+    assert path == f"/drive/v3/files/{dp.SHEET_SCHEMA['sheet_id']}"
+    assert query["fields"] == ["version,modifiedTime"]
+
+
+def test_unchanged_revision_skips_the_download(drive, downloads):
+    first = _load()
+    second = _load()
+    assert second is first
+    assert len(downloads) == 1
+    assert len(drive.requests) == 2
+
+
+def test_changed_revision_downloads_again(drive, downloads):
+    _load()
+    drive.version = "2"
+    df = _load()
+    assert len(downloads) == 2
+    assert df["Task___0"].iloc[0].startswith("rev:2:")
+
+
+def test_probe_failure_falls_back_to_the_ttl_bucket(drive, downloads, monkeypatch):
+    drive.failing = True
+    monkeypatch.setattr(dp.time, "time", lambda: 45 * 1000 + 10.0)
+
+    assert dp._sheet_revision() == "ttl:1000"
+    assert len(drive.requests) > 1  # 5xx is retried before giving up
+
+    _load()
+    _load()
+    assert len(downloads) == 1  # Same bucket, same snapshot
+
+    monkeypatch.setattr(dp.time, "time", lambda: 45 * 1001 + 10.0)
+    _load()
+    assert len(downloads) == 2
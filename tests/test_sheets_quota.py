@@ -0,0 +1,145 @@
+"""
+Sheets quota guard: token bucket, circuit breaker and call_sheets retries,
+on a fake clock (sheets_quota's time module is swapped, nothing really sleeps).
+"""
+
+import pytest
+import requests
+
+import sheets_quota
+from conftest import api_error
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(sheets_quota, "time", clock)
+    # The shared limiter and breaker read the clock too: rebuild them on this one
+    monkeypatch.setattr(sheets_quota, "_bucket", sheets_quota.TokenBucket(60_000, 1_000))
+    monkeypatch.setattr(sheets_quota, "_breaker", sheets_quota.CircuitBreaker(
+        sheets_quota.BREAKER_FAILURE_THRESHOLD, sheets_quota.BREAKER_RESET_SECONDS))
+    return clock
+
+
+def _failing(*errors):
+    """Callable raising each error in turn, then returning "ok" """
+    calls = []
+
+    def fn():
+        calls.append(1)
+        if len(calls) <= len(errors):
+            raise errors[len(calls) - 1]
+        return "ok"
+
+    fn.calls = calls
+    return fn
+
+
+def test_token_bucket_allows_a_burst_then_paces(clock):
+    bucket = sheets_quota.TokenBucket(rate_per_minute=60, burst=3)
+    assert [bucket.acquire() for _ in range(3)] == [0, 0, 0]
+
+    waited = bucket.acquire()
+    assert waited == pytest.approx(1.0)
+    assert clock.now == pytest.approx(1001.0)
+
+
+def test_token_bucket_refills_up_to_capacity(clock):
+    bucket = sheets_quota.TokenBucket(rate_per_minute=60, burst=2)
+    bucket.acquire()
+    bucket.acquire()
+    clock.now += 60
+    assert [bucket.acquire() for _ in range(2)] == [0, 0]
+    assert bucket.acquire() > 0
+
+
+def test_breaker_opens_after_threshold_failures(clock):
+    breaker = sheets_quota.CircuitBreaker(failure_threshold=3, reset_seconds=60)
+    assert breaker.record_failure() is False
+    assert breaker.record_failure() is False
+    assert breaker.record_failure() is True
+    assert breaker.state == "open"
+    assert breaker.allow() is False
+
+
+def test_breaker_half_open_allows_a_single_probe(clock):
+    breaker = sheets_quota.CircuitBreaker(failure_threshold=1, reset_seconds=60)
+    breaker.record_failure()
+    clock.now += 60
+
+    assert breaker.allow() is True  # the trial call
+    assert breaker.state == "half_open"
+    assert breaker.allow() is False  # everyone else fails fast while it runs
+    assert breaker.allow() is False
+
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.allow() is True
+
+
+def test_breaker_failed_probe_reopens(clock):
+    breaker = sheets_quota.CircuitBreaker(failure_threshold=1, reset_seconds=60)
+    breaker.record_failure()
+    clock.now += 60
+    breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert breaker.allow() is False
+    clock.now += 60
+    assert breaker.allow() is True
+
+
+def test_call_sheets_retries_transient_errors(clock):
+    fn = _failing(api_error(503), requests.ConnectionError("reset"))
+    assert sheets_quota.call_sheets(fn) == "ok"
+    assert len(fn.calls) == 3
+
+
+def test_call_sheets_does_not_retry_caller_errors(clock):
+    fn = _failing(api_error(400, "bad range"))
+    with pytest.raises(sheets_quota.APIError):
+        sheets_quota.call_sheets(fn)
+    assert len(fn.calls) == 1
+    assert sheets_quota._breaker.state == "closed"
+
+
+def test_non_idempotent_calls_only_retry_rate_limits(clock):
+    fn = _failing(api_error(429), api_error(503))
+    with pytest.raises(sheets_quota.APIError):
+        sheets_quota.call_sheets(fn, idempotent=False)
+    assert len(fn.calls) == 2  # the 429 was retried, the 503 was not
+
+
+def test_call_sheets_fails_fast_while_breaker_is_open(clock):
+    always_down = _failing(*[api_error(503)] * 100)
+    for _ in range(sheets_quota.BREAKER_FAILURE_THRESHOLD):
+        with pytest.raises(sheets_quota.APIError):
+            sheets_quota.call_sheets(always_down)
+    calls = len(always_down.calls)
+
+    with pytest.raises(sheets_quota.SheetsUnavailable):
+        sheets_quota.call_sheets(always_down)
+    assert len(always_down.calls) == calls
+
+
+def test_is_transient():
+    assert sheets_quota.is_transient(api_error(429))
+    assert sheets_quota.is_transient(api_error(503))
+    assert sheets_quota.is_transient(requests.Timeout())
+    assert sheets_quota.is_transient(sheets_quota.SheetsUnavailable())
+    assert not sheets_quota.is_transient(api_error(403))
+    assert not sheets_quota.is_transient(ValueError("unknown op"))
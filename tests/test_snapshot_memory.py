@@ -0,0 +1,66 @@
+"""
+Peak-allocation regression test for the task snapshot.
+
+Builds a synthetic ~50k-row sheet and traces the dtype conversion and a KPI
+pass with tracemalloc. Bounds are fractions of the plain object-dtype frame
+(the pre-typed representation), so they hold across platforms while still
+catching a return to per-cell Python objects. Whole page renders are covered
+by test_render_memory.
+"""
+
+import tracemalloc
+
+import pytest
+
+import pages.dashboard_page as dp
+from conftest import synthetic_sheet
+
+ROWS = 50_000
+
+# Peak traced allocation of each step, as a fraction of the object frame's size
+PEAK_BUDGETS = {
+    "apply_column_dtypes": 0.25,
+    "calculate_kpis": 0.5,
+}
+
+
+def _peak_bytes(fn):
+    tracemalloc.start()
+    try:
+        result = fn()
+        return result, tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.fixture(scope="module")
+def object_frame():
+    return synthetic_sheet(ROWS)
+
+
+@pytest.fixture(scope="module")
+def typed_frame(object_frame):
+    return dp._apply_column_dtypes(object_frame)
+
+
+def _object_bytes(object_frame):
+    return object_frame.memory_usage(deep=True).sum()
+
+
+def test_typed_snapshot_is_compact(object_frame, typed_frame):
+    assert typed_frame.memory_usage(deep=True).sum() < 0.3 * _object_bytes(object_frame)
+
+
+def test_apply_column_dtypes_peak(object_frame):
+    _, peak = _peak_bytes(lambda: dp._apply_column_dtypes(object_frame))
+    assert peak < PEAK_BUDGETS["apply_column_dtypes"] * _object_bytes(object_frame)
+
+
+def test_kpi_pass_peak(object_frame, typed_frame):
+    kpis, peak = _peak_bytes(lambda: dp.calculate_kpis(typed_frame, "Jess Lewis"))
+    assert kpis["open_tasks"] > 0
+    assert peak < PEAK_BUDGETS["calculate_kpis"] * _object_bytes(object_frame)
+
+
+def test_kpis_match_object_frame(object_frame, typed_frame):
+    assert dp.calculate_kpis(typed_frame, "Jess Lewis") == dp.calculate_kpis(object_frame, "Jess Lewis")
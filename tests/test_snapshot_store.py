@@ -0,0 +1,58 @@
+"""
+Snapshot store: the typed snapshot survives a save / memory-mapped load round trip.
+"""
+
+import pandas as pd
+import pytest
+
+import pages.dashboard_page as dp
+import snapshot_store
+from conftest import synthetic_sheet
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    """snapshot_store writing to a throwaway directory"""
+    monkeypatch.setattr(snapshot_store, "SNAPSHOT_DIR", str(tmp_path))
+    monkeypatch.setattr(snapshot_store, "SNAPSHOT_PATH", str(tmp_path / "sheet_snapshot.arrow"))
+    monkeypatch.setattr(snapshot_store, "VERSION_PATH", str(tmp_path / "sheet_snapshot.version"))
+    return snapshot_store
+
+
+def test_nothing_published_yet(store):
+    assert store.load_snapshot() == (None, None)
+    assert store.published_header() is None
+    assert store.published_version() is None
+
+
+def test_round_trip_keeps_values_dtypes_and_metadata(store):
+    df = dp._apply_column_dtypes(synthetic_sheet(200))
+    df.attrs["sheet_meta"] = object()  # in-memory only, must not reach the file
+    store.save_snapshot(df, "rev:7", extra={"row_versions": {"2": "abc"}}, fetched_at=1234.5)
+
+    loaded, info = store.load_snapshot()
+    pd.testing.assert_frame_equal(loaded, df)
+    assert loaded.attrs == {}
+    assert info["revision"] == "rev:7"
+    assert info["fetched_at"] == 1234.5
+    assert info["extra"] == {"row_versions": {"2": "abc"}}
+
+
+def test_header_is_published_per_save(store):
+    df = dp._apply_column_dtypes(synthetic_sheet(10))
+    store.save_snapshot(df, "rev:1")
+    first = store.published_header()
+    store.save_snapshot(df, "rev:2", fetched_at=99.0)
+    second = store.published_header()
+
+    assert first["revision"] == "rev:1"
+    assert second["revision"] == "rev:2"
+    assert second["fetched_at"] == 99.0
+    assert second["version"] != first["version"]
+    assert store.published_version() == second["version"]
+
+
+def test_unreadable_snapshot_is_ignored(store):
+    with open(store.SNAPSHOT_PATH, "wb") as f:
+        f.write(b"not arrow")
+    assert store.load_snapshot() == (None, None)
@@ -0,0 +1,102 @@
+"""
+Static assets: content-hashed bundles, and the minified metaflex.js run under
+node against a minimal fake DOM (it executes in the app page since it is linked).
+"""
+
+import json
+import os
+import shutil
+import subprocess
+
+import pytest
+
+import static_assets
+
+METAFLEX_JS = os.path.join(static_assets.STATIC_DIR, "metaflex.js")
+
+# Just enough of window/document for metaflex.js: records delegated listeners
+# (honouring AbortSignal) and what gets added to <head>.
+FAKE_DOM = """
+const listeners = [];
+const head = [];
+const element = (tag) => ({
+    tagName: tag, style: {}, children: [], isConnected: true, parentElement: null,
+    matches: () => false, querySelectorAll: () => [], closest: () => null,
+    appendChild(child) { this.children.push(child); },
+});
+globalThis.window = globalThis;
+globalThis.Node = { ELEMENT_NODE: 1 };
+globalThis.MutationObserver = class { observe() {} disconnect() {} };
+globalThis.requestAnimationFrame = (fn) => setTimeout(fn, 0);
+globalThis.document = {
+    readyState: "complete",
+    body: element("body"),
+    head: { appendChild: (el) => head.push(el) },
+    createElement: element,
+    getElementById: (id) => head.find((el) => el.id === id) || null,
+    querySelectorAll: () => [],
+    addEventListener(type, fn, options) {
+        const entry = { type };
+        listeners.push(entry);
+        if (options && options.signal) {
+            options.signal.addEventListener("abort", () => listeners.splice(listeners.indexOf(entry), 1));
+        }
+    },
+};
+console.log = () => {};
+"""
+
+
+def _run_in_fake_dom(script, times=1):
+    """Evaluate script `times` times (a relink) and return what it left on the page"""
+    program = FAKE_DOM + (f"eval({json.dumps(script)});\n" * times) + """
+setTimeout(() => process.stdout.write(JSON.stringify({
+    listeners: listeners.map((entry) => entry.type),
+    head: head.map((el) => ({ id: el.id, css: el.textContent })),
+    initialized: window.MetaFlexSystem.initialized,
+})), 10);
+"""
+    result = subprocess.run(["node", "-e", program], capture_output=True, text=True, timeout=30)
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout)
+
+
+@pytest.fixture
+def dist(tmp_path, monkeypatch):
+    monkeypatch.setattr(static_assets, "DIST_DIR", str(tmp_path / "dist"))
+    monkeypatch.setattr(static_assets, "_built", {})
+    return tmp_path / "dist"
+
+
+def test_bundle_is_content_hashed_and_rebuilt_on_change(dist, tmp_path):
+    source = tmp_path / "brand.css"
+    source.write_text("/* brand */\n.a  {\n  color: red;\n}\n")
+    url = static_assets.asset_url(str(source))
+    assert url.startswith("app/static/dist/brand.") and url.endswith(".min.css")
+    assert (dist / os.path.basename(url)).read_text() == ".a{color: red}"
+    assert static_assets.asset_url(str(source)) == url
+
+    source.write_text(".a { color: blue; }")
+    os.utime(source, (0, os.path.getmtime(source) + 1))
+    assert static_assets.asset_url(str(source)) != url
+
+
+def test_missing_source_has_no_url(dist, tmp_path):
+    assert static_assets.asset_url(str(tmp_path / "missing.js")) is None
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node is not installed")
+def test_metaflex_js_only_registers_delegated_listeners():
+    with open(METAFLEX_JS, encoding="utf-8") as f:
+        script = static_assets.minify_js(f.read())
+
+    page = _run_in_fake_dom(script)
+    assert page["initialized"]
+    assert sorted(page["listeners"]) == ["click", "mousedown", "mouseout", "mouseover", "mouseup"]
+    assert [el["id"] for el in page["head"]] == ["metaflex-styles"]
+    assert "@keyframes" not in page["head"][0]["css"]
+
+    # A new version linked over the old one tears the old listeners down
+    relinked = _run_in_fake_dom(script, times=2)
+    assert sorted(relinked["listeners"]) == sorted(page["listeners"])
+    assert len(relinked["head"]) == 1